@@ -0,0 +1,205 @@
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from functools import partial
+from typing import Any, Callable, NamedTuple
+
+from benchmarks.corpus import CorpusConfig, generate_java_source
+from java_linter.linter import Linter, LinterOptions
+from java_linter.numpy_backend import HAS_NUMPY
+from java_linter.profiling import check_name
+from java_linter.shared import Check, ErrorEntry
+
+MODES = ("plain", "fused", "combined_spaces", "tokenized", "mmap", "numpy")
+
+# Режимы по умолчанию: numpy - только если он установлен
+DEFAULT_MODES = tuple(mode for mode in MODES if mode != "numpy" or HAS_NUMPY)
+
+
+class BenchmarkResult(NamedTuple):
+    """Результат замера одной функции на одном файле"""
+
+    name: str
+    lines: int
+    seconds: float
+    lines_per_second: float
+    peak_memory_mb: float | None
+
+
+def make_linter(mode: str) -> Linter:
+    """Создает Linter с базовым диалектом для режима из MODES"""
+
+    if mode in ("fused", "combined_spaces", "tokenized"):
+        return Linter.from_options(options=LinterOptions(**{mode: True}))
+
+    if mode == "numpy":
+        return Linter(numpy_backend=True)
+
+    return Linter()
+
+
+def discover_checks(linter: Linter) -> list[tuple[str, Callable[[list[str], str], Any]]]:
+    """
+    Возвращает проверки подлинтеров, которые запускает seek_for_errors, под их именами из --profile
+    (см. check_name). Проверки выдают ошибки лениво, поэтому каждая обернута так, чтобы выдать их все
+    """
+
+    checks: list[tuple[str, Callable[[list[str], str], Any]]] = []
+
+    for sub_linter in (linter._naming_linter, linter._empty_line_linter, linter._space_linter):
+        for check in sub_linter.get_checks():
+            checks.append((check_name(check), partial(_collect_errors, check)))
+
+    return checks
+
+
+def _collect_errors(check: Check, lines: list[str], filename: str) -> list[ErrorEntry]:
+    """Выполняет проверку целиком"""
+    return list(check(lines, filename))
+
+
+def measure(name: str, function: Callable[[], Any], lines: int, repeat: int, memory: bool) -> BenchmarkResult:
+    """Замеряет медианное время function за repeat запусков и, при memory=True, пиковую память отдельным запуском"""
+
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+
+    peak_memory_mb = None
+
+    if memory:
+        tracemalloc.start()
+        function()
+        peak_memory_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+
+    seconds = statistics.median(timings)
+
+    return BenchmarkResult(
+        name=name,
+        lines=lines,
+        seconds=seconds,
+        lines_per_second=lines / seconds if seconds else float("inf"),
+        peak_memory_mb=peak_memory_mb,
+    )
+
+
+def run_benchmarks(
+    configs: list[CorpusConfig], modes: list[str], repeat: int, with_checks: bool, memory: bool
+) -> list[BenchmarkResult]:
+    """Замеряет Linter.seek_for_errors во всех режимах и каждую проверку _check_* на файлах по configs"""
+
+    results = []
+
+    for config in configs:
+        lines = generate_java_source(config)
+        data = "".join(lines).encode("utf-8")
+        size = len(lines)
+
+        for mode in modes:
+            linter = make_linter(mode)
+
+            if mode == "mmap":
+                results.append(
+                    measure(
+                        f"mmap seek_for_errors_in_buffer[{size}]",
+                        lambda: linter.seek_for_errors_in_buffer(data, "Bench.java"),
+                        size,
+                        repeat,
+                        memory,
+                    )
+                )
+            else:
+                results.append(
+                    measure(
+                        f"{mode} seek_for_errors[{size}]",
+                        lambda: linter.seek_for_errors(lines, "Bench.java"),
+                        size,
+                        repeat,
+                        memory,
+                    )
+                )
+
+        if with_checks:
+            for name, check in discover_checks(make_linter("plain")):
+                results.append(measure(f"{name}[{size}]", lambda: check(lines, "Bench.java"), size, repeat, memory))
+
+    return results
+
+
+def print_results(results: list[BenchmarkResult]) -> None:
+    """Печатает результаты таблицей"""
+
+    width = max(len(result.name) for result in results)
+    print(f"{'Замер':<{width}}  {'Строк':>8}  {'Время, с':>10}  {'Строк/с':>12}  {'Память, МБ':>10}")
+
+    for result in results:
+        memory = f"{result.peak_memory_mb:.2f}" if result.peak_memory_mb is not None else "-"
+        print(
+            f"{result.name:<{width}}  {result.lines:>8}  {result.seconds:>10.4f}  "
+            f"{result.lines_per_second:>12.0f}  {memory:>10}"
+        )
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    """Разбирает аргументы командной строки"""
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_linter")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="размеры файлов в строках через запятую")
+    parser.add_argument("--depth", type=int, default=2, help="глубина вложенности классов")
+    parser.add_argument("--methods", type=int, default=8, help="методов в классе")
+    parser.add_argument("--line-length", type=int, default=60, help="длина строк с инструкциями")
+    parser.add_argument("--density", type=float, default=0.05, help="доля строк с ошибками")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--modes", default=",".join(DEFAULT_MODES), help="режимы Linter'а через запятую")
+    parser.add_argument("--no-checks", action="store_true", help="не замерять отдельные проверки _check_*")
+    parser.add_argument("--no-memory", action="store_true", help="не замерять пиковую память")
+    parser.add_argument("--json", default=None, help="файл, в который записать результаты")
+
+    return parser.parse_args(argv)
+
+
+def main() -> None:
+    """Запускает бенчмарки с параметрами командной строки"""
+
+    args = _parse_args(sys.argv[1:])
+    modes = args.modes.split(",")
+
+    for mode in modes:
+        if mode not in MODES:
+            print(f"Неизвестный режим: {mode}")
+            sys.exit(1)
+
+        if mode == "numpy" and not HAS_NUMPY:
+            print("Для режима numpy нужен пакет numpy: pip install numpy")
+            sys.exit(1)
+
+    configs = [
+        CorpusConfig(
+            lines=int(size),
+            nesting_depth=args.depth,
+            methods_per_class=args.methods,
+            line_length=args.line_length,
+            violation_density=args.density,
+            seed=args.seed,
+        )
+        for size in args.sizes.split(",")
+    ]
+
+    results = run_benchmarks(configs, modes, args.repeat, not args.no_checks, not args.no_memory)
+    print_results(results)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump([result._asdict() for result in results], f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
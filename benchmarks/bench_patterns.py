@@ -0,0 +1,211 @@
+import argparse
+import json
+import random
+import re
+import statistics
+import sys
+import time
+from typing import Callable, NamedTuple
+
+from java_linter.shared import JavaPatterns, VarMatch
+
+# Выражения JavaPatterns до перехода на линейное сопоставление: эталон для сравнения совпадений.
+# На строках из ADVERSARIAL_LINES VAR_PATTERN и METHOD_PATTERN работают экспоненциально или квадратично долго
+LEGACY_PATTERNS: dict[str, re.Pattern[str]] = {
+    "CLASS_PATTERN": re.compile(
+        r"""
+        ^\s*
+        (?:(?:public|private|protected|static|final|synchronized|abstract|default)\s+)*
+        (?:class|interface|enum)\s+([A-Za-z_]\w*)
+        """,
+        re.VERBOSE,
+    ),
+    "VAR_PATTERN": re.compile(
+        r"""
+        ^\s*
+        (?:(?:public|private|protected|static|final|synchronized|abstract|default|volatile)\s+)*
+        (
+            (?!public|private|protected|static|final|synchronized|abstract|default|volatile)
+            \w+
+            (?:\s*<.+>)*
+            (?:\s*\[.*])*
+        )
+        \s+
+        \b([a-zA-Z_]\w*)\b
+        \s*
+        (?!\()
+        """,
+        re.VERBOSE,
+    ),
+    "METHOD_PATTERN": re.compile(
+        r"""
+        ^\s*
+        (?:(?:public|private|protected|static|final|synchronized|abstract|default)\s+)*
+        (
+            (?!public|private|protected|static|final|synchronized|abstract|default)
+            \w+
+            (?:\s*<[^>]+>)?
+            (?:\s*\[\s*\])*
+            \s*
+        )
+        \s+
+        ([a-zA-Z_]\w*)
+        \s*
+        \(
+        [^)]*
+        \)
+        \s*
+        (?:throws\s+[\w\s,]+)?
+        \s*
+        """,
+        re.VERBOSE,
+    ),
+}
+
+# Семейства строк, на которых выражения с возвратами работают долго; аргумент - число повторов фрагмента
+ADVERSARIAL_LINES: dict[str, Callable[[int], str]] = {
+    "generics": lambda n: "Foo" + "<a>" * n + "(\n",
+    "nested_generics": lambda n: "    private Map<" + "List<" * n + "String" + ">" * n + " x(\n",
+    "arrays": lambda n: "int" + "[]" * n + "(\n",
+    "generic_arrays": lambda n: "T" + "<a>[]" * n + "(\n",
+    "spaced_arrays": lambda n: "int" + " [ ]" * n + " x(\n",
+    "method_spaces": lambda n: "int" + " " * n + "x(" + "a" * n + "\n",
+    "modifiers": lambda n: "public static " * n + "(\n",
+}
+
+_FUZZ_TOKENS = (
+    "public |static |volatile |class |int|Foo|x|_y1|ф|<|>|<a>|[|]|[]|(|)| |  |\t|,|=|;|{|}|.|throws |1".split("|")
+)
+
+
+class PatternResult(NamedTuple):
+    """Время сопоставления всех выражений JavaPatterns с одной строкой семейства"""
+
+    family: str
+    length: int
+    seconds: float
+    chars_per_second: float
+
+
+def random_line(rnd: random.Random, max_tokens: int = 14) -> str:
+    """Случайная короткая строка из фрагментов java-объявлений, на которой эталонные выражения работают быстро"""
+
+    line = "".join(rnd.choice(_FUZZ_TOKENS) for _ in range(rnd.randint(1, max_tokens)))
+
+    return line + "\n" if rnd.random() < 0.5 else line
+
+
+def match_key(match: re.Match[str] | VarMatch | None) -> tuple[tuple[int, int], ...] | None:
+    """Границы совпадения и всех его групп: совпадения с одинаковым ключом для линтера неразличимы"""
+    return None if match is None else tuple(match.span(group) for group in range(len(match.groups()) + 1))
+
+
+def find_mismatches(lines: list[str]) -> list[tuple[str, str]]:
+    """Возвращает пары (имя выражения, строка), на которых JavaPatterns и LEGACY_PATTERNS совпадают по-разному"""
+
+    mismatches = []
+
+    for line in lines:
+        for name, legacy in LEGACY_PATTERNS.items():
+            pattern = getattr(JavaPatterns, name)
+
+            for method in ("match", "search"):
+                if match_key(getattr(pattern, method)(line)) != match_key(getattr(legacy, method)(line)):
+                    mismatches.append((name, line))
+                    break
+
+    return mismatches
+
+
+def measure_family(family: str, repeats: int, repeat: int) -> PatternResult:
+    """Замеряет медианное время сопоставления всех выражений JavaPatterns со строкой семейства family"""
+
+    line = ADVERSARIAL_LINES[family](repeats)
+    patterns = [getattr(JavaPatterns, name) for name in LEGACY_PATTERNS]
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+
+        for pattern in patterns:
+            pattern.search(line)
+
+        timings.append(time.perf_counter() - start)
+
+    seconds = statistics.median(timings)
+
+    return PatternResult(
+        family=family,
+        length=len(line),
+        seconds=seconds,
+        chars_per_second=len(line) / seconds if seconds else float("inf"),
+    )
+
+
+def print_results(results: list[PatternResult]) -> None:
+    """Печатает результаты таблицей; рост - во сколько раз время больше, чем на предыдущей длине того же семейства"""
+
+    width = max(len(result.family) for result in results)
+    print(f"{'Семейство':<{width}}  {'Длина':>8}  {'Время, с':>10}  {'Символов/с':>12}  {'Рост':>6}")
+
+    previous: dict[str, PatternResult] = {}
+
+    for result in results:
+        before = previous.get(result.family)
+        growth = f"{result.seconds / before.seconds:.1f}" if before and before.seconds else "-"
+        previous[result.family] = result
+
+        print(
+            f"{result.family:<{width}}  {result.length:>8}  {result.seconds:>10.5f}  "
+            f"{result.chars_per_second:>12.0f}  {growth:>6}"
+        )
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    """Разбирает аргументы командной строки"""
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_patterns")
+    parser.add_argument("--repeats", default="1000,10000,100000", help="числа повторов фрагмента через запятую")
+    parser.add_argument("--families", default=",".join(ADVERSARIAL_LINES), help="семейства строк через запятую")
+    parser.add_argument("--fuzz", type=int, default=100000, help="число случайных строк для сравнения с эталоном")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", default=None, help="файл, в который записать результаты")
+
+    return parser.parse_args(argv)
+
+
+def main() -> None:
+    """Сравнивает JavaPatterns с эталоном на случайных строках и замеряет их на строках ADVERSARIAL_LINES"""
+
+    args = _parse_args(sys.argv[1:])
+    families = args.families.split(",")
+
+    for family in families:
+        if family not in ADVERSARIAL_LINES:
+            print(f"Неизвестное семейство: {family}")
+            sys.exit(1)
+
+    rnd = random.Random(args.seed)
+    mismatches = find_mismatches([random_line(rnd) for _ in range(args.fuzz)])
+
+    for name, line in mismatches[:10]:
+        print(f"Расхождение с эталоном: {name} {line!r}")
+
+    print(f"Случайных строк: {args.fuzz}, расхождений с эталоном: {len(mismatches)}")
+
+    results = [
+        measure_family(family, int(repeats), args.repeat) for family in families for repeats in args.repeats.split(",")
+    ]
+    print_results(results)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump([result._asdict() for result in results], f, ensure_ascii=False, indent=2)
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+import random
+from typing import NamedTuple
+
+
+class CorpusConfig(NamedTuple):
+    """
+    Параметры синтетического java-файла.
+    violation_density - доля строк, в которые вносится стилистическая ошибка
+    """
+
+    lines: int = 1000
+    nesting_depth: int = 2
+    methods_per_class: int = 8
+    line_length: int = 60
+    violation_density: float = 0.05
+    seed: int = 0
+
+
+_TYPES = ("int", "long", "double", "boolean", "String", "List<String>", "Map<String, Integer>")
+_WORDS = ("value", "count", "index", "result", "buffer", "item", "total", "offset", "name", "size", "node", "state")
+
+
+class CorpusGenerator:
+    """
+    Детерминированный генератор java-кода для бенчмарков: одинаковый CorpusConfig всегда дает одинаковый файл.
+    Файл состоит из классов с полями и методами, вложенных друг в друга до nesting_depth
+    """
+
+    def __init__(self, config: CorpusConfig):
+        self._config = config
+        self._random = random.Random(config.seed)
+        self._lines: list[str] = []
+        self._counter = 0
+
+    def generate(self) -> list[str]:
+        """Возвращает строки файла (с переводами строк) длиной не меньше config.lines"""
+
+        self._lines = ["package bench.generated;\n", "\n", "import java.util.List;\n", "import java.util.Map;\n", "\n"]
+
+        while len(self._lines) < self._config.lines:
+            self._write_class(depth=0)
+            self._lines.append("\n")
+
+        return self._lines
+
+    def _write_class(self, depth: int) -> None:
+        """Пишет класс, его поля, методы и вложенные классы"""
+
+        indent = "    " * depth
+        name = self._name(capital=True)
+
+        if self._is_violation():
+            name = self._snake(name)
+
+        self._lines.append(f"{indent}public class {name} {{\n")
+        self._lines.append("\n")
+
+        for _ in range(self._random.randint(1, 4)):
+            self._lines.append(self._statement(indent + "    ", declaration=True))
+
+        self._lines.append("\n")
+
+        for method in range(self._config.methods_per_class):
+            if len(self._lines) >= self._config.lines:
+                break
+
+            self._write_method(indent + "    ")
+
+            if depth + 1 < self._config.nesting_depth and method == self._config.methods_per_class // 2:
+                self._write_class(depth + 1)
+                self._lines.append("\n")
+
+        self._lines.append(f"{indent}}}\n")
+
+    def _write_method(self, indent: str) -> None:
+        """Пишет метод с телом из нескольких инструкций и блоков if/for"""
+
+        name = self._name(capital=False)
+
+        if self._is_violation():
+            name = name[0].upper() + name[1:]
+
+        parameters = ", ".join(f"{self._random.choice(_TYPES[:4])} {self._name(capital=False)}" for _ in range(2))
+
+        if self._is_violation():
+            parameters = parameters.replace(", ", ",")
+
+        self._lines.append(f"{indent}public {self._random.choice(_TYPES)} {name}({parameters}) {{\n")
+
+        body_indent = indent + "    "
+
+        for _ in range(self._random.randint(3, 12)):
+            if self._random.random() < 0.2:
+                self._lines.append(f"{body_indent}if ({self._name(capital=False)} > 0) {{\n")
+                self._lines.append(self._statement(body_indent + "    ", declaration=False))
+                self._lines.append(f"{body_indent}}}\n")
+            else:
+                self._lines.append(self._statement(body_indent, declaration=self._random.random() < 0.5))
+
+        self._lines.append(f"{body_indent}return {self._name(capital=False)};\n")
+        self._lines.append(f"{indent}}}\n")
+
+        blank_lines = 2 if self._is_violation() else 1
+        self._lines.extend("\n" for _ in range(blank_lines))
+
+    def _statement(self, indent: str, declaration: bool) -> str:
+        """Возвращает строку с объявлением переменной или присваиванием длиной около config.line_length"""
+
+        target = self._name(capital=False)
+
+        if declaration:
+            if self._is_violation():
+                target = self._snake(target)
+
+            target = f"{self._random.choice(_TYPES[:4])} {target}"
+
+        expression = self._name(capital=False)
+
+        while len(indent) + len(target) + len(expression) + 4 < self._config.line_length:
+            operator = self._random.choice(("+", "-", "*"))
+            expression += f" {operator} {self._name(capital=False)}"
+
+        statement = f"{indent}{target} = {expression};\n"
+
+        if self._is_violation():
+            statement = self._break_spaces(statement)
+
+        return statement
+
+    def _break_spaces(self, statement: str) -> str:
+        """Вносит в строку одну ошибку пробелов"""
+
+        kind = self._random.randrange(4)
+
+        if kind == 0:
+            return statement.replace(" = ", "=", 1)
+
+        if kind == 1:
+            return statement.replace(";", " ;", 1)
+
+        if kind == 2:
+            return statement.replace(" + ", "  +  ", 1) if " + " in statement else statement.replace(" = ", " =  ", 1)
+
+        return statement.replace(" = ", " = ( ", 1).replace(";", " );", 1)
+
+    def _name(self, capital: bool) -> str:
+        """Возвращает уникальное имя в camelCase"""
+
+        self._counter += 1
+        first, second = self._random.choice(_WORDS), self._random.choice(_WORDS)
+        name = f"{first}{second.capitalize()}{self._counter}"
+
+        return name.capitalize() if capital else name
+
+    def _snake(self, name: str) -> str:
+        """Переводит имя в snake_case"""
+        return "".join("_" + char.lower() if char.isupper() else char for char in name).lstrip("_")
+
+    def _is_violation(self) -> bool:
+        return self._random.random() < self._config.violation_density
+
+
+def generate_java_source(config: CorpusConfig) -> list[str]:
+    """Генерирует строки синтетического java-файла по config"""
+    return CorpusGenerator(config).generate()
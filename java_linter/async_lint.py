@@ -0,0 +1,177 @@
+import asyncio
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import AsyncGenerator, Awaitable, Iterable, Iterator, NamedTuple, TypeVar
+
+from java_linter.discovery import iter_java_files
+from java_linter.linter import LinterOptions, load_linter
+from java_linter.shared import ErrorEntry
+
+# Сколько прочитанных, но еще не проверенных файлов (и готовых, но не забранных результатов) держит конвейер
+DEFAULT_QUEUE_SIZE = 16
+
+# Сколько файлов читается одновременно
+DEFAULT_READERS = 2
+
+_T = TypeVar("_T")
+
+
+class FileResult(NamedTuple):
+    """Ошибки одного файла"""
+
+    filename: str
+    errors: list[ErrorEntry]
+
+
+async def lint_paths(
+    paths: Iterable[str],
+    dialect_filename: str = "",
+    *,
+    excludes: Iterable[str] = (),
+    linter_options: LinterOptions = LinterOptions(),
+    max_errors: int | None = None,
+    executor: Executor | None = None,
+    jobs: int | None = None,
+    readers: int = DEFAULT_READERS,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+) -> dict[str, list[ErrorEntry]]:
+    """
+    Асинхронно линтит файлы и папки paths (см. iter_lint_paths) и возвращает ошибки по именам файлов
+    в порядке окончания их проверки
+    """
+
+    return {
+        result.filename: result.errors
+        async for result in iter_lint_paths(
+            paths,
+            dialect_filename,
+            excludes=excludes,
+            linter_options=linter_options,
+            max_errors=max_errors,
+            executor=executor,
+            jobs=jobs,
+            readers=readers,
+            queue_size=queue_size,
+        )
+    }
+
+
+async def iter_lint_paths(
+    paths: Iterable[str],
+    dialect_filename: str = "",
+    *,
+    excludes: Iterable[str] = (),
+    linter_options: LinterOptions = LinterOptions(),
+    max_errors: int | None = None,
+    executor: Executor | None = None,
+    jobs: int | None = None,
+    readers: int = DEFAULT_READERS,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+) -> AsyncGenerator[FileResult, None]:
+    """
+    Линтит файлы и папки paths, не блокируя цикл событий, и выдает результаты по мере готовности.
+    Конвейер из трех стадий, связанных очередями на queue_size элементов:
+    обход папок (iter_java_files) и чтение файлов (readers задач) идут в потоках по умолчанию, а проверка
+    (jobs задач, по умолчанию по числу процессоров) - в executor. Без executor создается свой ThreadPoolExecutor
+    на jobs потоков, чтобы проверка не делила пул потоков цикла событий с чтением файлов.
+    Чтение следующих файлов идет одновременно с проверкой предыдущих, а полные очереди приостанавливают
+    предыдущие стадии, так что медленный потребитель не накапливает прочитанные файлы в памяти.
+    Linter берется из load_linter(dialect_filename, linter_options) в том потоке или процессе, где идет
+    проверка, поэтому подходит и ProcessPoolExecutor.
+    Ошибка любой стадии (например, FileNotFoundError при чтении) останавливает конвейер и пробрасывается.
+    При отмене или прерванном обходе задачи конвейера отменяются; уже начатая в executor проверка файла
+    доводится до конца, но ее результат отбрасывается
+    """
+
+    jobs = jobs or os.cpu_count() or 1
+    loop = asyncio.get_running_loop()
+    own_executor = ThreadPoolExecutor(max_workers=jobs) if executor is None else None
+    lint_executor = own_executor or executor
+
+    filenames: asyncio.Queue[str | None] = asyncio.Queue(queue_size)
+    read_files: asyncio.Queue[tuple[str, list[str]] | None] = asyncio.Queue(queue_size)
+    results: asyncio.Queue[FileResult | Exception | None] = asyncio.Queue(queue_size)
+
+    async def discover() -> None:
+        files = iter_java_files(paths, excludes)
+
+        # Генератор обходит папки блокирующими вызовами, поэтому каждый следующий файл берется в потоке
+        while (filename := await asyncio.to_thread(next, files, None)) is not None:
+            await filenames.put(filename)
+
+        for _ in range(readers):
+            await filenames.put(None)
+
+    async def read() -> None:
+        while (filename := await filenames.get()) is not None:
+            await read_files.put((filename, await asyncio.to_thread(_read_lines, filename)))
+
+    async def lint() -> None:
+        while (item := await read_files.get()) is not None:
+            filename, lines = item
+            errors = await loop.run_in_executor(
+                lint_executor, partial(_lint_lines, dialect_filename, linter_options, lines, filename, max_errors)
+            )
+            await results.put(FileResult(filename, errors))
+
+    async def read_all() -> None:
+        await _gather_all(read() for _ in range(readers))
+
+        for _ in range(jobs):
+            await read_files.put(None)
+
+    async def lint_all() -> None:
+        await _gather_all(lint() for _ in range(jobs))
+        await results.put(None)
+
+    tasks = [asyncio.create_task(_forward_error(stage, results)) for stage in (discover(), read_all(), lint_all())]
+
+    try:
+        while (result := await results.get()) is not None:
+            if isinstance(result, Exception):
+                raise result
+
+            yield result
+    finally:
+        for task in tasks:
+            task.cancel()
+
+        # Начатые проверки доводятся до конца в потоках пула, не задерживая потребителя
+        if own_executor is not None:
+            own_executor.shutdown(wait=False, cancel_futures=True)
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _gather_all(coroutines: Iterator[Awaitable[_T]]) -> list[_T]:
+    """asyncio.gather, который при ошибке или отмене отменяет и остальные задачи"""
+
+    tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+
+    try:
+        return await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def _forward_error(stage: Awaitable[None], results: asyncio.Queue[FileResult | Exception | None]) -> None:
+    """Передает ошибку стадии конвейера в очередь результатов, где ее пробросит iter_lint_paths"""
+
+    try:
+        await stage
+    except Exception as e:
+        await results.put(e)
+
+
+def _read_lines(filename: str) -> list[str]:
+    with open(filename, "r") as f:
+        return f.readlines()
+
+
+def _lint_lines(
+    dialect_filename: str, options: LinterOptions, lines: list[str], filename: str, max_errors: int | None
+) -> list[ErrorEntry]:
+    """Проверка одного файла в executor; функция уровня модуля, чтобы ее можно было передать в другой процесс"""
+    return load_linter(dialect_filename, options).seek_for_errors(lines, filename, max_errors)
@@ -0,0 +1,163 @@
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+from typing import Any
+
+from java_linter import __version__
+from java_linter.daemon_client import DEFAULT_SOCKET
+from java_linter.linter import LinterOptions, load_linter
+from java_linter.shared import ErrorEntry, split_lines
+
+# Опции Linter'а, которые клиент может передать в запросе
+LINTER_OPTIONS = ("fused", "combined_spaces", "tokenized")
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Обрабатывает запросы одного соединения: по одной строке json на запрос и на ответ"""
+
+    server: "LintDaemon"
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                response = self.server.process(json.loads(line))
+            except Exception as e:
+                response = {"error": f"{type(e).__name__}: {e}"}
+
+            try:
+                self.wfile.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+                self.wfile.flush()
+            except OSError:
+                return
+
+
+class LintDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Долгоживущий сервер линтера на Unix-сокете. Linter для каждого диалекта и набора опций собирается один раз
+    (см. load_linter), поэтому запрос не тратит время на запуск интерпретатора, импорты и разбор диалекта.
+    Запросы:
+      {"command": "lint", "filename": ..., "cwd": ..., "dialect": ..., "options": {...}, "content": ...}
+        -> {"errors": [{"file_name": ..., "line": ..., "column": ..., "message": ...}, ...]};
+        без content читается файл filename относительно cwd
+      {"command": "ping"} -> {"version": ...}
+      {"command": "shutdown"} -> {}
+    При ошибке в ответе только поле "error"
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET):
+        _remove_stale_socket(socket_path)
+
+        # Сокет создается доступным только владельцу
+        old_umask = os.umask(0o177)
+
+        try:
+            super().__init__(socket_path, _RequestHandler)
+        finally:
+            os.umask(old_umask)
+
+        self.socket_path = socket_path
+
+    def process(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Выполняет один запрос и возвращает ответ"""
+
+        command = request.get("command", "lint")
+
+        if command == "ping":
+            return {"version": __version__}
+
+        if command == "shutdown":
+            # shutdown ждет выхода из serve_forever, поэтому вызывается не из потока обработчика
+            threading.Thread(target=self.shutdown).start()
+            return {}
+
+        if command != "lint":
+            return {"error": f"Неизвестная команда: {command}"}
+
+        return {
+            "errors": [
+                {"file_name": error.file_name, "line": error.line, "column": error.column, "message": error.message}
+                for error in self._lint(request)
+            ]
+        }
+
+    def server_close(self) -> None:
+        super().server_close()
+
+        try:
+            os.unlink(self.socket_path)
+        except OSError:
+            pass
+
+    def _lint(self, request: dict[str, Any]) -> list[ErrorEntry]:
+        """Ищет ошибки в файле или тексте из запроса"""
+
+        options = request.get("options", {})
+
+        for option in options:
+            if option not in LINTER_OPTIONS:
+                raise ValueError(f"Неизвестная опция: {option}")
+
+        cwd = request.get("cwd", "")
+        dialect = request.get("dialect", "")
+        filename = request["filename"]
+
+        linter = load_linter(os.path.join(cwd, dialect) if dialect else "", LinterOptions(**options))
+
+        content = request.get("content")
+
+        if content is None:
+            with open(os.path.join(cwd, filename), "r") as f:
+                lines = f.readlines()
+        else:
+            lines = split_lines(content)
+
+        return linter.seek_for_errors(lines, filename)
+
+
+def _remove_stale_socket(socket_path: str) -> None:
+    """Удаляет сокет, оставшийся от упавшего демона; если демон на нем отвечает, сообщает об этом"""
+
+    if not os.path.exists(socket_path):
+        return
+
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    try:
+        probe.connect(socket_path)
+    except OSError:
+        os.unlink(socket_path)
+        return
+    finally:
+        probe.close()
+
+    raise OSError(f"Демон уже запущен: {socket_path}")
+
+
+def main() -> None:
+    """Запускает демон и обслуживает запросы до команды shutdown или Ctrl+C"""
+
+    parser = argparse.ArgumentParser(prog="python -m java_linter.daemon")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET)
+    args = parser.parse_args(sys.argv[1:])
+
+    try:
+        server = LintDaemon(args.socket)
+    except OSError as e:
+        print(e)
+        sys.exit(1)
+
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
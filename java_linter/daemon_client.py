@@ -0,0 +1,183 @@
+import argparse
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any
+
+# Модуль импортирует только стандартную библиотеку, чтобы запуск клиента не тратил время на загрузку линтера
+
+DEFAULT_SOCKET = os.path.join(tempfile.gettempdir(), f"java_linter-{os.getuid()}.sock")
+
+_SPAWN_TIMEOUT = 10.0
+
+
+class DaemonError(Exception):
+    """Ошибка, которую вернул демон, или невозможность до него достучаться"""
+
+
+class DaemonClient:
+    """
+    Тонкий клиент демона линтера (см. java_linter.daemon). Одно соединение используется для нескольких запросов.
+    Ошибки возвращаются словарями с полями ErrorEntry
+    """
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET, timeout: float = 30.0):
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+
+        try:
+            self._socket.connect(socket_path)
+        except OSError as e:
+            self._socket.close()
+            raise DaemonError(f"Не удалось подключиться к демону {socket_path}: {e}") from e
+
+        self._file = self._socket.makefile("rwb")
+
+    def lint(
+        self, filename: str, content: str | None = None, dialect: str = "", **options: bool
+    ) -> list[dict[str, Any]]:
+        """
+        Ищет ошибки в файле filename или, если передан content, в этом тексте с именем filename.
+        Пути передаются демону вместе с текущей папкой клиента
+        """
+
+        request: dict[str, Any] = {
+            "command": "lint",
+            "cwd": os.getcwd(),
+            "filename": filename,
+            "dialect": dialect,
+            "options": options,
+        }
+
+        if content is not None:
+            request["content"] = content
+
+        errors: list[dict[str, Any]] = self._request(request)["errors"]
+        return errors
+
+    def ping(self) -> str:
+        """Проверяет, что демон отвечает, и возвращает его версию"""
+        version: str = self._request({"command": "ping"})["version"]
+        return version
+
+    def shutdown(self) -> None:
+        """Останавливает демон"""
+        self._request({"command": "shutdown"})
+
+    def close(self) -> None:
+        self._file.close()
+        self._socket.close()
+
+    def __enter__(self) -> "DaemonClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _request(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Отправляет запрос одной строкой json и читает ответ такой же строкой"""
+
+        try:
+            self._file.write(json.dumps(request, ensure_ascii=False).encode("utf-8") + b"\n")
+            self._file.flush()
+            line = self._file.readline()
+        except OSError as e:
+            raise DaemonError(f"Ошибка связи с демоном: {e}") from e
+
+        if not line:
+            raise DaemonError("Демон закрыл соединение")
+
+        response: dict[str, Any] = json.loads(line)
+
+        if "error" in response:
+            raise DaemonError(response["error"])
+
+        return response
+
+
+def connect(socket_path: str = DEFAULT_SOCKET, spawn: bool = False) -> DaemonClient:
+    """Подключается к демону; при spawn=True запускает его в фоне, если он еще не запущен"""
+
+    try:
+        return DaemonClient(socket_path)
+    except DaemonError:
+        if not spawn:
+            raise
+
+    subprocess.Popen(
+        [sys.executable, "-m", "java_linter.daemon", "--socket", socket_path],
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    deadline = time.monotonic() + _SPAWN_TIMEOUT
+
+    while True:
+        try:
+            return DaemonClient(socket_path)
+        except DaemonError:
+            if time.monotonic() > deadline:
+                raise
+
+            time.sleep(0.05)
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    """Разбирает аргументы командной строки"""
+
+    parser = argparse.ArgumentParser(prog="python -m java_linter.daemon_client")
+    parser.add_argument("dialect")
+    parser.add_argument("files", nargs="*")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET)
+    parser.add_argument("--spawn", action="store_true", help="запустить демон, если он не запущен")
+    parser.add_argument("--stdin", metavar="FILENAME", default=None, help="проверить текст из stdin с этим именем")
+    parser.add_argument("--fused", action="store_true")
+    parser.add_argument("--combined-spaces", action="store_true")
+    parser.add_argument("--tokenized", action="store_true")
+    parser.add_argument("--shutdown", action="store_true", help="остановить демон")
+
+    return parser.parse_args(argv)
+
+
+def main() -> None:
+    """Отправляет файлы демону и печатает ошибки в том же виде, что и main.py"""
+
+    args = _parse_args(sys.argv[1:])
+    options = {"fused": args.fused, "combined_spaces": args.combined_spaces, "tokenized": args.tokenized}
+    dialect = os.path.abspath(args.dialect) if args.dialect else ""
+
+    try:
+        with connect(args.socket, args.spawn) as client:
+            if args.shutdown:
+                client.shutdown()
+                return
+
+            inputs: list[tuple[str, str | None]] = [(filename, None) for filename in args.files]
+
+            if args.stdin:
+                inputs.append((args.stdin, sys.stdin.read()))
+
+            for filename, content in inputs:
+                errors = client.lint(filename, content, dialect, **options)
+
+                if errors:
+                    print(f"Ошибки в файле: {filename}")
+                    for error in errors:
+                        print(f"  Строка: {error['line']}, Столбец: {error['column']}, Проблема: {error['message']}")
+                    print("-" * 20)
+                else:
+                    print(f"Проблем не найдено в файле: {filename}")
+    except DaemonError as e:
+        print(e)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
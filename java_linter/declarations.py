@@ -0,0 +1,134 @@
+from enum import Enum
+from typing import NamedTuple
+
+from java_linter.line_classes import BRACE_LINES, CLASS_HEADER_LINES, METHOD_HEADER_LINES, ClassifiedLines, LineFlag
+from java_linter.shared import JavaPatterns
+
+_BRACE = LineFlag.BRACE.value
+
+
+class DeclarationKind(Enum):
+    """Вид объявления"""
+
+    CLASS = "class"
+    METHOD = "method"
+
+
+class Declaration(NamedTuple):
+    """
+    Объявление класса или метода: заголовок - строка, совпавшая с CLASS_PATTERN или METHOD_PATTERN.
+    Конец тела - первая строка, после которой суммарная глубина фигурных скобок становится меньше, чем после строки
+    заголовка (None, если такой нет). У метода он считается, только если тело открывается на строке заголовка
+    """
+
+    kind: DeclarationKind
+    name: str
+    # Столбец имени, с 1
+    column: int
+    # Индексы строк, с 0
+    header: int
+    body_start: int | None
+    body_end: int | None
+
+
+class DeclarationIndex(NamedTuple):
+    """Объявления файла по неубыванию строки заголовка"""
+
+    classes: list[Declaration]
+    methods: list[Declaration]
+
+    def of_kind(self, kind: DeclarationKind) -> list[Declaration]:
+        return self.classes if kind == DeclarationKind.CLASS else self.methods
+
+
+def build_declaration_index(lines: ClassifiedLines) -> DeclarationIndex:
+    """
+    Находит объявления классов и методов в классифицированных строках. Выражения проверяются только на строках,
+    которые могут быть заголовками (см. CLASS_HEADER_LINES и METHOD_HEADER_LINES), а глубина скобок пересчитывается
+    только на строках со скобками
+    """
+
+    class_matches = [
+        (i, match) for i in lines.indexes(CLASS_HEADER_LINES) if (match := JavaPatterns.CLASS_PATTERN.match(lines[i]))
+    ]
+    method_matches = [
+        (i, match) for i in lines.indexes(METHOD_HEADER_LINES) if (match := JavaPatterns.METHOD_PATTERN.match(lines[i]))
+    ]
+
+    opened = {i for i, _ in class_matches} | {i for i, _ in method_matches if "{" in lines[i]}
+    ends = _block_ends(lines, opened)
+
+    return DeclarationIndex(
+        classes=[
+            Declaration(
+                kind=DeclarationKind.CLASS,
+                name=match.group(1),
+                column=match.start(1) + 1,
+                header=i,
+                body_start=i if "{" in lines[i] else None,
+                body_end=ends.get(i),
+            )
+            for i, match in class_matches
+        ],
+        methods=[
+            Declaration(
+                kind=DeclarationKind.METHOD,
+                name=match.group(2),
+                column=match.start(2) + 1,
+                header=i,
+                body_start=i if "{" in lines[i] else None,
+                body_end=ends.get(i) if "{" in lines[i] else None,
+            )
+            for i, match in method_matches
+        ],
+    )
+
+
+def _block_ends(lines: ClassifiedLines, opened: set[int]) -> dict[int, int]:
+    """
+    Для каждой строки из opened находит конец ее блока (см. Declaration). Глубина меняется только на строках со
+    скобками, поэтому обходятся только они и строки из opened; глубина берется из lines.depths, если она посчитана.
+    Незакрытые строки хранятся в стеке с неубывающей глубиной, поэтому каждая из них снимается со стека ровно
+    один раз
+    """
+
+    ends = {}
+    open_lines: list[tuple[int, int]] = []
+    depths = lines.depths
+    depth = 0
+
+    for i in sorted(opened.union(lines.indexes(BRACE_LINES))):
+        if lines.flags[i] & _BRACE:
+            if depths is not None:
+                depth = depths[i]
+            else:
+                line = lines[i]
+                depth += line.count("{") - line.count("}")
+
+            while open_lines and open_lines[-1][0] > depth:
+                ends[open_lines.pop()[1]] = i
+
+        if i in opened:
+            open_lines.append((depth, i))
+
+    return ends
+
+
+def declaration_index(lines: list[str]) -> DeclarationIndex | None:
+    """
+    Возвращает индекс объявлений lines или None, если строки не классифицированы. Индекс запоминается в самих
+    ClassifiedLines, поэтому NamingLinter и EmptyLineLinter строят его один раз на файл, а у Linter'а нет состояния
+    текущего файла, которое смешивалось бы при проверке нескольких файлов в разных потоках. Индекс строится только
+    по ClassifiedLines: они не меняются после создания, а ленивые обходы без классификации не должны читать весь
+    файл сразу
+    """
+
+    if not isinstance(lines, ClassifiedLines):
+        return None
+
+    index = lines.declarations
+
+    if index is None:
+        index = lines.declarations = build_declaration_index(lines)
+
+    return index
@@ -0,0 +1,215 @@
+import os
+import re
+from typing import Callable, Iterable, Iterator, NamedTuple
+
+# Папки сборки и служебные папки, которые не обходятся, если .gitignore явно не вернет их через '!'
+DEFAULT_EXCLUDES = ("target/", "build/", ".git/", ".java_linter_cache/")
+
+JAVA_EXTENSION = ".java"
+
+
+class IgnoreRule(NamedTuple):
+    """Правило в формате .gitignore, которое проверяется для путей относительно папки base"""
+
+    base: str
+    pattern: re.Pattern[str]
+    negated: bool
+    dir_only: bool
+
+
+def compile_ignore_rule(line: str, base: str) -> IgnoreRule | None:
+    """Разбирает строку .gitignore; для пустых строк и комментариев возвращает None"""
+
+    line = line.rstrip("\r\n")
+
+    if line.endswith("\\ "):
+        line = line.rstrip(" ") + " "
+    else:
+        line = line.rstrip(" ")
+
+    if not line or line.startswith("#"):
+        return None
+
+    negated = line.startswith("!")
+    if negated:
+        line = line[1:]
+
+    line = line.removeprefix("\\")
+
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+
+    if not line:
+        return None
+
+    anchored = "/" in line
+    line = line.lstrip("/")
+
+    regex = _translate(line)
+    if not anchored:
+        regex = "(?:.*/)?" + regex
+
+    return IgnoreRule(base=base, pattern=re.compile(regex + r"\Z", re.DOTALL), negated=negated, dir_only=dir_only)
+
+
+def _translate(pattern: str) -> str:
+    """Переводит glob из .gitignore в регулярное выражение; '*' и '?' не проходят через '/', '**' проходит"""
+
+    parts = []
+    i = 0
+
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == len(pattern):
+            parts.append("/.*")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        elif pattern[i] == "[" and "]" in pattern[i + 2 :]:
+            end = pattern.index("]", i + 2)
+            body = pattern[i + 1 : end]
+            parts.append("[" + ("^" + body[1:] if body[0] == "!" else body).replace("\\", "\\\\") + "]")
+            i = end + 1
+        elif pattern[i] == "\\" and i + 1 < len(pattern):
+            parts.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+
+    return "".join(parts)
+
+
+def is_ignored(path: str, is_dir: bool, rules: list[IgnoreRule]) -> bool:
+    """Проверяет путь по правилам; как и в git, решает последнее подошедшее правило"""
+
+    for rule in reversed(rules):
+        if rule.dir_only and not is_dir:
+            continue
+
+        if not path.startswith(rule.base + os.sep):
+            continue
+
+        relative = path[len(rule.base) + 1 :].replace(os.sep, "/")
+
+        if rule.pattern.match(relative):
+            return not rule.negated
+
+    return False
+
+
+def iter_java_files(
+    paths: Iterable[str], excludes: Iterable[str] = (), on_directory: Callable[[str], None] | None = None
+) -> Iterator[str]:
+    """
+    Выдает файлы для линтинга по мере обхода, не дожидаясь его конца.
+    Пути к файлам выдаются как есть, папки обходятся рекурсивно через os.scandir: из них берутся .java файлы,
+    которые не исключены DEFAULT_EXCLUDES, excludes и файлами .gitignore в обходимых папках.
+    on_directory вызывается для каждой обходимой папки перед чтением ее содержимого
+    """
+
+    excludes = tuple(excludes)
+
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+
+        root = os.path.normpath(path)
+        base = os.path.abspath(root)
+        rules = [rule for line in DEFAULT_EXCLUDES + excludes if (rule := compile_ignore_rule(line, base)) is not None]
+
+        yield from _walk(root, base, rules, on_directory)
+
+
+def filter_java_files(filenames: Iterable[str], excludes: Iterable[str] = ()) -> Iterator[str]:
+    """
+    Выдает .java файлы из filenames (например, измененные по git), которые не исключены DEFAULT_EXCLUDES и
+    excludes. Шаблоны проверяются для путей относительно текущей папки; исключенная папка исключает все свое
+    содержимое. Файлы .gitignore не читаются
+    """
+
+    base = os.path.abspath(".")
+    rules = [
+        rule for line in DEFAULT_EXCLUDES + tuple(excludes) if (rule := compile_ignore_rule(line, base)) is not None
+    ]
+
+    for filename in filenames:
+        if not filename.endswith(JAVA_EXTENSION):
+            continue
+
+        parts = os.path.relpath(os.path.abspath(filename), base).split(os.sep)
+        path = base
+
+        for i, part in enumerate(parts):
+            path = os.path.join(path, part)
+
+            if is_ignored(path, i < len(parts) - 1, rules):
+                break
+        else:
+            yield filename
+
+
+def _walk(
+    root: str, base: str, rules: list[IgnoreRule], on_directory: Callable[[str], None] | None = None
+) -> Iterator[str]:
+    """Обходит папку в глубину, подключая .gitignore каждой папки к правилам ее содержимого"""
+
+    stack = [(root, base, rules)]
+
+    while stack:
+        directory, absolute, directory_rules = stack.pop()
+
+        if on_directory:
+            on_directory(directory)
+
+        try:
+            with os.scandir(directory) as scanned:
+                entries = sorted(scanned, key=lambda entry: entry.name)
+        except OSError:
+            continue
+
+        if any(entry.name == ".gitignore" for entry in entries):
+            directory_rules = directory_rules + _read_gitignore(os.path.join(directory, ".gitignore"), absolute)
+
+        subdirectories = []
+
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+
+            if not is_dir and not entry.name.endswith(JAVA_EXTENSION):
+                continue
+
+            absolute_entry = os.path.join(absolute, entry.name)
+
+            if is_ignored(absolute_entry, is_dir, directory_rules):
+                continue
+
+            if is_dir:
+                subdirectories.append((entry.path, absolute_entry, directory_rules))
+            else:
+                yield entry.path
+
+        stack.extend(reversed(subdirectories))
+
+
+def _read_gitignore(filename: str, base: str) -> list[IgnoreRule]:
+    """Читает правила из .gitignore; нечитаемый файл не добавляет правил"""
+
+    try:
+        with open(filename, "r", encoding="utf-8", errors="replace") as f:
+            return [rule for line in f if (rule := compile_ignore_rule(line, base)) is not None]
+    except OSError:
+        return []
@@ -1,12 +1,54 @@
 import re
+from operator import attrgetter
+from typing import Iterable, Iterator, NamedTuple
 
+from java_linter.declarations import DeclarationIndex, declaration_index
 from java_linter.dialects import Dialect
-from java_linter.shared import ErrorEntry, JavaPatterns
+from java_linter.line_classes import ClassifiedLines, blank_lines
+from java_linter.messages import MessageCode
+from java_linter.shared import Check, ErrorEntry, JavaPatterns, iter_checks
+
+
+class StructureIndex(NamedTuple):
+    """
+    Структура файла для проверок пустых строк: номера строк с заголовками классов и методов,
+    конец блока для каждого заголовка с '{' и длина серии пустых строк, начинающейся с каждой строки
+    """
+
+    class_headers: list[int]
+    method_headers: list[int]
+    block_ends: dict[int, int]
+    blank_runs: list[int]
+
+
+class LineStructure(NamedTuple):
+    """
+    Все, от чего в одной строке зависят проверки пустых строк: пустая ли она, биты header_kind, число фигурных
+    скобок и есть ли в заголовке ';'. Правка, не меняющая LineStructure строк, не меняет и ошибки пустых строк
+    """
+
+    blank: bool
+    header_kind: int
+    opened: int
+    closed: int
+    terminated: bool
+
+    @property
+    def plain(self) -> bool:
+        """Непустая строка без скобок, не заголовок: от нее зависит только длина серий пустых строк рядом"""
+        return not (self.blank or self.header_kind or self.opened or self.closed)
+
+
+# Биты header_kind: строка - заголовок класса и/или метода
+CLASS_HEADER = 1
+METHOD_HEADER = 2
 
 
 class EmptyLineLinter:
     """Класс, ищущий синтаксические ошибки в .java файлах, связанные с количеством пустых строк подряд"""
 
+    _RETURN_PATTERN = re.compile(r"^\s*return")
+
     def __init__(self, dialect: Dialect):
         self._after_class = dialect.empty_lines.after_class
         self._after_method = dialect.empty_lines.after_method
@@ -14,145 +56,397 @@ class EmptyLineLinter:
 
     def seek_for_errors(self, lines: list[str], filename: str) -> list[ErrorEntry]:
         """Ищет ошибки в java файле и выдает их в виде списка ErrorEntry"""
-        errors = []
+        return list(self.iter_errors(lines, filename))
+
+    def iter_errors(self, lines: list[str], filename: str, ordered: bool = False) -> Iterator[ErrorEntry]:
+        """Лениво выдает ошибки в порядке seek_for_errors или, при ordered=True, по строкам и столбцам"""
+        return iter_checks(self.get_checks(ordered), lines, filename, ordered)
+
+    def get_checks(self, ordered: bool = False) -> tuple[Check, ...]:
+        """
+        Возвращает включенные в диалекте проверки в порядке их запуска.
+        Проверки после классов и методов объединены, чтобы строить StructureIndex один раз.
+        При ordered=True каждая проверка выдает ошибки по неубыванию строки
+        """
+
+        checks: list[Check] = []
 
         if self._max_empty:
-            errors.extend(self._check_consecutive_empty_lines(lines, filename))
+            checks.append(self._iter_consecutive_empty_lines)
 
-        if self._after_class:
-            errors.extend(self._check_empty_lines_after_class(lines, filename))
+        if self._after_class or self._after_method:
+            checks.append(
+                self._check_empty_lines_after_blocks_by_line if ordered else self._check_empty_lines_after_blocks
+            )
 
-        if self._after_method:
-            errors.extend(self._check_empty_lines_after_method(lines, filename))
+        return tuple(checks)
+
+    @property
+    def max_empty(self) -> int:
+        """Сколько пустых строк подряд допускается; 0 - проверка выключена"""
+        return self._max_empty
+
+    @property
+    def after_class(self) -> int:
+        """Сколько пустых строк нужно после класса; 0 - проверка выключена"""
+        return self._after_class
+
+    @property
+    def after_method(self) -> int:
+        """Сколько пустых строк нужно после метода; 0 - проверка выключена"""
+        return self._after_method
+
+    @property
+    def checks_blocks(self) -> bool:
+        """Включены ли проверки пустых строк после классов или методов"""
+        return bool(self._after_class or self._after_method)
+
+    def header_kind(self, line: str) -> int:
+        """Биты CLASS_HEADER/METHOD_HEADER строки для включенных в диалекте проверок после классов и методов"""
+        return self._header_kind(line, bool(self._after_class), bool(self._after_method)) if self.checks_blocks else 0
+
+    @staticmethod
+    def line_structure(line: str, header_kind: int) -> LineStructure:
+        """LineStructure строки с уже посчитанными битами header_kind"""
+        return LineStructure(
+            blank=line.strip() == "",
+            header_kind=header_kind,
+            opened=line.count("{"),
+            closed=line.count("}"),
+            terminated=bool(header_kind) and ";" in line,
+        )
+
+    def build_index(self, lines: list[str], header_kinds: Iterable[int] | None = None) -> StructureIndex | None:
+        """
+        StructureIndex для включенных проверок после классов и методов или None, если они выключены.
+        header_kinds - уже посчитанные header_kind строк
+        """
+
+        if not self.checks_blocks:
+            return None
+
+        return self._build_index(lines, bool(self._after_class), bool(self._after_method), header_kinds)
+
+    def block_errors(self, lines: list[str], filename: str, index: StructureIndex | None) -> list[ErrorEntry]:
+        """Ошибки всех проверок в порядке seek_for_errors по готовому индексу из build_index"""
+
+        errors: list[ErrorEntry] = []
+
+        if self._max_empty:
+            errors.extend(self._iter_consecutive_empty_lines(lines, filename))
+
+        if index is not None:
+            errors.extend(self._check_empty_lines_after_blocks(lines, filename, index))
 
         return errors
 
     def _check_consecutive_empty_lines(self, lines: list[str], filename: str) -> list[ErrorEntry]:
         """Проверяет, есть ли в поданных строках подряд идущие более чем n пустые строки."""
-        errors = []
+        return list(self._iter_consecutive_empty_lines(lines, filename))
+
+    def _iter_consecutive_empty_lines(self, lines: list[str], filename: str) -> Iterator[ErrorEntry]:
+        """Лениво выдает ошибки _check_consecutive_empty_lines"""
 
         count = 0
 
-        for i, line in enumerate(lines):
-            if line.strip() == "":
+        for i, blank in enumerate(blank_lines(lines)):
+            if blank:
                 count += 1
             else:
                 if count > self._max_empty:
-                    errors.append(
-                        ErrorEntry(
-                            file_name=filename,
-                            line=i,
-                            column=1,
-                            message=f"Обнаружено {count} последовательных пустых строк, "
-                            f"а должно быть не больше {self._max_empty}",
-                        )
-                    )
+                    yield self.consecutive_empty_lines_error(filename, i, count)
                 count = 0
 
         if count > self._max_empty:
-            errors.append(
-                ErrorEntry(
-                    file_name=filename,
-                    line=len(lines),
-                    column=1,
-                    message=f"Обнаружено {count} последовательных пустых строк, "
-                    f"а должно быть не больше {self._max_empty}",
-                )
+            yield self.consecutive_empty_lines_error(filename, len(lines), count)
+
+    def _check_empty_lines_after_blocks(
+        self, lines: list[str], filename: str, index: StructureIndex | None = None
+    ) -> list[ErrorEntry]:
+        """Выполняет включенные проверки пустых строк после классов и методов по одному StructureIndex"""
+
+        errors = []
+
+        if index is None:
+            index = self._build_index(
+                lines, with_classes=bool(self._after_class), with_methods=bool(self._after_method)
             )
 
+        if self._after_class:
+            errors.extend(self._check_empty_lines_after_class(lines, filename, index))
+
+        if self._after_method:
+            errors.extend(self._check_empty_lines_after_method(lines, filename, index))
+
         return errors
 
-    def _check_empty_lines_after_class(self, lines: list[str], filename: str) -> list[ErrorEntry]:
+    def _check_empty_lines_after_blocks_by_line(self, lines: list[str], filename: str) -> list[ErrorEntry]:
+        """
+        То же, что _check_empty_lines_after_blocks, но по неубыванию строки.
+        Концы вложенных блоков идут раньше внешних, поэтому ошибки сортируются; их не больше одной на блок
+        """
+        return sorted(self._check_empty_lines_after_blocks(lines, filename), key=attrgetter("line"))
+
+    def _check_empty_lines_after_class(
+        self, lines: list[str], filename: str, index: StructureIndex | None = None
+    ) -> list[ErrorEntry]:
         """Проверяет, стоит ли после каждого класса нужное кол-во пустых строк"""
 
+        if index is None:
+            index = self._build_index(lines, with_classes=True, with_methods=False)
+
         errors = []
 
         count = 0
 
-        for i, line in enumerate(lines):
+        for header in index.class_headers:
+            end = index.block_ends.get(header, 0)
 
-            if JavaPatterns.CLASS_PATTERN.match(line):
+            if not end:
+                continue
 
-                end = self._look_for_end(lines, i)
+            blanks = index.blank_runs[end + 1]
+            count += blanks
 
-                if not end:
-                    continue
+            if end + 1 + blanks < len(lines) and count != self._after_class:
+                errors.append(self.after_class_error(filename, end + 2, count))
+
+        return errors
+
+    def _check_empty_lines_after_method(
+        self, lines: list[str], filename: str, index: StructureIndex | None = None
+    ) -> list[ErrorEntry]:
+        """Проверяет, стоит ли после каждого метода нужное кол-во пустых строк"""
+
+        if index is None:
+            index = self._build_index(lines, with_classes=False, with_methods=True)
 
-                for j, line_2 in enumerate(lines[end + 1 :], start=end + 1):
+        errors = []
+
+        for header in index.method_headers:
+            end = self._method_end(lines, header, index)
 
-                    if line_2.strip() == "":
-                        count += 1
-                    else:
-                        if count != self._after_class:
-                            errors.append(
-                                ErrorEntry(
-                                    file_name=filename,
-                                    line=end + 2,
-                                    column=1,
-                                    message=f"Обнаружено {count} пустых строк после класса, "
-                                    f"а должно быть {self._after_class}",
-                                )
-                            )
+            if end is None:
+                continue
 
-                        break
+            count = index.blank_runs[end + 1]
+
+            if end + 1 + count < len(lines) and count != self._after_method:
+                errors.append(self.after_method_error(filename, end + 2, count))
 
         return errors
 
-    def _check_empty_lines_after_method(self, lines: list[str], filename: str) -> list[ErrorEntry]:
-        """Проверяет, стоит ли после каждого метода нужное кол-во пустых строк"""
-        errors = []
+    def _method_end(self, lines: list[str], header: int, index: StructureIndex) -> int | None:
+        """Возвращает строку, на которой кончается метод с заголовком header, или None для незакрытого метода"""
 
-        for i, line in enumerate(lines):
+        line = lines[header]
 
-            if JavaPatterns.METHOD_PATTERN.match(line) and not re.match(r"^\s*return", line):
+        if "{" in line and "}" in line:
+            return header
 
-                if "{" in line and "}" in line:
-                    end = i
+        if "{" in line:
+            return index.block_ends.get(header, 0) or None
 
-                elif "{" in line:
-                    end = self._look_for_end(lines, i)
+        if ";" in line:
+            return header
 
-                    if not end:
-                        continue
+        return header + 1
 
-                elif ";" in line:
-                    end = i
+    def error_scopes(self, lines: list[str], index: StructureIndex | None = None) -> dict[int, tuple[int, int]]:
+        """
+        Для каждой строки (с 1), на которой проверки пустых строк могут сообщить об ошибке, возвращает отрезок строк
+        [first, last], от которых эта ошибка зависит: серию пустых строк с соседними строками или блок класса или
+        метода от заголовка до первой непустой строки после него. Счетчик пустых строк после классов
+        накапливается по всему файлу, поэтому отрезок ошибки после класса начинается с первого класса.
+        Ошибки после классов и методов учитываются, только если передан index
+        """
 
-                else:
-                    end = i + 1
+        scopes: dict[int, tuple[int, int]] = {}
 
-                count = 0
+        def add(line: int, first: int, last: int) -> None:
+            if line in scopes:
+                first = min(first, scopes[line][0])
+                last = max(last, scopes[line][1])
+
+            scopes[line] = (max(first, 1), min(last, len(lines)))
+
+        if self._max_empty:
+            count = 0
+
+            # Ошибка серии пустых строк стоит на последней пустой строке серии, как в _iter_consecutive_empty_lines
+            for i, blank in enumerate(blank_lines(lines)):
+                if blank:
+                    count += 1
+                    continue
+
+                if count > self._max_empty:
+                    add(i, i - count, i + 1)
 
-                for j, line_2 in enumerate(lines[end + 1 :], start=end + 1):
+                count = 0
 
-                    if line_2.strip() == "":
-                        count += 1
-                    else:
-                        if count != self._after_method:
-                            errors.append(
-                                ErrorEntry(
-                                    file_name=filename,
-                                    line=end + 2,
-                                    column=1,
-                                    message=f"Обнаружено {count} пустых строк после метода, "
-                                    f"а должно быть {self._after_method}",
-                                )
-                            )
+            if count > self._max_empty:
+                add(len(lines), len(lines) - count, len(lines))
 
-                        break
+        if index is None:
+            return scopes
 
-        return errors
+        if self._after_class and index.class_headers:
+            first_class = index.class_headers[0] + 1
 
-    def _look_for_end(self, lines: list[str], index: int) -> int:
-        """Ищет конец класса/метода начиная с index, находя следующую неоткрытую '}'"""
+            for header in index.class_headers:
+                end = index.block_ends.get(header, 0)
 
-        open_brackets_count = 1
+                if end:
+                    add(end + 2, first_class, end + 2 + index.blank_runs[end + 1])
 
-        for i, line in enumerate(lines[index + 1 :], start=index + 1):
-            open_brackets_count += line.count("{")
-            open_brackets_count -= line.count("}")
+        if self._after_method:
+            for header in index.method_headers:
+                method_end = self._method_end(lines, header, index)
+
+                if method_end is not None:
+                    add(method_end + 2, header + 1, method_end + 2 + index.blank_runs[method_end + 1])
+
+        return scopes
+
+    def _header_kind(self, line: str, with_classes: bool, with_methods: bool) -> int:
+        """Возвращает битовую маску CLASS_HEADER/METHOD_HEADER для строки"""
+
+        kind = 0
+
+        if with_classes and JavaPatterns.CLASS_PATTERN.match(line):
+            kind |= CLASS_HEADER
+
+        if with_methods and JavaPatterns.METHOD_PATTERN.match(line) and not self._RETURN_PATTERN.match(line):
+            kind |= METHOD_HEADER
 
-            if open_brackets_count < 1:
-                return i
+        return kind
 
-        return 0
+    def _build_index(
+        self, lines: list[str], with_classes: bool, with_methods: bool, header_kinds: Iterable[int] | None = None
+    ) -> StructureIndex:
+        """
+        Строит StructureIndex за один проход по строкам.
+        Конец блока заголовка - первая следующая строка, после которой суммарная глубина фигурных скобок становится
+        меньше, чем после строки заголовка. Незакрытые заголовки хранятся в стеке с неубывающей глубиной, поэтому
+        каждый из них снимается со стека ровно один раз.
+        header_kinds - уже посчитанные _header_kind строк (например, сохраненные между перепроверками).
+        Без них заголовки и концы блоков берутся из индекса объявлений, если он есть (см. declaration_index)
+        """
+
+        if header_kinds is None:
+            declarations = declaration_index(lines)
+
+            if declarations is not None and isinstance(lines, ClassifiedLines):
+                return self._index_from_declarations(lines, declarations, with_classes, with_methods)
+
+            header_kinds = [self._header_kind(line, with_classes, with_methods) for line in lines]
+
+        class_headers = []
+        method_headers = []
+        block_ends = {}
+
+        open_headers: list[tuple[int, int]] = []
+        depth = 0
+
+        for i, (line, kind) in enumerate(zip(lines, header_kinds)):
+            depth += line.count("{") - line.count("}")
+
+            while open_headers and open_headers[-1][0] > depth:
+                block_ends[open_headers.pop()[1]] = i
+
+            if not kind:
+                continue
+
+            if kind & CLASS_HEADER:
+                class_headers.append(i)
+
+            if kind & METHOD_HEADER:
+                method_headers.append(i)
+
+            if kind & CLASS_HEADER or "{" in line:
+                open_headers.append((depth, i))
+
+        return StructureIndex(
+            class_headers=class_headers,
+            method_headers=method_headers,
+            block_ends=block_ends,
+            blank_runs=self._blank_runs(lines),
+        )
+
+    def _index_from_declarations(
+        self, lines: ClassifiedLines, declarations: DeclarationIndex, with_classes: bool, with_methods: bool
+    ) -> StructureIndex:
+        """
+        Строит StructureIndex по индексу объявлений. Концы блоков в индексе считаются так же, как в _build_index;
+        строки, начинающиеся с return, заголовками методов не считаются
+        """
+
+        classes = declarations.classes if with_classes else []
+        methods = (
+            [
+                declaration
+                for declaration in declarations.methods
+                # Первое слово начинается с return тогда же, когда строка совпадает с _RETURN_PATTERN
+                if not lines.first_word(declaration.header).startswith("return")
+            ]
+            if with_methods
+            else []
+        )
+
+        class_headers = [declaration.header for declaration in classes]
+        method_headers = [declaration.header for declaration in methods]
+        block_ends = {
+            declaration.header: declaration.body_end
+            for declaration in classes + methods
+            if declaration.body_end is not None
+        }
+
+        return StructureIndex(
+            class_headers=class_headers,
+            method_headers=method_headers,
+            block_ends=block_ends,
+            blank_runs=self._blank_runs(lines),
+        )
+
+    def _blank_runs(self, lines: list[str]) -> list[int]:
+        """Длина серии пустых строк, начинающейся с каждой строки; с запасом в две строки после конца файла"""
+
+        blank_runs = [0] * (len(lines) + 2)
+
+        blanks = blank_lines(lines)
+
+        for i in range(len(lines) - 1, -1, -1):
+            if blanks[i]:
+                blank_runs[i] = blank_runs[i + 1] + 1
+
+        return blank_runs
+
+    def consecutive_empty_lines_error(self, filename: str, line: int, count: int) -> ErrorEntry:
+        """Ошибка о слишком большом количестве пустых строк подряд, заканчивающихся на строке line"""
+        return ErrorEntry(
+            file_name=filename,
+            line=line,
+            column=1,
+            code=MessageCode.CONSECUTIVE_EMPTY_LINES,
+            params=(count, self._max_empty),
+        )
+
+    def after_class_error(self, filename: str, line: int, count: int) -> ErrorEntry:
+        """Ошибка о неверном количестве пустых строк после класса, начинающихся со строки line"""
+        return ErrorEntry(
+            file_name=filename,
+            line=line,
+            column=1,
+            code=MessageCode.EMPTY_LINES_AFTER_CLASS,
+            params=(count, self._after_class),
+        )
+
+    def after_method_error(self, filename: str, line: int, count: int) -> ErrorEntry:
+        """Ошибка о неверном количестве пустых строк после метода, начинающихся со строки line"""
+        return ErrorEntry(
+            file_name=filename,
+            line=line,
+            column=1,
+            code=MessageCode.EMPTY_LINES_AFTER_METHOD,
+            params=(count, self._after_method),
+        )
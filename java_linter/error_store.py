@@ -0,0 +1,104 @@
+from array import array
+from typing import Iterable, Iterator
+
+from java_linter.messages import DEFAULT_LANGUAGE, PARAMETRIZED_CODES, MessageCode
+from java_linter.shared import ErrorEntry
+
+
+class ErrorStore:
+    """
+    Компактное хранилище ошибок по столбцам: номер файла, строка, столбец, код сообщения и два параметра
+    хранятся в array, имена файлов - один раз в общем списке. Так ошибки передаются из процессов-обработчиков:
+    array сериализуется целиком, а не по объекту на ошибку. Обход и индексация выдают ErrorEntry
+    """
+
+    def __init__(self) -> None:
+        self._file_ids = array("I")
+        self._lines = array("i")
+        self._columns = array("i")
+        self._codes = array("B")
+        self._first = array("i")
+        self._second = array("i")
+
+        self._filenames: list[str] = []
+        self._filename_ids: dict[str, int] = {}
+
+    @classmethod
+    def from_entries(cls, errors: Iterable[ErrorEntry]) -> "ErrorStore":
+        store = cls()
+        store.extend(errors)
+        return store
+
+    @property
+    def filenames(self) -> list[str]:
+        """Имена файлов в порядке их первого появления"""
+        return list(self._filenames)
+
+    def append(self, filename: str, line: int, column: int, code: MessageCode, first: int = 0, second: int = 0) -> None:
+        """Добавляет ошибку, заданную кодом сообщения и его параметрами"""
+
+        file_id = self._filename_ids.get(filename)
+
+        if file_id is None:
+            file_id = self._filename_ids[filename] = len(self._filenames)
+            self._filenames.append(filename)
+
+        self._file_ids.append(file_id)
+        self._lines.append(line)
+        self._columns.append(column)
+        self._codes.append(code)
+        self._first.append(first)
+        self._second.append(second)
+
+    def add(self, error: ErrorEntry) -> None:
+        self.append(error.file_name, error.line, error.column, error.code, *error.params)
+
+    def extend(self, errors: Iterable[ErrorEntry]) -> None:
+        for error in errors:
+            self.add(error)
+
+    def truncate(self, size: int) -> None:
+        """Оставляет только первые size ошибок"""
+
+        for column in (self._file_ids, self._lines, self._columns, self._codes, self._first, self._second):
+            del column[size:]
+
+    def code(self, index: int) -> MessageCode:
+        """Возвращает код сообщения ошибки index"""
+        return MessageCode(self._codes[index])
+
+    def render(self, index: int, language: str = DEFAULT_LANGUAGE) -> str:
+        """Возвращает текст сообщения ошибки index на языке language"""
+        return self.entry(index).render(language)
+
+    def entry(self, index: int) -> ErrorEntry:
+        """Возвращает ошибку index в виде ErrorEntry"""
+
+        code = MessageCode(self._codes[index])
+
+        return ErrorEntry(
+            file_name=self._filenames[self._file_ids[index]],
+            line=self._lines[index],
+            column=self._columns[index],
+            code=code,
+            params=(self._first[index], self._second[index]) if code in PARAMETRIZED_CODES else (),
+        )
+
+    def entries(self) -> Iterator[ErrorEntry]:
+        """Лениво выдает все ошибки в виде ErrorEntry"""
+        return (self.entry(index) for index in range(len(self)))
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __iter__(self) -> Iterator[ErrorEntry]:
+        return self.entries()
+
+    def __getitem__(self, index: int) -> ErrorEntry:
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("ErrorStore index out of range")
+
+        return self.entry(index)
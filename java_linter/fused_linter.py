@@ -0,0 +1,209 @@
+import heapq
+import re
+from typing import Iterable
+
+from java_linter.empty_lines_liner import EmptyLineLinter
+from java_linter.line_classes import ClassifiedLines, LineFlag, classify_line
+from java_linter.naming_linter import NamingLinter
+from java_linter.shared import ErrorEntry, JavaPatterns, LineCheck
+from java_linter.space_linter import SpaceLinter
+
+_CLASS_BLOCK = 0
+_METHOD_BLOCK = 1
+
+_BLANK = LineFlag.BLANK.value
+_BRACES = LineFlag.OPEN_BRACE.value | LineFlag.CLOSE_BRACE.value
+
+
+class FusedLinter:
+    """
+    Линтер, проверяющий все включенные правила подлинтеров за один проход по строкам файла.
+    Результат совпадает с последовательным вызовом seek_for_errors у NamingLinter, EmptyLineLinter и SpaceLinter
+    """
+
+    _RETURN_PATTERN = re.compile(r"^\s*return")
+
+    def __init__(
+        self, naming_linter: NamingLinter, empty_line_linter: EmptyLineLinter, space_linter: SpaceLinter | None
+    ):
+        """При space_linter=None проверки пробелов не выполняются"""
+        self._naming_linter = naming_linter
+        self._empty_line_linter = empty_line_linter
+        self._space_linter = space_linter
+
+    def seek_for_errors(self, lines: Iterable[str], filename: str) -> list[ErrorEntry]:
+        """
+        Ищет ошибки в java файле за один проход и выдает их в виде списка ErrorEntry.
+        Совпадения CLASS_PATTERN и METHOD_PATTERN, пустота строки и глубина скобок считаются один раз на строку
+        и разделяются между всеми проверками. Строки читаются один раз по порядку, поэтому lines может быть
+        ленивым источником строк
+        """
+
+        naming = self._naming_linter
+        empty = self._empty_line_linter
+
+        class_errors: list[ErrorEntry] = []
+        method_errors: list[ErrorEntry] = []
+        var_errors: list[ErrorEntry] = []
+        scanner = self._space_linter.scanner if self._space_linter else None
+        space_checks = [] if scanner else self._get_space_checks()
+        space_buckets = scanner.new_buckets() if scanner else [bucket for _, bucket, _, _ in space_checks]
+
+        max_empty = empty.max_empty
+        after_class = empty.after_class
+        after_method = empty.after_method
+        track_blank = bool(max_empty or after_class or after_method)
+
+        consecutive_errors: list[ErrorEntry] = []
+        blank_count = 0
+
+        # Блоки классов/методов, конец которых еще не найден: (-глубина на строке заголовка, строка, вид, слот).
+        # Блок закрывается на первой строке, где суммарная глубина скобок становится меньше глубины заголовка
+        depth = 0
+        open_blocks: list[tuple[int, int, int, int]] = []
+
+        # Блоки с известным концом, ждущие первую непустую строку: (первая строка после конца, конец, вид, слот)
+        waiting: list[tuple[int, int, int, int]] = []
+
+        class_results: list[tuple[int, int, bool] | None] = []
+        method_results: list[ErrorEntry | None] = []
+
+        line_count = 0
+
+        # Флаги строк берутся из ClassifiedLines или считаются по ходу: lines может быть ленивым источником
+        flags_list = lines.flags if isinstance(lines, ClassifiedLines) else None
+        class_filter, method_filter, var_filter = (
+            (int(line_filter.required), int(line_filter.forbidden)) for line_filter in naming.get_line_filters()
+        )
+
+        for index, line in enumerate(lines):
+            line_count = index + 1
+            flags = flags_list[index] if flags_list is not None else classify_line(line)[0]
+
+            class_match = (
+                JavaPatterns.CLASS_PATTERN.match(line)
+                if flags & class_filter[0] == class_filter[0] and not flags & class_filter[1]
+                else None
+            )
+            method_match = (
+                JavaPatterns.METHOD_PATTERN.match(line)
+                if flags & method_filter[0] == method_filter[0] and not flags & method_filter[1]
+                else None
+            )
+
+            naming.check_class_name_match(class_match, index, filename, class_errors)
+            naming.check_method_name_match(method_match, line, index, filename, method_errors)
+
+            if flags & var_filter[0] == var_filter[0] and not flags & var_filter[1]:
+                naming.check_var_name_match(JavaPatterns.VAR_PATTERN.match(line), index, filename, var_errors)
+
+            if scanner:
+                scanner.scan_line(line, index, filename, space_buckets)
+            else:
+                for check, bucket, required, forbidden in space_checks:
+                    if flags & required == required and not flags & forbidden:
+                        check(line, index, filename, bucket)
+
+            if not track_blank:
+                continue
+
+            if flags & _BLANK:
+                blank_count += 1
+
+            else:
+                if max_empty and blank_count > max_empty:
+                    consecutive_errors.append(empty.consecutive_empty_lines_error(filename, index, blank_count))
+                blank_count = 0
+
+                if waiting:
+                    still_waiting = []
+
+                    for block in waiting:
+                        start, end, kind, slot = block
+
+                        if start > index:
+                            still_waiting.append(block)
+                        elif kind == _CLASS_BLOCK:
+                            class_results[slot] = (end, index - start, True)
+                        elif index - start != after_method:
+                            method_results[slot] = empty.after_method_error(filename, end + 2, index - start)
+
+                    waiting = still_waiting
+
+            if not (after_class or after_method):
+                continue
+
+            if flags & _BRACES:
+                depth += line.count("{") - line.count("}")
+
+            while open_blocks and -open_blocks[0][0] > depth:
+                _, _, kind, slot = heapq.heappop(open_blocks)
+                waiting.append((index + 1, index, kind, slot))
+
+            if after_class and class_match:
+                heapq.heappush(open_blocks, (-depth, index, _CLASS_BLOCK, len(class_results)))
+                class_results.append(None)
+
+            if after_method and method_match and not self._RETURN_PATTERN.match(line):
+                slot = len(method_results)
+                method_results.append(None)
+
+                if "{" in line and "}" in line:
+                    waiting.append((index + 1, index, _METHOD_BLOCK, slot))
+                elif "{" in line:
+                    heapq.heappush(open_blocks, (-depth, index, _METHOD_BLOCK, slot))
+                elif ";" in line:
+                    waiting.append((index + 1, index, _METHOD_BLOCK, slot))
+                else:
+                    waiting.append((index + 2, index + 1, _METHOD_BLOCK, slot))
+
+        if max_empty and blank_count > max_empty:
+            consecutive_errors.append(empty.consecutive_empty_lines_error(filename, line_count, blank_count))
+
+        for start, end, kind, slot in waiting:
+            if kind == _CLASS_BLOCK:
+                class_results[slot] = (end, line_count - start, False)
+
+        # Как и в EmptyLineLinter, счетчик пустых строк после классов накапливается от класса к классу
+        after_class_errors = []
+        count = 0
+
+        for result in class_results:
+            if result is None:
+                continue
+
+            end, blanks, terminated = result
+            count += blanks
+
+            if terminated and count != after_class:
+                after_class_errors.append(empty.after_class_error(filename, end + 2, count))
+
+        errors = class_errors + method_errors + var_errors
+
+        if max_empty:
+            errors.extend(consecutive_errors)
+
+        if after_class:
+            errors.extend(after_class_errors)
+
+        if after_method:
+            errors.extend(error for error in method_results if error)
+
+        for bucket in space_buckets:
+            errors.extend(bucket)
+
+        return errors
+
+    def _get_space_checks(self) -> list[tuple[LineCheck, list[ErrorEntry], int, int]]:
+        """
+        Возвращает включенные построчные проверки SpaceLinter в порядке SpaceLinter.seek_for_errors: проверку,
+        список для ее ошибок и флаги ее фильтра строк (обязательные и запрещенные)
+        """
+
+        if not self._space_linter:
+            return []
+
+        return [
+            (check, [], int(line_filter.required), int(line_filter.forbidden))
+            for check, line_filter in zip(self._space_linter.get_line_checks(), self._space_linter.get_line_filters())
+        ]
@@ -0,0 +1,146 @@
+import ast
+import os
+import re
+import subprocess
+from bisect import bisect_right
+from typing import Iterable, Iterator
+
+_HUNK_HEADER = re.compile(r"@@ -\d+(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+
+
+class GitDiffError(Exception):
+    """Не удалось получить изменения из git"""
+
+
+class ChangedLines:
+    """Множество номеров строк (с 1), которое хранится отсортированными непересекающимися отрезками [first, last]"""
+
+    def __init__(self, intervals: Iterable[tuple[int, int]] = ()):
+        self._firsts: list[int] = []
+        self._lasts: list[int] = []
+
+        for first, last in sorted(intervals):
+            if self._lasts and first <= self._lasts[-1] + 1:
+                self._lasts[-1] = max(self._lasts[-1], last)
+            else:
+                self._firsts.append(first)
+                self._lasts.append(last)
+
+    @property
+    def intervals(self) -> list[tuple[int, int]]:
+        return list(zip(self._firsts, self._lasts))
+
+    def intersects(self, first: int, last: int) -> bool:
+        """Есть ли в множестве хоть одна строка из отрезка [first, last]"""
+
+        i = bisect_right(self._firsts, last) - 1
+
+        return i >= 0 and self._lasts[i] >= first
+
+    def __contains__(self, line: object) -> bool:
+        return isinstance(line, int) and self.intersects(line, line)
+
+    def __iter__(self) -> Iterator[int]:
+        for first, last in zip(self._firsts, self._lasts):
+            yield from range(first, last + 1)
+
+    def __len__(self) -> int:
+        return sum(last - first + 1 for first, last in zip(self._firsts, self._lasts))
+
+    def __repr__(self) -> str:
+        return f"ChangedLines({self.intervals})"
+
+
+def parse_diff(diff: str) -> dict[str, ChangedLines]:
+    """
+    Разбирает вывод git diff -U0 с префиксами a/ и b/ и возвращает измененные строки новых версий файлов.
+    Для удаленных строк отмечаются соседние с местом удаления строки. Удаленные файлы и файлы без изменений
+    строк (переименования, смена прав) не попадают в результат
+    """
+
+    result: dict[str, list[tuple[int, int]]] = {}
+    intervals: list[tuple[int, int]] | None = None
+    lines = diff.split("\n")
+    i = 0
+
+    while i < len(lines):
+        line = lines[i]
+        i += 1
+
+        if line.startswith("diff "):
+            intervals = None
+        elif line.startswith("+++ "):
+            # Путь с пробелом git завершает табуляцией
+            path = _unquote(line[4:].removesuffix("\t"))
+            intervals = result.setdefault(path[2:], []) if path.startswith("b/") else None
+        elif line.startswith("@@ ") and intervals is not None:
+            match = _HUNK_HEADER.match(line)
+
+            if not match:
+                raise GitDiffError(f"Не удалось разобрать заголовок изменения: {line}")
+
+            old_count = int(match.group(1) or 1)
+            first = int(match.group(2))
+            new_count = int(match.group(3) or 1)
+
+            if new_count:
+                intervals.append((first, first + new_count - 1))
+            else:
+                intervals.append((max(first, 1), first + 1))
+
+            # Строки изменения пропускаются по счетчикам, так что строка кода "++ x" не примется за заголовок файла
+            i += old_count + new_count
+
+            while i < len(lines) and lines[i].startswith("\\"):
+                i += 1
+
+    return {path: ChangedLines(intervals) for path, intervals in result.items() if intervals}
+
+
+def _unquote(path: str) -> str:
+    """Раскрывает путь, который git взял в кавычки из-за особых символов (core.quotePath)"""
+
+    if path.startswith('"') and path.endswith('"'):
+        return os.fsdecode(ast.literal_eval("b" + path))
+
+    return path
+
+
+def git_changed_lines(base: str, paths: Iterable[str] = (), cwd: str = ".") -> dict[str, ChangedLines]:
+    """
+    Возвращает строки, измененные в рабочей копии относительно base (git diff -U0 base), для файлов из paths.
+    Пути в результате - относительно cwd. Неотслеживаемые git'ом файлы не учитываются
+    """
+
+    top = _run_git(["rev-parse", "--show-toplevel"], cwd).strip()
+    diff = _run_git(
+        [
+            "-c",
+            "core.quotePath=true",
+            "diff",
+            "-U0",
+            "--no-color",
+            "--no-ext-diff",
+            "--diff-filter=d",
+            "--src-prefix=a/",
+            "--dst-prefix=b/",
+            base,
+            "--",
+            *paths,
+        ],
+        cwd,
+    )
+
+    return {os.path.relpath(os.path.join(top, path), cwd): changed for path, changed in parse_diff(diff).items()}
+
+
+def _run_git(args: list[str], cwd: str) -> str:
+    try:
+        completed = subprocess.run(["git", *args], cwd=cwd, capture_output=True, check=False)
+    except OSError as e:
+        raise GitDiffError(f"Не удалось запустить git: {e}") from e
+
+    if completed.returncode != 0:
+        raise GitDiffError(completed.stderr.decode("utf-8", errors="replace").strip())
+
+    return completed.stdout.decode("utf-8", errors="replace")
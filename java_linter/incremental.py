@@ -0,0 +1,290 @@
+from typing import Iterable, Iterator, NamedTuple
+
+from java_linter.empty_lines_liner import EmptyLineLinter, LineStructure
+from java_linter.git_diff import ChangedLines
+from java_linter.messages import MessageCode
+from java_linter.naming_linter import NamingLinter
+from java_linter.shared import ErrorEntry, LineCheck
+from java_linter.space_linter import SpaceLinter
+from java_linter.tokenizer import mask_code_lines
+
+# Ошибки построчных проверок одной строки: для каждой проверки - тройки (столбец, код сообщения, параметры);
+# () - ошибок нет. Номер строки не хранится, поэтому вставка и удаление строк выше не требуют перепроверки
+_Row = tuple[tuple[tuple[int, MessageCode, tuple[int, ...]], ...], ...]
+
+
+class LineChange(NamedTuple):
+    """Строки [start, old_end) прежнего текста заменены строками [start, new_end) нового"""
+
+    start: int
+    old_end: int
+    new_end: int
+
+
+class IncrementalState:
+    """
+    Результат проверки файла вместе с тем, что нужно для его перепроверки (см. IncrementalLinter.relint):
+    проверенные строки, ошибки построчных проверок по строкам, заголовки классов и методов
+    и ошибки проверок пустых строк
+    """
+
+    def __init__(self, filename: str, lines: list[str], rows: list[_Row], header_kinds: list[int]):
+        self.filename = filename
+        self.lines = lines
+        self.rows = rows
+        self.header_kinds = header_kinds
+        self.block_errors: list[ErrorEntry] = []
+        self.errors: list[ErrorEntry] = []
+
+
+class IncrementalLinter:
+    """
+    Линтер, который после правки файла перепроверяет только измененные строки.
+    Проверки имен и пробелов построчные, поэтому их ошибки хранятся по строкам и пересчитываются только для
+    измененных. Ошибки проверок пустых строк зависят от структуры блоков, поэтому хранятся целиком: если правка
+    не меняет LineStructure строк или только вставляет и удаляет строки без скобок и заголовков вдали от пустых
+    строк, они лишь сдвигаются, иначе повторяются по сохраненным заголовкам классов и методов (подсчет скобок
+    и пустых строк без регулярных выражений). Результат совпадает с Linter.seek_for_errors
+    """
+
+    def __init__(
+        self,
+        naming_linter: NamingLinter,
+        empty_line_linter: EmptyLineLinter,
+        space_linter: SpaceLinter,
+        tokenized: bool = False,
+    ):
+        """При tokenized=True файл разбирается на токены целиком, перепроверяются строки, чей код изменился"""
+
+        naming_checks = naming_linter.get_line_checks()
+
+        self._line_checks: tuple[LineCheck, ...] = naming_checks + space_linter.get_line_checks()
+        self._naming_check_count = len(naming_checks)
+        self._empty_line_linter = empty_line_linter
+        self._checks_empty_lines = bool(empty_line_linter.get_checks())
+        self._tokenized = tokenized
+
+    def lint(self, lines: list[str], filename: str) -> IncrementalState:
+        """Проверяет файл целиком; ошибки - в state.errors"""
+
+        code_lines = mask_code_lines(lines) if self._tokenized else list(lines)
+        header_kind = self._empty_line_linter.header_kind
+
+        state = IncrementalState(
+            filename,
+            code_lines,
+            [self._check_line(line, i, filename) for i, line in enumerate(code_lines)],
+            [header_kind(line) for line in code_lines],
+        )
+        state.block_errors = self._block_errors(state)
+        state.errors = self._collect_errors(state)
+
+        return state
+
+    def relint(self, state: IncrementalState, lines: list[str], changes: Iterable[LineChange]) -> IncrementalState:
+        """
+        Перепроверяет файл после правок changes, которые применялись к прежнему тексту по порядку и дали lines;
+        строки вне changes должны совпадать с прежними. Сохраненные строки и их ошибки заменяются срезами только
+        в местах правок, и построчные проверки выполняются только для новых строк. При tokenized=True файл
+        разбирается на токены целиком, поэтому перепроверяются и строки, чей код изменился вне changes
+        (например, после открытия многострочного комментария), и тогда ошибки пустых строк пересчитываются.
+        state обновляется на месте и возвращается; если проверка упала с исключением, state больше не годится
+        """
+
+        changes = list(changes)
+        code_lines = mask_code_lines(lines) if self._tokenized else lines
+        shift = sum(change.new_end - change.old_end for change in changes)
+
+        if len(state.lines) + shift != len(code_lines):
+            raise ValueError(f"Правки дают {len(state.lines) + shift} строк, а в файле {len(code_lines)}")
+
+        intervals = _changed_intervals(changes)
+
+        # Все правки лежат в [first, last) нового текста и в [first, last - shift) прежнего
+        first = min((start for start, _ in intervals), default=0)
+        last = max((end for _, end in intervals), default=0)
+        old_structure = self._structure(state.lines[first : last - shift], state.header_kinds[first : last - shift])
+
+        for change in changes:
+            size = change.new_end - change.start
+
+            state.lines[change.start : change.old_end] = [""] * size
+            state.rows[change.start : change.old_end] = [()] * size
+            state.header_kinds[change.start : change.old_end] = [0] * size
+
+        for start, end in intervals:
+            self._check_lines(state, code_lines, range(start, end))
+
+        # Строки, чей код изменился вне правок, меняют и ошибки пустых строк где угодно
+        outside = []
+
+        if self._tokenized:
+            outside = [i for i, (old, new) in enumerate(zip(state.lines, code_lines)) if old != new]
+            self._check_lines(state, code_lines, outside)
+
+        if self._checks_empty_lines and outside:
+            state.block_errors = self._block_errors(state)
+        elif self._checks_empty_lines and old_structure != self._structure(
+            state.lines[first:last], state.header_kinds[first:last]
+        ):
+            state.block_errors = self._moved_block_errors(state, first, last, shift, old_structure)
+
+        state.errors = self._collect_errors(state)
+
+        return state
+
+    def lint_changed(self, lines: list[str], filename: str, changed: ChangedLines) -> list[ErrorEntry]:
+        """
+        Возвращает ошибки seek_for_errors, относящиеся к строкам changed. Построчные проверки выполняются только
+        для строк changed. Проверки пустых строк выполняются для всего файла, а их ошибка остается, если
+        изменена хоть одна строка, от которой она зависит: серия пустых строк или блок класса или метода
+        (см. EmptyLineLinter.error_scopes)
+        """
+
+        code_lines = mask_code_lines(lines) if self._tokenized else list(lines)
+        rows = [(i, self._check_line(code_lines[i], i, filename)) for i in self._changed_indexes(changed, code_lines)]
+
+        empty = self._empty_line_linter
+        index = empty.build_index(code_lines)
+        scopes = empty.error_scopes(code_lines, index)
+        block_errors = [
+            error
+            for error in empty.block_errors(code_lines, filename, index)
+            if changed.intersects(*scopes.get(error.line, (error.line, error.line)))
+        ]
+
+        return self._merge_errors(filename, [(i, row) for i, row in rows if row], block_errors)
+
+    @staticmethod
+    def _changed_indexes(changed: ChangedLines, lines: list[str]) -> Iterator[int]:
+        for first, last in changed.intervals:
+            if first > len(lines):
+                return
+
+            yield from range(first - 1, min(last, len(lines)))
+
+    def _check_line(self, line: str, index: int, filename: str) -> _Row:
+        """Выполняет построчные проверки одной строки"""
+
+        results = []
+        found = False
+        errors: list[ErrorEntry] = []
+
+        for check in self._line_checks:
+            check(line, index, filename, errors)
+
+            if errors:
+                results.append(tuple((error.column, error.code, error.params) for error in errors))
+                errors.clear()
+                found = True
+            else:
+                results.append(())
+
+        return tuple(results) if found else ()
+
+    def _structure(self, lines: list[str], header_kinds: list[int]) -> list[LineStructure]:
+        line_structure = self._empty_line_linter.line_structure
+        return [line_structure(line, kind) for line, kind in zip(lines, header_kinds)]
+
+    def _check_lines(self, state: IncrementalState, code_lines: list[str], indexes: Iterable[int]) -> None:
+        """Перепроверяет строки indexes и сохраняет их в state"""
+
+        header_kind = self._empty_line_linter.header_kind
+
+        for i in indexes:
+            state.lines[i] = code_lines[i]
+            state.rows[i] = self._check_line(code_lines[i], i, state.filename)
+            state.header_kinds[i] = header_kind(code_lines[i])
+
+    def _moved_block_errors(
+        self, state: IncrementalState, first: int, last: int, shift: int, old_structure: list[LineStructure]
+    ) -> list[ErrorEntry]:
+        """
+        Ошибки пустых строк после замены строк [first, last) нового текста. Если прежние и новые строки
+        и соседние с ними - непустые строки без скобок и не заголовки, серии пустых строк и концы блоков не
+        меняются, а ни одна ошибка не стоит внутри замененных строк, поэтому ошибки после правки лишь сдвигаются.
+        Заголовок через строку до правки тоже запрещен: конец метода без '{' и ';' - следующая за ним строка.
+        Иначе ошибки пересчитываются по всему файлу
+        """
+
+        line_structure = self._empty_line_linter.line_structure
+
+        def plain(i: int) -> bool:
+            return not 0 <= i < len(state.lines) or line_structure(state.lines[i], state.header_kinds[i]).plain
+
+        if (
+            all(line.plain for line in old_structure)
+            and all(plain(i) for i in range(first - 1, last + 1))
+            and (first < 2 or not state.header_kinds[first - 2])
+        ):
+            return [
+                error if error.line <= first else error._replace(line=error.line + shift)
+                for error in state.block_errors
+            ]
+
+        return self._block_errors(state)
+
+    def _block_errors(self, state: IncrementalState) -> list[ErrorEntry]:
+        """Ошибки проверок пустых строк по сохраненным заголовкам классов и методов"""
+
+        empty = self._empty_line_linter
+        index = empty.build_index(state.lines, state.header_kinds)
+
+        return empty.block_errors(state.lines, state.filename, index)
+
+    def _collect_errors(self, state: IncrementalState) -> list[ErrorEntry]:
+        """Собирает ошибки в порядке Linter.seek_for_errors: имена, пустые строки, пробелы"""
+
+        rows = [(i, row) for i, row in enumerate(state.rows) if row]
+
+        return self._merge_errors(state.filename, rows, state.block_errors)
+
+    def _merge_errors(
+        self, filename: str, rows: list[tuple[int, _Row]], block_errors: list[ErrorEntry]
+    ) -> list[ErrorEntry]:
+        """
+        Собирает ошибки в порядке Linter.seek_for_errors: имена, пустые строки, пробелы.
+        rows - непустые ошибки построчных проверок по возрастанию индекса строки
+        """
+
+        errors: list[ErrorEntry] = []
+
+        def extend_line_check_errors(check_number: int) -> None:
+            for i, row in rows:
+                for column, code, params in row[check_number]:
+                    errors.append(ErrorEntry(file_name=filename, line=i + 1, column=column, code=code, params=params))
+
+        for check_number in range(self._naming_check_count):
+            extend_line_check_errors(check_number)
+
+        errors.extend(block_errors)
+
+        for check_number in range(self._naming_check_count, len(self._line_checks)):
+            extend_line_check_errors(check_number)
+
+        return errors
+
+
+def _changed_intervals(changes: list[LineChange]) -> list[tuple[int, int]]:
+    """
+    Отрезки [start, end) нового текста, которые дали правки changes, примененные по порядку; отрезок удаления
+    пустой. Отрезки прежних правок сдвигаются следующими, а замененные ими части отбрасываются
+    """
+
+    intervals: list[tuple[int, int]] = []
+
+    for change in changes:
+        shift = change.new_end - change.old_end
+        moved = []
+
+        for start, end in intervals:
+            if start < change.start:
+                moved.append((start, min(end, change.start)))
+
+            if end > change.old_end:
+                moved.append((max(start, change.old_end) + shift, end + shift))
+
+        moved.append((change.start, change.new_end))
+        intervals = moved
+
+    return intervals
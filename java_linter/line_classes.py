@@ -0,0 +1,206 @@
+import re
+from enum import IntFlag
+from typing import TYPE_CHECKING, Iterable, NamedTuple, Sequence
+
+if TYPE_CHECKING:
+    from java_linter.declarations import DeclarationIndex
+
+
+class LineFlag(IntFlag):
+    """
+    Флаги строки, по которым проверки пропускают строки, где заведомо ничего не найдут.
+    Флаги символов означают, что символ есть в строке; BRACKET и OPERATOR - что есть хоть один из символов группы
+    """
+
+    # Строка только из пробельных символов
+    BLANK = 1 << 0
+    # Строка начинается (после отступа) с //, /* или *
+    COMMENT = 1 << 1
+    # Строка import или package: за первым словом идут пробелы и следующее слово
+    IMPORT = 1 << 2
+    # Строка начинается (после отступа) с символа слова
+    WORD = 1 << 3
+    # Первое слово - модификатор или class/interface/enum, то есть строка может быть заголовком класса
+    DECLARATION = 1 << 4
+
+    COMMA = 1 << 8
+    DOT = 1 << 9
+    SEMICOLON = 1 << 10
+    OPEN_PAREN = 1 << 11
+    CLOSE_PAREN = 1 << 12
+    OPEN_BRACE = 1 << 13
+    CLOSE_BRACE = 1 << 14
+    # ( ) {
+    BRACKET = 1 << 15
+    # = + - * /
+    OPERATOR = 1 << 16
+    # { }
+    BRACE = 1 << 17
+
+
+class LineFilter(NamedTuple):
+    """Строки, в которых построчная проверка может найти ошибку: со всеми флагами required и без флагов forbidden"""
+
+    required: int = 0
+    forbidden: int = 0
+
+
+# Фильтр проверки, которой нужны все строки
+ALL_LINES = LineFilter()
+
+# Строки, которые могут совпасть с JavaPatterns.CLASS_PATTERN и JavaPatterns.METHOD_PATTERN
+CLASS_HEADER_LINES = LineFilter(LineFlag.DECLARATION)
+METHOD_HEADER_LINES = LineFilter(LineFlag.WORD | LineFlag.OPEN_PAREN | LineFlag.CLOSE_PAREN)
+# Строки, на которых меняется глубина фигурных скобок
+BRACE_LINES = LineFilter(LineFlag.BRACE)
+
+# Слова, с которых может начинаться заголовок класса (см. JavaPatterns.CLASS_PATTERN)
+DECLARATION_WORDS = frozenset(
+    ("public", "private", "protected", "static", "final", "synchronized", "abstract", "default")
+    + ("class", "interface", "enum")
+)
+
+_FIRST_WORD = re.compile(r"\s*(\w*)")
+_IMPORT = re.compile(r"\s*(?:import|package)\s+\w")
+
+# Флаги в виде int: операции с IntFlag в цикле по строкам заметно медленнее
+_BLANK = LineFlag.BLANK.value
+_COMMENT = LineFlag.COMMENT.value
+_IMPORT_FLAG = LineFlag.IMPORT.value
+_WORD = LineFlag.WORD.value
+_DECLARATION = LineFlag.DECLARATION.value
+_COMMA = LineFlag.COMMA.value
+_DOT = LineFlag.DOT.value
+_SEMICOLON = LineFlag.SEMICOLON.value
+_OPEN_PAREN = LineFlag.OPEN_PAREN.value | LineFlag.BRACKET.value
+_CLOSE_PAREN = LineFlag.CLOSE_PAREN.value | LineFlag.BRACKET.value
+_OPEN_BRACE = LineFlag.OPEN_BRACE.value | LineFlag.BRACKET.value | LineFlag.BRACE.value
+_CLOSE_BRACE = LineFlag.CLOSE_BRACE.value | LineFlag.BRACE.value
+_OPERATOR = LineFlag.OPERATOR.value
+
+# Флаги, которые дает каждый символ строки, как в classify_line (для бэкендов, которые считают флаги по символам)
+CHARACTER_FLAGS: dict[str, int] = {
+    ",": _COMMA,
+    ".": _DOT,
+    ";": _SEMICOLON,
+    "(": _OPEN_PAREN,
+    ")": _CLOSE_PAREN,
+    "{": _OPEN_BRACE,
+    "}": _CLOSE_BRACE,
+    "=": _OPERATOR,
+    "+": _OPERATOR,
+    "-": _OPERATOR,
+    "*": _OPERATOR,
+    "/": _OPERATOR,
+}
+
+
+def classify_line(line: str) -> tuple[int, str]:
+    """Возвращает флаги LineFlag строки и ее первое слово (пустое, если строка не начинается со слова)"""
+
+    flags = 0
+
+    if "," in line:
+        flags |= _COMMA
+    if "." in line:
+        flags |= _DOT
+    if ";" in line:
+        flags |= _SEMICOLON
+    if "(" in line:
+        flags |= _OPEN_PAREN
+    if ")" in line:
+        flags |= _CLOSE_PAREN
+    if "{" in line:
+        flags |= _OPEN_BRACE
+    if "}" in line:
+        flags |= _CLOSE_BRACE
+    if "=" in line or "+" in line or "-" in line or "*" in line or "/" in line:
+        flags |= _OPERATOR
+
+    match = _FIRST_WORD.match(line)
+    # Все части выражения необязательны, поэтому оно совпадает с началом любой строки
+    assert match is not None
+    first_word = match.group(1)
+
+    if first_word:
+        flags |= _WORD
+
+        if first_word in DECLARATION_WORDS:
+            flags |= _DECLARATION
+        elif (first_word == "import" or first_word == "package") and _IMPORT.match(line):
+            flags |= _IMPORT_FLAG
+    elif match.end() == len(line):
+        flags |= _BLANK
+    elif line.startswith(("//", "/*", "*"), match.end()):
+        flags |= _COMMENT
+
+    return flags, first_word
+
+
+class ClassifiedLines(list[str]):
+    """
+    Строки файла вместе с флагами LineFlag каждой строки, которые считаются один раз при создании.
+    Передается проверкам вместо списка строк, поэтому проверки, которые о классификации не знают, работают как
+    раньше. После создания не изменяется.
+    flags и depths можно передать уже посчитанными (см. numpy_backend); depths - суммарная глубина фигурных скобок
+    после каждой строки, без бэкенда не считается
+    """
+
+    def __init__(self, lines: Iterable[str] = (), flags: list[int] | None = None, depths: list[int] | None = None):
+        super().__init__(lines)
+
+        self.flags: list[int] = flags if flags is not None else [classify_line(line)[0] for line in self]
+        self.depths = depths
+
+        self._indexes: dict[LineFilter, list[int]] = {}
+
+        # Индекс объявлений, строится по первому запросу (см. declaration_index)
+        self.declarations: DeclarationIndex | None = None
+
+    def indexes(self, line_filter: LineFilter) -> list[int]:
+        """Возвращает индексы строк, проходящих line_filter; результат запоминается для каждого фильтра"""
+
+        indexes = self._indexes.get(line_filter)
+
+        if indexes is None:
+            indexes = self._indexes[line_filter] = self._find_indexes(
+                int(line_filter.required), int(line_filter.forbidden)
+            )
+
+        return indexes
+
+    def first_word(self, index: int) -> str:
+        """Первое слово строки index, как в classify_line"""
+
+        match = _FIRST_WORD.match(self[index])
+
+        return match.group(1) if match else ""
+
+    def _find_indexes(self, required: int, forbidden: int) -> list[int]:
+        return [i for i, flags in enumerate(self.flags) if flags & required == required and not flags & forbidden]
+
+
+def classify_lines(lines: Iterable[str]) -> ClassifiedLines:
+    """Классифицирует строки файла; уже классифицированные строки возвращаются как есть"""
+    return lines if isinstance(lines, ClassifiedLines) else ClassifiedLines(lines)
+
+
+def filtered_lines(lines: Sequence[str], line_filter: LineFilter) -> Iterable[tuple[int, str]]:
+    """
+    Пары (индекс, строка), которые надо проверить проверке с фильтром line_filter. Неклассифицированные строки
+    отдаются все и обходятся итератором, так что ленивый обход не читает строки дальше, чем дошли проверки
+    """
+
+    if line_filter == ALL_LINES or not isinstance(lines, ClassifiedLines):
+        return enumerate(lines)
+
+    return ((i, lines[i]) for i in lines.indexes(line_filter))
+
+
+def blank_lines(lines: Sequence[str]) -> list[bool]:
+    """Для каждой строки - состоит ли она только из пробельных символов; у ClassifiedLines берется из флагов"""
+
+    if isinstance(lines, ClassifiedLines):
+        return [bool(flags & _BLANK) for flags in lines.flags]
+
+    return [line.strip() == "" for line in lines]
@@ -0,0 +1,77 @@
+import math
+import time
+from functools import partial
+from typing import Iterable, Iterator
+
+from java_linter.line_classes import ALL_LINES, LineFilter, filtered_lines
+from java_linter.messages import MessageCode
+from java_linter.shared import Check, ErrorEntry, LineCheck, iter_line_check
+
+# Допустимое время одной построчной проверки на одной строке, в миллисекундах
+DEFAULT_LINE_TIME_LIMIT = 100
+
+
+class LineGuard:
+    """
+    Замеряет время построчных проверок Linter'а на каждой строке. Строка, на которой проверка работала дольше
+    limit миллисекунд, попадает в результат ошибкой SLOW_LINE (один раз на строку), а при skip=True остальные
+    проверки ее пропускают.
+    LineGuard только замеряет время и не может остановить проверку: время известно, лишь когда проверка строки
+    закончилась, поэтому зависшая на строке проверка задерживает обработчик до своего конца, а skip=True только
+    не дает следующим проверкам потратить на эту строку столько же.
+    Проверки целого файла не оборачиваются
+    """
+
+    def __init__(self, limit: int = DEFAULT_LINE_TIME_LIMIT, skip: bool = False):
+        self.limit = limit
+        self.skip = skip
+
+    def wrap_checks(self, checks: Iterable[Check]) -> tuple[Check, ...]:
+        """
+        Оборачивает построчные проверки замером времени на каждой строке, остальные возвращает как есть.
+        Обернутые проверки делят набор долгих строк одного файла, поэтому проверки оборачиваются заново на каждый файл
+        """
+
+        slow: set[int] = set()
+
+        return tuple(self._wrap(check, slow) for check in checks)
+
+    def _wrap(self, check: Check, slow: set[int]) -> Check:
+        if isinstance(check, partial) and check.func is iter_line_check:
+            # Построчная проверка остается первым аргументом partial, так что check_name профилировщика не меняется
+            return partial(self._iter_guarded, check.args[0], check.keywords.get("line_filter", ALL_LINES), slow)
+
+        return check
+
+    def _iter_guarded(
+        self, line_check: LineCheck, line_filter: LineFilter, slow: set[int], lines: list[str], filename: str
+    ) -> Iterator[ErrorEntry]:
+        """То же, что iter_line_check, но с замером времени line_check на каждой строке; долгие строки - в slow"""
+
+        limit = self.limit / 1000
+        errors: list[ErrorEntry] = []
+
+        for i, line in filtered_lines(lines, line_filter):
+            if self.skip and i in slow:
+                continue
+
+            start = time.perf_counter()
+            line_check(line, i, filename, errors)
+            seconds = time.perf_counter() - start
+
+            if seconds > limit and i not in slow:
+                slow.add(i)
+                errors.append(self._slow_line_error(filename, i, seconds))
+
+            if errors:
+                yield from errors
+                errors.clear()
+
+    def _slow_line_error(self, filename: str, index: int, seconds: float) -> ErrorEntry:
+        return ErrorEntry(
+            file_name=filename,
+            line=index + 1,
+            column=1,
+            code=MessageCode.SLOW_LINE,
+            params=(math.ceil(seconds * 1000), self.limit),
+        )
@@ -1,32 +1,246 @@
 import json
-from typing import Any
+import os
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Iterable, Iterator, NamedTuple, Sequence
 
 from java_linter.dialects import Dialect, EmptyLineCountDialect, NamingDialect, NamingRule, SpaceDialect
 from java_linter.empty_lines_liner import EmptyLineLinter
+from java_linter.fused_linter import FusedLinter
+from java_linter.git_diff import ChangedLines
+from java_linter.incremental import IncrementalLinter, IncrementalState, LineChange
+from java_linter.line_classes import classify_lines
+from java_linter.line_guard import LineGuard
+from java_linter.mmap_scanner import Buffer, MmapScanner
 from java_linter.naming_linter import NamingLinter
-from java_linter.shared import ErrorEntry
+from java_linter.numpy_backend import classify_batch, classify_lines_numpy, require_numpy
+from java_linter.profiling import Profiler
+from java_linter.shared import Check, ErrorEntry, iter_checks
 from java_linter.space_linter import SpaceLinter
+from java_linter.tokenizer import mask_code_lines
+
+
+class LinterOptions(NamedTuple):
+    """
+    Опции Linter (см. Linter.__init__), кроме диалекта и профилировщика. Кортеж хешируется, поэтому опции входят
+    в ключ кэша load_linter
+    """
+
+    fused: bool = False
+    combined_spaces: bool = False
+    tokenized: bool = False
+    line_time_limit: int | None = None
+    skip_slow_lines: bool = False
+    numpy_backend: bool = False
 
 
 class Linter:
     """Джава линтер, который ищет ошибки в поданном файле, основываясь на стиле кода, указанном в Dialect"""
 
-    def __init__(self, dialect_filename: str = "", dialect: Dialect | None = None):
-        """При отсутствии dialect_filename использует свой базовый"""
+    def __init__(
+        self,
+        dialect_filename: str = "",
+        dialect: Dialect | None = None,
+        fused: bool = False,
+        combined_spaces: bool = False,
+        tokenized: bool = False,
+        profiler: Profiler | None = None,
+        line_time_limit: int | None = None,
+        skip_slow_lines: bool = False,
+        numpy_backend: bool = False,
+    ):
+        """
+        При отсутствии dialect_filename использует свой базовый.
+        При fused=True все проверки выполняются за один проход по строкам файла (см. FusedLinter),
+        при combined_spaces=True проверки пробелов выполняются одним регулярным выражением (см. CombinedSpaceScanner),
+        при tokenized=True файл один раз разбирается на токены, и проверки не срабатывают внутри литералов и
+        комментариев (см. mask_code_lines).
+        При переданном profiler проверки оборачиваются замерами времени (см. Profiler), без него не меняются.
+        При переданном line_time_limit (в миллисекундах) время построчных проверок замеряется на каждой строке, и
+        долгие строки попадают в результат, а при skip_slow_lines=True еще и пропускаются остальными проверками
+        (см. LineGuard); fused=True в этом режиме не используется.
+        При numpy_backend=True строки классифицируются массивами numpy (см. classify_batch); без установленного
+        numpy бросается NumpyUnavailableError
+        """
+
+        if numpy_backend:
+            require_numpy()
 
         self._dialect = dialect if dialect else self._get_dialect(dialect_filename)
 
+        # Индекс объявлений строится один раз на файл и общий для проверок имен и пустых строк (см. declaration_index)
         self._naming_linter = NamingLinter(self._dialect)
         self._empty_line_linter = EmptyLineLinter(self._dialect)
-        self._space_linter = SpaceLinter(self._dialect)
+        self._space_linter = SpaceLinter(self._dialect, combined_spaces)
+
+        self._tokenized = tokenized
+        self._numpy_backend = numpy_backend
+        self._fused_linter = (
+            FusedLinter(self._naming_linter, self._empty_line_linter, self._space_linter)
+            if fused and line_time_limit is None
+            else None
+        )
+
+        self._incremental_linter = IncrementalLinter(
+            self._naming_linter, self._empty_line_linter, self._space_linter, tokenized
+        )
+        self._mmap_scanner = MmapScanner(self._naming_linter, self._empty_line_linter, self._dialect.spaces)
+
+        # Ветвления по диалекту выполняются один раз здесь, а не на каждом файле
+        self._check_plan = self._build_check_plan(ordered=False)
+        self._ordered_check_plan = self._build_check_plan(ordered=True)
+
+        # Долгие строки у каждого файла свои, поэтому LineGuard оборачивает проверки на каждый файл (см. _get_checks)
+        self._line_guard = LineGuard(line_time_limit, skip_slow_lines) if line_time_limit is not None else None
+        self._profiler = profiler
+
+        if profiler and not self._line_guard:
+            self._check_plan = profiler.wrap_checks(self._check_plan)
+            self._ordered_check_plan = profiler.wrap_checks(self._ordered_check_plan)
+
+    @classmethod
+    def from_options(
+        cls, dialect_filename: str = "", options: LinterOptions = LinterOptions(), profiler: Profiler | None = None
+    ) -> "Linter":
+        """Создает Linter с опциями options"""
+        return cls(
+            dialect_filename,
+            fused=options.fused,
+            combined_spaces=options.combined_spaces,
+            tokenized=options.tokenized,
+            profiler=profiler,
+            line_time_limit=options.line_time_limit,
+            skip_slow_lines=options.skip_slow_lines,
+            numpy_backend=options.numpy_backend,
+        )
+
+    @property
+    def dialect(self) -> Dialect:
+        """Диалект, по которому работает линтер"""
+        return self._dialect
+
+    def seek_for_errors(self, lines: list[str], filename: str, max_errors: int | None = None) -> list[ErrorEntry]:
+        """
+        Использует seek_for_errors в каждом подлинтере и возвращает объединение их результатов.
+        При переданном max_errors возвращает только первые max_errors ошибок: проверки выполняются лениво
+        (даже при fused=True) и останавливаются, как только найдено столько ошибок
+        """
+
+        if max_errors is not None:
+            lines = self._prepare_lines(lines, classify=False)
+            return list(islice(iter_checks(self._get_checks(), lines, filename), max(max_errors, 0)))
+
+        return self._seek_in_prepared(self._prepare_lines(lines), filename)
+
+    def seek_for_errors_in_batch(self, files: Sequence[tuple[list[str], str]]) -> list[list[ErrorEntry]]:
+        """
+        Ищет ошибки в нескольких файлах (пары строки, имя) и возвращает их ошибки в порядке files.
+        При numpy_backend=True строки всех файлов классифицируются вместе, за один проход по общему буферу
+        """
+
+        code_lines = [mask_code_lines(lines) if self._tokenized else lines for lines, _ in files]
+        classified = (
+            classify_batch(code_lines) if self._numpy_backend else [classify_lines(lines) for lines in code_lines]
+        )
+
+        return [self._seek_in_prepared(lines, filename) for lines, (_, filename) in zip(classified, files)]
+
+    def seek_for_errors_in_buffer(self, buffer: Buffer, filename: str) -> list[ErrorEntry]:
+        """
+        Ищет ошибки в байтах файла (обычно отображенного в память через map_file), не разбивая его на строки целиком.
+        Работает через MmapScanner, поэтому опции fused, combined_spaces и tokenized не учитываются.
+        Профилировщик замеряет проход MmapScanner целиком (см. Profiler.measure)
+        """
+
+        if not self._profiler:
+            return self._mmap_scanner.seek_for_errors(buffer, filename)
+
+        with self._profiler.measure("MmapScanner.seek_for_errors"):
+            return self._mmap_scanner.seek_for_errors(buffer, filename)
+
+    def iter_errors(self, lines: list[str], filename: str, ordered: bool = False) -> Iterator[ErrorEntry]:
+        """
+        Лениво выдает те же ошибки, что и seek_for_errors: по проверкам или, при ordered=True, по строкам и столбцам.
+        Проверки запускаются по мере чтения ошибок, так что прерванный обход не проверяет остаток файла.
+        Всегда работает через построчные проверки подлинтеров, даже при fused=True
+        """
+
+        lines = self._prepare_lines(lines, classify=False)
 
-    def seek_for_errors(self, lines: list[str], filename: str) -> list[ErrorEntry]:
-        """Использует seek_for_errors в каждом подлинтере и возвращает объединение их результатов"""
-        errors = []
-        errors.extend(self._naming_linter.seek_for_errors(lines, filename))
-        errors.extend(self._empty_line_linter.seek_for_errors(lines, filename))
-        errors.extend(self._space_linter.seek_for_errors(lines, filename))
-        return errors
+        return iter_checks(self._get_checks(ordered), lines, filename, ordered)
+
+    def seek_for_changed_errors(self, lines: list[str], filename: str, changed: ChangedLines) -> list[ErrorEntry]:
+        """
+        Возвращает ошибки seek_for_errors на строках changed; ошибки пустых строк - если изменен их блок
+        (см. IncrementalLinter.lint_changed). Построчные проверки выполняются только для строк changed
+        """
+        return self._incremental_linter.lint_changed(lines, filename, changed)
+
+    def lint_incremental(self, lines: list[str], filename: str) -> IncrementalState:
+        """
+        Проверяет файл так, чтобы после его правки можно было перепроверить только измененные строки через relint.
+        Ошибки - в state.errors, в том же порядке, что и у seek_for_errors
+        """
+        return self._incremental_linter.lint(lines, filename)
+
+    def relint(self, state: IncrementalState, lines: list[str], changes: Iterable[LineChange]) -> IncrementalState:
+        """Перепроверяет файл после правок changes (см. IncrementalLinter.relint)"""
+        return self._incremental_linter.relint(state, lines, changes)
+
+    def _prepare_lines(self, lines: list[str], classify: bool = True) -> list[str]:
+        """
+        Готовит строки к проверкам: при tokenized=True заменяет литералы и комментарии, затем классифицирует
+        строки один раз на файл, чтобы проверки пропускали строки, в которых ничего не найдут (см. ClassifiedLines).
+        Ленивые обходы передают classify=False: классификация читает весь файл сразу, а без нее проверки
+        просто смотрят все строки
+        """
+
+        if self._tokenized:
+            lines = mask_code_lines(lines)
+
+        if not classify:
+            return lines
+
+        return classify_lines_numpy(lines) if self._numpy_backend else classify_lines(lines)
+
+    def _seek_in_prepared(self, lines: list[str], filename: str) -> list[ErrorEntry]:
+        """
+        Выполняет все проверки на строках, подготовленных _prepare_lines. Проход FusedLinter не делится на проверки,
+        поэтому профилировщик замеряет его целиком (см. Profiler.measure)
+        """
+
+        if self._fused_linter:
+            if not self._profiler:
+                return self._fused_linter.seek_for_errors(lines, filename)
+
+            with self._profiler.measure("FusedLinter.seek_for_errors"):
+                return self._fused_linter.seek_for_errors(lines, filename)
+
+        return list(iter_checks(self._get_checks(), lines, filename))
+
+    def _get_checks(self, ordered: bool = False) -> tuple[Check, ...]:
+        """
+        Возвращает проверки для одного файла. С line_time_limit построчные проверки оборачиваются LineGuard'ом
+        заново, с новым набором долгих строк, а профилировщик оборачивает уже их
+        """
+
+        checks = self._ordered_check_plan if ordered else self._check_plan
+
+        if self._line_guard:
+            checks = self._line_guard.wrap_checks(checks)
+
+            if self._profiler:
+                checks = self._profiler.wrap_checks(checks)
+
+        return checks
+
+    def _build_check_plan(self, ordered: bool) -> tuple[Check, ...]:
+        """Собирает проверки всех подлинтеров в порядке seek_for_errors"""
+        return (
+            self._naming_linter.get_checks(ordered)
+            + self._empty_line_linter.get_checks(ordered)
+            + self._space_linter.get_checks(ordered)
+        )
 
     def _get_dialect(self, dialect_filename: str) -> Dialect:
         """
@@ -97,3 +311,28 @@ class Linter:
         )
 
         return Dialect(naming=naming, spaces=spaces, empty_lines=empty_lines)
+
+
+def load_linter(dialect_filename: str = "", options: LinterOptions = LinterOptions()) -> Linter:
+    """
+    Возвращает Linter для файла диалекта и опций options, собирая его только при первом обращении или после
+    изменения файла
+    """
+
+    if not dialect_filename:
+        return _load_linter("", None, options)
+
+    path = os.path.abspath(dialect_filename)
+
+    try:
+        mtime: int | None = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime = None
+
+    return _load_linter(path, mtime, options)
+
+
+@lru_cache(maxsize=16)
+def _load_linter(path: str, mtime: int | None, options: LinterOptions) -> Linter:
+    """Собирает Linter; mtime входит в ключ кэша, чтобы измененный диалект читался заново"""
+    return Linter.from_options(path, options)
@@ -0,0 +1,416 @@
+import argparse
+import json
+import sys
+import threading
+import time
+from typing import IO, Any, Callable
+
+from java_linter import __version__
+from java_linter.incremental import IncrementalState, LineChange
+from java_linter.linter import Linter, LinterOptions, load_linter
+from java_linter.shared import ErrorEntry, split_lines
+
+# Способы синхронизации документа из спецификации LSP
+TEXT_DOCUMENT_SYNC_INCREMENTAL = 2
+
+DIAGNOSTIC_SEVERITY_WARNING = 2
+
+DEFAULT_DEBOUNCE = 0.3
+
+
+def utf16_to_index(line: str, offset: int) -> int:
+    """Переводит позицию в строке из единиц UTF-16 (как в LSP) в индекс символа Python"""
+
+    if line.isascii():
+        return min(offset, len(line))
+
+    units = 0
+
+    for index, char in enumerate(line):
+        if units >= offset:
+            return index
+
+        units += 2 if ord(char) > 0xFFFF else 1
+
+    return len(line)
+
+
+def index_to_utf16(line: str, index: int) -> int:
+    """Переводит индекс символа Python в позицию в единицах UTF-16"""
+
+    prefix = line[:index]
+
+    if prefix.isascii():
+        return index
+
+    return index + sum(1 for char in prefix if ord(char) > 0xFFFF)
+
+
+class TextDocument:
+    """
+    Открытый в редакторе документ: строки хранятся в памяти и меняются на месте по инкрементальным изменениям.
+    changes - правки строк с последней проверки, state - ее результат для перепроверки только измененных строк
+    """
+
+    def __init__(self, uri: str, text: str, version: int = 0):
+        self.uri = uri
+        self.version = version
+        self.lines = split_lines(text)
+        self.changes: list[LineChange] = []
+        self.state: IncrementalState | None = None
+
+    def apply_change(self, change: dict[str, Any]) -> LineChange:
+        """
+        Применяет одно изменение из didChange и запоминает его в changes. Без range заменяется весь текст,
+        иначе пересобираются только строки с начала до конца диапазона
+        """
+
+        if "range" not in change:
+            old_end = len(self.lines)
+            self.lines = split_lines(change["text"])
+            self.changes.append(LineChange(start=0, old_end=old_end, new_end=len(self.lines)))
+            return self.changes[-1]
+
+        start = change["range"]["start"]
+        end = change["range"]["end"]
+        lines = self.lines
+
+        start_line = min(start["line"], len(lines))
+        end_line = min(max(end["line"], start_line), len(lines))
+
+        # Позиция на строке после последнего перевода строки ссылается на пустую, еще не существующую строку
+        first = lines[start_line] if start_line < len(lines) else ""
+        last = lines[end_line] if end_line < len(lines) else ""
+
+        head = first[: utf16_to_index(first.rstrip("\n"), start["character"])]
+        tail = last[utf16_to_index(last.rstrip("\n"), end["character"]) :]
+
+        new_lines = split_lines(head + change["text"] + tail)
+        line_change = LineChange(
+            start=start_line, old_end=min(end_line + 1, len(lines)), new_end=start_line + len(new_lines)
+        )
+        lines[start_line : end_line + 1] = new_lines
+        self.changes.append(line_change)
+
+        return line_change
+
+
+class _Debouncer:
+    """
+    Вызывает callback для ключа, когда с последнего schedule этого ключа прошло delay секунд.
+    Все вызовы делаются одним фоновым потоком, поэтому серия нажатий клавиш дает одну перепроверку
+    """
+
+    def __init__(self, delay: float, callback: Callable[[str], None]):
+        self._delay = delay
+        self._callback = callback
+        self._deadlines: dict[str, float] = {}
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def schedule(self, key: str) -> None:
+        with self._condition:
+            self._deadlines[key] = time.monotonic() + self._delay
+            self._condition.notify()
+
+    def cancel(self, key: str) -> None:
+        with self._condition:
+            self._deadlines.pop(key, None)
+
+    def stop(self) -> None:
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._stopped:
+                    now = time.monotonic()
+                    due = [key for key, deadline in self._deadlines.items() if deadline <= now]
+
+                    if due:
+                        break
+
+                    timeout = min(self._deadlines.values()) - now if self._deadlines else None
+                    self._condition.wait(timeout)
+
+                if self._stopped:
+                    return
+
+                for key in due:
+                    del self._deadlines[key]
+
+            for key in due:
+                self._callback(key)
+
+
+class LanguageServer:
+    """
+    LSP-сервер линтера поверх потоков ввода и вывода (обычно stdin/stdout).
+    Поддерживает инкрементальную синхронизацию документов: строки документа хранятся в памяти и меняются
+    по диапазонам из didChange, а проверка запускается после паузы в изменениях в debounce секунд.
+    Ошибки ErrorEntry публикуются как diagnostics с уровнем warning
+    """
+
+    def __init__(
+        self,
+        reader: IO[bytes],
+        writer: IO[bytes],
+        dialect_filename: str = "",
+        debounce: float = DEFAULT_DEBOUNCE,
+        linter_options: LinterOptions = LinterOptions(),
+    ):
+        self._reader = reader
+        self._writer = writer
+        self._write_lock = threading.Lock()
+        self._documents_lock = threading.Lock()
+        self._lint_lock = threading.Lock()
+        self._documents: dict[str, TextDocument] = {}
+        self._linter_options = linter_options
+        self._linter: Linter = load_linter(dialect_filename, linter_options)
+        self._debouncer = _Debouncer(debounce, self._lint_document)
+        self._shutdown_requested = False
+
+        self._handlers: dict[str, Callable[[dict[str, Any]], Any]] = {
+            "initialize": self._initialize,
+            "shutdown": self._shutdown,
+            "textDocument/didOpen": self._did_open,
+            "textDocument/didChange": self._did_change,
+            "textDocument/didSave": self._did_save,
+            "textDocument/didClose": self._did_close,
+        }
+
+    def serve(self) -> int:
+        """Обрабатывает сообщения до exit или конца ввода; возвращает код выхода процесса"""
+
+        try:
+            while (message := read_message(self._reader)) is not None:
+                if message.get("method") == "exit":
+                    return 0 if self._shutdown_requested else 1
+
+                self._handle(message)
+        finally:
+            self._debouncer.stop()
+
+        return 0 if self._shutdown_requested else 1
+
+    def _handle(self, message: dict[str, Any]) -> None:
+        """Вызывает обработчик метода; на запросы (с id) отправляет ответ или ошибку"""
+
+        method = message.get("method")
+        handler = self._handlers.get(method) if method else None
+
+        if "id" not in message:
+            if handler:
+                handler(message.get("params") or {})
+            return
+
+        if handler is None:
+            self._send({"jsonrpc": "2.0", "id": message["id"], "error": {"code": -32601, "message": f"{method}"}})
+            return
+
+        try:
+            result = handler(message.get("params") or {})
+        except Exception as e:
+            self._send({"jsonrpc": "2.0", "id": message["id"], "error": {"code": -32603, "message": str(e)}})
+            return
+
+        self._send({"jsonrpc": "2.0", "id": message["id"], "result": result})
+
+    def _initialize(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Файл диалекта можно передать в initializationOptions.dialect"""
+
+        dialect_filename = (params.get("initializationOptions") or {}).get("dialect")
+
+        if dialect_filename:
+            with self._lint_lock:
+                self._linter = load_linter(dialect_filename, self._linter_options)
+
+                # Сохраненные результаты относятся к прежнему диалекту
+                with self._documents_lock:
+                    for document in self._documents.values():
+                        document.state = None
+
+        return {
+            "capabilities": {
+                "textDocumentSync": {"openClose": True, "change": TEXT_DOCUMENT_SYNC_INCREMENTAL, "save": True}
+            },
+            "serverInfo": {"name": "java_linter", "version": __version__},
+        }
+
+    def _shutdown(self, params: dict[str, Any]) -> None:
+        self._shutdown_requested = True
+
+    def _did_open(self, params: dict[str, Any]) -> None:
+        item = params["textDocument"]
+
+        with self._documents_lock:
+            self._documents[item["uri"]] = TextDocument(item["uri"], item["text"], item.get("version", 0))
+
+        self._lint_document(item["uri"])
+
+    def _did_change(self, params: dict[str, Any]) -> None:
+        uri = params["textDocument"]["uri"]
+
+        with self._documents_lock:
+            document = self._documents.get(uri)
+
+            if document is None:
+                return
+
+            for change in params["contentChanges"]:
+                document.apply_change(change)
+
+            document.version = params["textDocument"].get("version", document.version)
+
+        self._debouncer.schedule(uri)
+
+    def _did_save(self, params: dict[str, Any]) -> None:
+        uri = params["textDocument"]["uri"]
+
+        self._debouncer.cancel(uri)
+        self._lint_document(uri)
+
+    def _did_close(self, params: dict[str, Any]) -> None:
+        uri = params["textDocument"]["uri"]
+
+        with self._documents_lock:
+            self._documents.pop(uri, None)
+
+        self._debouncer.cancel(uri)
+        self._publish(uri, None, [])
+
+    def _lint_document(self, uri: str) -> None:
+        """
+        Проверяет снимок строк документа и публикует diagnostics. После первой проверки перепроверяются только
+        строки, измененные с прошлой (см. Linter.relint)
+        """
+
+        with self._lint_lock:
+            with self._documents_lock:
+                document = self._documents.get(uri)
+
+                if document is None:
+                    return
+
+                lines = list(document.lines)
+                version = document.version
+                changes = document.changes
+                document.changes = []
+                state = document.state
+
+            try:
+                if state is None:
+                    state = self._linter.lint_incremental(lines, uri)
+                else:
+                    state = self._linter.relint(state, lines, changes)
+            except Exception as e:
+                # Ошибка проверки не должна останавливать сервер; прошлые diagnostics остаются в редакторе,
+                # а следующая проверка будет полной
+                print(f"Ошибка при проверке {uri}: {e!r}", file=sys.stderr)
+                document.state = None
+                return
+
+            document.state = state
+
+        self._publish(uri, version, [self._to_diagnostic(error, lines) for error in state.errors])
+
+    def _to_diagnostic(self, error: ErrorEntry, lines: list[str]) -> dict[str, Any]:
+        """Переводит ErrorEntry (строки и столбцы с единицы, в символах) в diagnostic (с нуля, в единицах UTF-16)"""
+
+        line = max(error.line - 1, 0)
+        text = lines[line] if line < len(lines) else ""
+        character = index_to_utf16(text, max(error.column - 1, 0))
+
+        return {
+            "range": {
+                "start": {"line": line, "character": character},
+                "end": {"line": line, "character": character + 1},
+            },
+            "severity": DIAGNOSTIC_SEVERITY_WARNING,
+            "source": "java_linter",
+            "message": error.message,
+        }
+
+    def _publish(self, uri: str, version: int | None, diagnostics: list[dict[str, Any]]) -> None:
+        params: dict[str, Any] = {"uri": uri, "diagnostics": diagnostics}
+
+        if version is not None:
+            params["version"] = version
+
+        self._send({"jsonrpc": "2.0", "method": "textDocument/publishDiagnostics", "params": params})
+
+    def _send(self, message: dict[str, Any]) -> None:
+        with self._write_lock:
+            write_message(self._writer, message)
+
+
+def read_message(reader: IO[bytes]) -> dict[str, Any] | None:
+    """Читает сообщение JSON-RPC с заголовком Content-Length; в конце ввода возвращает None"""
+
+    length = None
+
+    while True:
+        header = reader.readline()
+
+        if not header:
+            return None
+
+        header = header.strip()
+
+        if not header:
+            break
+
+        name, _, value = header.decode("ascii").partition(":")
+
+        if name.strip().lower() == "content-length":
+            length = int(value)
+
+    if length is None:
+        return None
+
+    message: dict[str, Any] = json.loads(reader.read(length))
+    return message
+
+
+def write_message(writer: IO[bytes], message: dict[str, Any]) -> None:
+    """Пишет сообщение JSON-RPC с заголовком Content-Length"""
+
+    body = json.dumps(message, ensure_ascii=False).encode("utf-8")
+    writer.write(f"Content-Length: {len(body)}\r\n\r\n".encode("ascii") + body)
+    writer.flush()
+
+
+def main() -> None:
+    """Запускает LSP-сервер на stdin/stdout"""
+
+    parser = argparse.ArgumentParser(prog="python -m java_linter.lsp_server")
+    parser.add_argument("--dialect", default="")
+    parser.add_argument("--debounce", type=float, default=DEFAULT_DEBOUNCE)
+    parser.add_argument("--fused", action="store_true")
+    parser.add_argument("--combined-spaces", action="store_true")
+    parser.add_argument("--tokenized", action="store_true")
+    args = parser.parse_args(sys.argv[1:])
+
+    # stdout занят протоколом, поэтому сообщения линтера (например, о ненайденном диалекте) уходят в stderr
+    writer = sys.stdout.buffer
+    sys.stdout = sys.stderr
+
+    server = LanguageServer(
+        sys.stdin.buffer,
+        writer,
+        args.dialect,
+        args.debounce,
+        LinterOptions(fused=args.fused, combined_spaces=args.combined_spaces, tokenized=args.tokenized),
+    )
+
+    sys.exit(server.serve())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+from enum import IntEnum
+
+
+class MessageCode(IntEnum):
+    """Код сообщения об ошибке; текст сообщения на нужном языке берется из MESSAGES"""
+
+    CLASS_SNAKE_CASE_REQUIRED = 1
+    CLASS_SNAKE_CASE_FORBIDDEN = 2
+    CLASS_CAPITAL_REQUIRED = 3
+    CLASS_LOWER_REQUIRED = 4
+    METHOD_SNAKE_CASE_REQUIRED = 5
+    METHOD_SNAKE_CASE_FORBIDDEN = 6
+    METHOD_CAPITAL_REQUIRED = 7
+    METHOD_LOWER_REQUIRED = 8
+    VARIABLE_SNAKE_CASE_REQUIRED = 9
+    VARIABLE_SNAKE_CASE_FORBIDDEN = 10
+    VARIABLE_CAPITAL_REQUIRED = 11
+    VARIABLE_LOWER_REQUIRED = 12
+
+    CONSECUTIVE_EMPTY_LINES = 20
+    EMPTY_LINES_AFTER_CLASS = 21
+    EMPTY_LINES_AFTER_METHOD = 22
+
+    SPACE_AFTER_COMMA = 40
+    SPACE_BEFORE_COMMA = 41
+    SPACE_BEFORE_OPEN_BRACKET = 42
+    SPACE_AFTER_OPEN_BRACKET = 43
+    SPACE_BEFORE_CLOSE_BRACKET = 44
+    SPACE_AFTER_CLOSE_BRACKET = 45
+    SPACE_BEFORE_BRACE = 46
+    SPACE_AROUND_OPERATOR = 47
+    SPACE_BEFORE_DOT_COMMA = 48
+    SPACE_BEFORE_DOT = 49
+    SPACE_AFTER_DOT = 50
+    MORE_THAN_ONE_SPACE = 51
+
+    SLOW_LINE = 60
+
+
+DEFAULT_LANGUAGE = "ru"
+
+_SUBJECTS = {
+    "ru": {"CLASS": "классов", "METHOD": "методов", "VARIABLE": "переменных"},
+    "en": {"CLASS": "Class", "METHOD": "Method", "VARIABLE": "Variable"},
+}
+
+_NAMING_TEMPLATES = {
+    "ru": {
+        "SNAKE_CASE_REQUIRED": "Имена {} должны быть в snake_case",
+        "SNAKE_CASE_FORBIDDEN": "Имена {} не должны быть в snake_case",
+        "CAPITAL_REQUIRED": "Имена {} должны начинаться с заглавной буквы",
+        "LOWER_REQUIRED": "Имена {} должны начинаться со строчной буквы",
+    },
+    "en": {
+        "SNAKE_CASE_REQUIRED": "{} names must be in snake_case",
+        "SNAKE_CASE_FORBIDDEN": "{} names must not be in snake_case",
+        "CAPITAL_REQUIRED": "{} names must start with an uppercase letter",
+        "LOWER_REQUIRED": "{} names must start with a lowercase letter",
+    },
+}
+
+
+def _naming_messages(language: str) -> dict[MessageCode, str]:
+    """Сообщения проверок имен: по одному на пару (вид имени, правило)"""
+    return {
+        MessageCode[f"{subject}_{rule}"]: template.format(subject_text)
+        for subject, subject_text in _SUBJECTS[language].items()
+        for rule, template in _NAMING_TEMPLATES[language].items()
+    }
+
+
+# Каталоги сообщений; {0} и {1} - первый и второй параметр ошибки
+MESSAGES: dict[str, dict[MessageCode, str]] = {
+    "ru": {
+        **_naming_messages("ru"),
+        MessageCode.CONSECUTIVE_EMPTY_LINES: (
+            "Обнаружено {0} последовательных пустых строк, а должно быть не больше {1}"
+        ),
+        MessageCode.EMPTY_LINES_AFTER_CLASS: "Обнаружено {0} пустых строк после класса, а должно быть {1}",
+        MessageCode.EMPTY_LINES_AFTER_METHOD: "Обнаружено {0} пустых строк после метода, а должно быть {1}",
+        MessageCode.SPACE_AFTER_COMMA: "После запятой должен быть пробел",
+        MessageCode.SPACE_BEFORE_COMMA: "Не должно быть пробелов перед запятой",
+        MessageCode.SPACE_BEFORE_OPEN_BRACKET: "Перед открывающейся скобкой не должно быть пробела",
+        MessageCode.SPACE_AFTER_OPEN_BRACKET: "После открывающейся скобкой не должно быть пробела",
+        MessageCode.SPACE_BEFORE_CLOSE_BRACKET: "Перед закрывающейся скобкой не должно быть пробела",
+        MessageCode.SPACE_AFTER_CLOSE_BRACKET: "После закрывающейся скобки должен быть пробел",
+        MessageCode.SPACE_BEFORE_BRACE: "Перед открывающей фигурной скобкой должен быть пробел",
+        MessageCode.SPACE_AROUND_OPERATOR: "Операторы должны быть окружены пробелами",
+        MessageCode.SPACE_BEFORE_DOT_COMMA: "Не должно быть пробелов перед точкой с запятой",
+        MessageCode.SPACE_BEFORE_DOT: "Не должно быть пробелов перед точкой",
+        MessageCode.SPACE_AFTER_DOT: "После точки не должен быть пробел",
+        MessageCode.MORE_THAN_ONE_SPACE: "Не должно быть более одного пробела подряд внутри строки",
+        MessageCode.SLOW_LINE: "Проверка строки заняла {0} мс, а должна занимать не больше {1}",
+    },
+    "en": {
+        **_naming_messages("en"),
+        MessageCode.CONSECUTIVE_EMPTY_LINES: "Found {0} consecutive empty lines, expected at most {1}",
+        MessageCode.EMPTY_LINES_AFTER_CLASS: "Found {0} empty lines after class, expected {1}",
+        MessageCode.EMPTY_LINES_AFTER_METHOD: "Found {0} empty lines after method, expected {1}",
+        MessageCode.SPACE_AFTER_COMMA: "Missing space after comma",
+        MessageCode.SPACE_BEFORE_COMMA: "Unexpected space before comma",
+        MessageCode.SPACE_BEFORE_OPEN_BRACKET: "Unexpected space before opening parenthesis",
+        MessageCode.SPACE_AFTER_OPEN_BRACKET: "Unexpected space after opening parenthesis",
+        MessageCode.SPACE_BEFORE_CLOSE_BRACKET: "Unexpected space before closing parenthesis",
+        MessageCode.SPACE_AFTER_CLOSE_BRACKET: "Missing space after closing parenthesis",
+        MessageCode.SPACE_BEFORE_BRACE: "Missing space before opening brace",
+        MessageCode.SPACE_AROUND_OPERATOR: "Operators must be surrounded by spaces",
+        MessageCode.SPACE_BEFORE_DOT_COMMA: "Unexpected space before semicolon",
+        MessageCode.SPACE_BEFORE_DOT: "Unexpected space before dot",
+        MessageCode.SPACE_AFTER_DOT: "Unexpected space after dot",
+        MessageCode.MORE_THAN_ONE_SPACE: "Unexpected run of spaces inside a line",
+        MessageCode.SLOW_LINE: "Line check took {0} ms, expected at most {1}",
+    },
+}
+
+LANGUAGES = tuple(MESSAGES)
+
+# Коды сообщений с параметрами; у всех таких сообщений ровно два параметра: найденное и допустимое значение
+PARAMETRIZED_CODES = frozenset(code for code, message in MESSAGES[DEFAULT_LANGUAGE].items() if "{0}" in message)
+
+
+def render_message(code: MessageCode, params: tuple[int, ...] = (), language: str = DEFAULT_LANGUAGE) -> str:
+    """Собирает текст сообщения code с параметрами params на языке language"""
+
+    template = MESSAGES[language][code]
+
+    return template.format(*params) if params else template
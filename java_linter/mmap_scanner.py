@@ -0,0 +1,262 @@
+import heapq
+import mmap
+import re
+from contextlib import contextmanager
+from typing import Iterator, NamedTuple
+
+from java_linter import space_rules
+from java_linter.dialects import SpaceDialect
+from java_linter.empty_lines_liner import EmptyLineLinter
+from java_linter.fused_linter import FusedLinter
+from java_linter.messages import MessageCode
+from java_linter.naming_linter import NamingLinter
+from java_linter.shared import ErrorEntry
+from java_linter.space_rules import BRACKET_KEYWORDS, OPERATORS_CHECK, SPACE_RULES, SpaceRule, enabled_checks
+
+Buffer = bytes | mmap.mmap
+
+# Пробельный символ внутри строки: перевод строки (в том числе "\r\n") в bytes-выражениях обрабатывается отдельно
+_INLINE_SPACE = rb"(?:[^\S\r\n]|\r(?!\n))"
+
+# Символ слова с учетом не-ASCII букв: все байты многобайтовых символов UTF-8 не меньше 0x80
+_WORD = rb"[\w\x80-\xff]"
+
+# Непробельный символ целиком, чтобы совпадение не начиналось с середины многобайтового символа UTF-8
+_NOT_SPACE = rb"(?:[^\s\x80-\xff]|[\xc0-\xff][\x80-\xbf]*)"
+
+_BRACKET_KEYWORDS = tuple(keyword.encode("ascii") for keyword in BRACKET_KEYWORDS)
+
+_CHUNK_SIZE = 1 << 20
+
+
+class _Rule(NamedTuple):
+    """
+    bytes-выражение правила SpaceLinter из SPACE_RULES.
+    Столбец ошибки - номер символа group в строке плюс shift, как в соответствующей построчной проверке
+    """
+
+    pattern: re.Pattern[bytes]
+    group: int
+    shift: int
+    code: MessageCode
+
+
+def _bytes_class(match: re.Match[bytes]) -> bytes:
+    """
+    Заменяет класс символов выражения построчной проверки на bytes-аналог. Построчная проверка видит перевод строки
+    только в конце строки, поэтому \\s в конце выражения может совпасть и с переводом строки, а в середине - нет
+    """
+
+    token = match.group()
+    is_last = match.end() == len(match.string)
+
+    if token == rb"\s+" and is_last:
+        return rb"(?:" + _INLINE_SPACE + rb"+(?:\r?\n)?|\r?\n)"
+
+    if token == rb"\s" and is_last:
+        return rb"(?:" + _INLINE_SPACE + rb"|\r?\n)"
+
+    char_class = {rb"\s": _INLINE_SPACE, rb"\S": _NOT_SPACE, rb"\w": _WORD}[token[:2]]
+    return char_class + token[2:]
+
+
+def _rule(space_rule: SpaceRule) -> _Rule:
+    """Переводит выражение правила на bytes"""
+
+    pattern = re.sub(rb"\\[sSw]\+?", _bytes_class, space_rule.pattern.pattern.encode("ascii"))
+    return _Rule(pattern=re.compile(pattern), group=space_rule.group, shift=space_rule.shift, code=space_rule.code)
+
+
+_RULES = tuple(_rule(space_rule) for space_rule in SPACE_RULES)
+
+# Правила каждой проверки SpaceLinter по ее номеру
+_CHECK_RULES = {
+    check: tuple(rule for rule, space_rule in zip(_RULES, SPACE_RULES) if space_rule.check == check)
+    for check in {space_rule.check for space_rule in SPACE_RULES}
+}
+
+_BEFORE_OPEN_BRACKET = _RULES[SPACE_RULES.index(space_rules.BEFORE_OPEN_BRACKET)]
+_OPERATOR = _RULES[SPACE_RULES.index(space_rules.OPERATOR)]
+_MANY_SPACES = _RULES[SPACE_RULES.index(space_rules.MANY_SPACES)]
+
+
+class MappedLines:
+    """
+    Строки файла, отображенного в память, которые декодируются по одной при обходе.
+    Перевод строки "\\r\\n" заменяется на "\\n", как при чтении файла в текстовом режиме
+    """
+
+    def __init__(self, buffer: Buffer, encoding: str = "utf-8"):
+        self._buffer = buffer
+        self._encoding = encoding
+
+    def __iter__(self) -> Iterator[str]:
+        buffer = self._buffer
+        size = len(buffer)
+        start = 0
+
+        while start < size:
+            end = buffer.find(b"\n", start)
+            end = size if end == -1 else end + 1
+
+            line = buffer[start:end].decode(self._encoding, "replace")
+
+            if line.endswith("\r\n"):
+                line = line[:-2] + "\n"
+
+            yield line
+            start = end
+
+
+class _LineTracker:
+    """Номер и начало строки для возрастающих позиций в буфере; переводы строк считаются кусками по _CHUNK_SIZE"""
+
+    def __init__(self, buffer: Buffer):
+        self._buffer = buffer
+        self._counted_until = 0
+        self.line_index = 0
+        self.line_start = 0
+
+    def move_to(self, position: int) -> None:
+        """Сдвигает line_index и line_start к строке, в которой находится position"""
+
+        buffer = self._buffer
+
+        while self._counted_until < position:
+            end = min(position, self._counted_until + _CHUNK_SIZE)
+            self.line_index += buffer[self._counted_until : end].count(b"\n")
+            self._counted_until = end
+
+        self.line_start = max(self.line_start, buffer.rfind(b"\n", self.line_start, position) + 1)
+
+
+class MmapScanner:
+    """
+    Линтер для файлов, отображенных в память через mmap, память которого не растет с размером файла.
+    Проверки имен и пустых строк выполняются FusedLinter'ом за один проход по лениво декодируемым строкам.
+    Проверки пробелов выполняются bytes-выражениями прямо по буферу, номер строки и столбец считаются только
+    для найденных ошибок. Пробелами считаются только ASCII-пробелы, а переводом строки - "\\n" и "\\r\\n"
+    """
+
+    def __init__(
+        self,
+        naming_linter: NamingLinter,
+        empty_line_linter: EmptyLineLinter,
+        dialect: SpaceDialect,
+        encoding: str = "utf-8",
+    ):
+        self._fused_linter = FusedLinter(naming_linter, empty_line_linter, None)
+        self._dialect = dialect
+        self._encoding = encoding
+
+    def seek_for_errors(self, buffer: Buffer, filename: str) -> list[ErrorEntry]:
+        """Ищет ошибки в содержимом файла buffer; ошибки идут в том же порядке, что и у Linter.seek_for_errors"""
+
+        errors = self._fused_linter.seek_for_errors(MappedLines(buffer, self._encoding), filename)
+
+        for check, is_enabled in enumerate(enabled_checks(self._dialect)):
+            if not is_enabled:
+                continue
+
+            if check == OPERATORS_CHECK:
+                errors.extend(self._scan_operators(buffer, filename))
+            else:
+                errors.extend(self._scan(buffer, filename, _CHECK_RULES[check]))
+
+        return errors
+
+    def seek_for_errors_in_file(self, filename: str) -> list[ErrorEntry]:
+        """Отображает файл в память и ищет в нем ошибки"""
+
+        with map_file(filename) as buffer:
+            return self.seek_for_errors(buffer, filename)
+
+    def _scan(self, buffer: Buffer, filename: str, rules: tuple[_Rule, ...]) -> Iterator[ErrorEntry]:
+        """
+        Выдает ошибки правил rules одной проверки. Как и в построчной проверке, в каждой строке сначала идут
+        все ошибки первого правила, затем второго и т.д.
+        """
+
+        streams = [self._iter_rule(buffer, rule_number, rule) for rule_number, rule in enumerate(rules)]
+
+        for _, _, _, error in heapq.merge(*streams):
+            yield ErrorEntry(file_name=filename, line=error[0], column=error[1], code=error[2])
+
+    def _iter_rule(
+        self, buffer: Buffer, rule_number: int, rule: _Rule
+    ) -> Iterator[tuple[int, int, int, tuple[int, int, MessageCode]]]:
+        """Выдает (индекс строки, rule_number, позиция, (строка, столбец, код сообщения)) для совпадений правила"""
+
+        tracker = _LineTracker(buffer)
+
+        for match in rule.pattern.finditer(buffer):
+            if rule is _BEFORE_OPEN_BRACKET and match.group(1) in _BRACKET_KEYWORDS:
+                continue
+
+            if rule is _MANY_SPACES and not self._is_reported_run(buffer, match.end()):
+                continue
+
+            position = match.start(rule.group)
+            tracker.move_to(position)
+
+            column = self._char_index(buffer, tracker.line_start, position) + rule.shift
+            yield tracker.line_index, rule_number, position, (tracker.line_index + 1, column, rule.code)
+
+    def _scan_operators(self, buffer: Buffer, filename: str) -> Iterator[ErrorEntry]:
+        """Как и SpaceLinter, проверяет только первый оператор в каждой строке"""
+
+        tracker = _LineTracker(buffer)
+        size = len(buffer)
+        match = _OPERATOR.pattern.search(buffer)
+
+        while match:
+            start, end = match.span()
+            tracker.move_to(start)
+
+            line_end = buffer.find(b"\n", start)
+            line_end = size if line_end == -1 else line_end + 1
+
+            # Построчная проверка берет line[start - 1], то есть для оператора в начале строки - ее последний символ
+            before = buffer[start - 1 : start] if start > tracker.line_start else buffer[line_end - 1 : line_end]
+            after = buffer[end : end + 1]
+
+            if not (before.isspace() and after.isspace()):
+                column = self._char_index(buffer, tracker.line_start, start) + 1
+                yield ErrorEntry(file_name=filename, line=tracker.line_index + 1, column=column, code=_OPERATOR.code)
+
+            if line_end >= size:
+                break
+
+            match = _OPERATOR.pattern.search(buffer, line_end)
+
+    def _is_reported_run(self, buffer: Buffer, end: int) -> bool:
+        """
+        Серия пробелов - ошибка, если после нее не начинается комментарий.
+        Для серий в конце строки построчная проверка падает с IndexError, здесь они считаются ошибкой
+        """
+        return buffer[end : end + 1] != b"/" or buffer[end - 1 : end] == b"\n"
+
+    def _char_index(self, buffer: Buffer, line_start: int, position: int) -> int:
+        """Номер символа в строке для позиции в байтах; декодирует только строки с не-ASCII символами"""
+
+        prefix = buffer[line_start:position]
+
+        if prefix.isascii():
+            return len(prefix)
+
+        return len(prefix.decode(self._encoding, "replace"))
+
+
+@contextmanager
+def map_file(filename: str) -> Iterator[Buffer]:
+    """Отображает файл в память только для чтения; для пустого файла, который нельзя отобразить, выдает b\"\" """
+
+    with open(filename, "rb") as file:
+        try:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            yield b""
+            return
+
+        with buffer:
+            yield buffer
@@ -1,7 +1,12 @@
 import re
+from functools import cache, partial
+from typing import Callable, Iterator
 
+from java_linter.declarations import DeclarationKind, declaration_index
 from java_linter.dialects import Dialect, NamingRule
-from java_linter.shared import ErrorEntry, JavaPatterns
+from java_linter.line_classes import CLASS_HEADER_LINES, METHOD_HEADER_LINES, LineFilter, LineFlag
+from java_linter.messages import MessageCode
+from java_linter.shared import Check, ErrorEntry, JavaPatterns, LineCheck, VarMatch, iter_checks, iter_line_check
 
 
 class NamingLinter:
@@ -14,206 +19,191 @@ class NamingLinter:
 
     def seek_for_errors(self, lines: list[str], filename: str) -> list[ErrorEntry]:
         """Ищет ошибки в java файле и выдает их в виде списка ErrorEntry"""
-        errors: list[ErrorEntry] = []
-        errors.extend(self._check_class_names(lines, filename))
-        errors.extend(self._check_method_names(lines, filename))
-        errors.extend(self._check_var_names(lines, filename))
-        return errors
-
-    def _check_class_names(self, lines: list[str], filename: str) -> list[ErrorEntry]:
-        """Проверяет, правильно ли называются все классы"""
-
-        errors: list[ErrorEntry] = []
-
-        for i, line in enumerate(lines):
-            class_name_match = JavaPatterns.CLASS_PATTERN.search(line)
-
-            if class_name_match:
-                class_name = class_name_match.group(1)
-
-                if self._class_dialect == NamingRule.SNAKE_CASE:
-                    if not self._check_is_snake_case(class_name):
-                        errors.append(
-                            ErrorEntry(
-                                file_name=filename,
-                                line=i + 1,
-                                column=class_name_match.start(1) + 1,
-                                message="Имена классов должны быть в snake_case",
-                            )
-                        )
-
-                else:
-                    if "_" in class_name:
-                        print(class_name)
-                        errors.append(
-                            ErrorEntry(
-                                file_name=filename,
-                                line=i + 1,
-                                column=class_name_match.start(1) + 1,
-                                message="Имена классов не должны быть в snake_case",
-                            )
-                        )
-
-                if self._class_dialect == NamingRule.CAMEL_CASE_CAPITAL:
-                    if not class_name[0].isupper():
-                        errors.append(
-                            ErrorEntry(
-                                file_name=filename,
-                                line=i + 1,
-                                column=class_name_match.start(1) + 1,
-                                message="Имена классов должны начинаться с заглавной буквы",
-                            )
-                        )
-
-                elif self._class_dialect == NamingRule.CAMEL_CASE_LOWER:
-                    if not class_name[0].islower():
-                        errors.append(
-                            ErrorEntry(
-                                file_name=filename,
-                                line=i + 1,
-                                column=class_name_match.start(1) + 1,
-                                message="Имена классов должны начинаться со строчной буквы",
-                            )
-                        )
-
-        return errors
-
-    def _check_method_names(self, lines: list[str], filename: str) -> list[ErrorEntry]:
-        """Проверяет, правильно ли называются все методы"""
-        errors: list[ErrorEntry] = []
-
-        for i, line in enumerate(lines):
-
-            method_name_match = JavaPatterns.METHOD_PATTERN.search(line)
-
-            if method_name_match and "(" in line and ")" in line:
-                method_name = method_name_match.group(2)
-
-                if self._method_dialect == NamingRule.SNAKE_CASE:
-                    if not self._check_is_snake_case(method_name):
-                        errors.append(
-                            ErrorEntry(
-                                file_name=filename,
-                                line=i + 1,
-                                column=method_name_match.start(2) + 1,
-                                message="Имена методов должны быть в snake_case",
-                            )
-                        )
-
-                else:
-                    if "_" in method_name:
-                        errors.append(
-                            ErrorEntry(
-                                file_name=filename,
-                                line=i + 1,
-                                column=method_name_match.start(2) + 1,
-                                message="Имена методов не должны быть в snake_case",
-                            )
-                        )
-
-                if self._method_dialect == NamingRule.CAMEL_CASE_CAPITAL:
-                    if not method_name[0].isupper():
-                        errors.append(
-                            ErrorEntry(
-                                file_name=filename,
-                                line=i + 1,
-                                column=method_name_match.start(2) + 1,
-                                message="Имена методов должны начинаться с заглавной буквы",
-                            )
-                        )
-
-                elif self._method_dialect == NamingRule.CAMEL_CASE_LOWER:
-                    if not method_name[0].islower():
-                        errors.append(
-                            ErrorEntry(
-                                file_name=filename,
-                                line=i + 1,
-                                column=method_name_match.start(2) + 1,
-                                message="Имена методов должны начинаться со строчной буквы",
-                            )
-                        )
-
-        return errors
-
-    def _check_var_names(self, lines: list[str], filename: str) -> list[ErrorEntry]:
-        """Проверяет, правильно ли называются все переменные"""
+        return list(self.iter_errors(lines, filename))
+
+    def iter_errors(self, lines: list[str], filename: str, ordered: bool = False) -> Iterator[ErrorEntry]:
+        """Лениво выдает ошибки в порядке seek_for_errors или, при ordered=True, по строкам и столбцам"""
+        return iter_checks(self.get_checks(ordered), lines, filename, ordered)
+
+    def get_checks(self, ordered: bool = False) -> tuple[Check, ...]:
+        """
+        Возвращает проверки, которые выполняет seek_for_errors, в порядке их запуска.
+        Имена классов и методов берутся из индекса объявлений (см. _iter_declaration_names), имена переменных
+        проверяются построчно. Все проверки выдают ошибки по неубыванию строки и при ordered=False
+        """
+
+        var_check, var_filter = self.get_line_checks()[2], self.get_line_filters()[2]
+
+        return (
+            partial(self._iter_declaration_names, self._check_class_name_in_line, DeclarationKind.CLASS),
+            partial(self._iter_declaration_names, self._check_method_name_in_line, DeclarationKind.METHOD),
+            partial(iter_line_check, var_check, line_filter=var_filter),
+        )
+
+    def get_line_checks(self) -> tuple[LineCheck, ...]:
+        """Возвращает построчные варианты проверок в порядке их запуска"""
+        return (self._check_class_name_in_line, self._check_method_name_in_line, self._check_var_name_in_line)
+
+    def get_line_filters(self) -> tuple[LineFilter, ...]:
+        """
+        Возвращает для каждой проверки из get_line_checks строки, в которых она может найти ошибку: заголовок класса
+        начинается с модификатора или class/interface/enum, метод - со слова и содержит скобки, переменная - со
+        слова; у import и package тип - само это слово, а такие переменные не проверяются
+        """
+        return (CLASS_HEADER_LINES, METHOD_HEADER_LINES, LineFilter(LineFlag.WORD, forbidden=LineFlag.IMPORT))
+
+    def _iter_declaration_names(
+        self, line_check: LineCheck, kind: DeclarationKind, lines: list[str], filename: str
+    ) -> Iterator[ErrorEntry]:
+        """
+        Лениво выдает ошибки в именах объявлений вида kind из индекса объявлений файла. Если индекса нет (строки не
+        классифицированы), имена проверяются построчной проверкой line_check. Построчная проверка остается первым
+        аргументом partial в get_checks, так что check_name профилировщика не меняется
+        """
+
+        declarations = declaration_index(lines)
+
+        if declarations is None:
+            line_filter = CLASS_HEADER_LINES if kind == DeclarationKind.CLASS else METHOD_HEADER_LINES
+            yield from iter_line_check(line_check, lines, filename, line_filter)
+            return
+
+        if kind == DeclarationKind.CLASS:
+            rules = _compile_naming_rules(self._class_dialect, "CLASS")
+        else:
+            rules = _compile_naming_rules(self._method_dialect, "METHOD")
 
         errors: list[ErrorEntry] = []
 
-        for i, line in enumerate(lines):
-
-            variable_declaration_match = JavaPatterns.VAR_PATTERN.search(line)
-            if variable_declaration_match:
-
-                variable_name = variable_declaration_match.group(2)
-
-                if variable_declaration_match.group(1) not in (
-                    "class",
-                    "return",
-                    "for",
-                    "switch",
-                    "case",
-                    "if",
-                    "extends",
-                    "import",
-                    "package",
-                ):
-
-                    if self._var_dialect == NamingRule.SNAKE_CASE:
-                        if not self._check_is_snake_case(variable_name):
-                            errors.append(
-                                ErrorEntry(
-                                    file_name=filename,
-                                    line=i + 1,
-                                    column=variable_declaration_match.start(2) + 1,
-                                    message="Имена переменных должны быть в snake_case",
-                                )
-                            )
-
-                    else:
-                        if "_" in variable_name:
-                            errors.append(
-                                ErrorEntry(
-                                    file_name=filename,
-                                    line=i + 1,
-                                    column=variable_declaration_match.start(2) + 1,
-                                    message="Имена переменных не должны быть в snake_case",
-                                )
-                            )
-
-                    if self._var_dialect == NamingRule.CAMEL_CASE_CAPITAL:
-                        if not variable_name[0].isupper():
-                            errors.append(
-                                ErrorEntry(
-                                    file_name=filename,
-                                    line=i + 1,
-                                    column=variable_declaration_match.start(2) + 1,
-                                    message="Имена переменных должны начинаться с заглавной буквы",
-                                )
-                            )
-
-                    elif self._var_dialect == NamingRule.CAMEL_CASE_LOWER:
-
-                        if not variable_name[0].islower():
-                            errors.append(
-                                ErrorEntry(
-                                    file_name=filename,
-                                    line=i + 1,
-                                    column=variable_declaration_match.start(2) + 1,
-                                    message="Имена переменных должны начинаться со строчной буквы",
-                                )
-                            )
-
-        return errors
-
-    def _check_is_snake_case(self, name: str) -> bool:
-        """Проверяет, соответствует ли имя класса соглашению snake_case"""
-        name = name.strip()
-
-        if not re.fullmatch(r"^[a-z][a-z0-9_]*[a-z0-9]$", name):
-            return False
-
-        if "__" in name:
-            return False
-
-        return True
+        for declaration in declarations.of_kind(kind):
+            self._check_name(declaration.name, declaration.column, rules, declaration.header, filename, errors)
+
+            if errors:
+                yield from errors
+                errors.clear()
+
+    def _check_class_name_in_line(self, line: str, index: int, filename: str, errors: list[ErrorEntry]) -> None:
+        """Проверяет имя класса, объявленного в строке index, и дописывает ошибки в errors"""
+        self.check_class_name_match(JavaPatterns.CLASS_PATTERN.search(line), index, filename, errors)
+
+    def check_class_name_match(
+        self, class_name_match: re.Match[str] | None, index: int, filename: str, errors: list[ErrorEntry]
+    ) -> None:
+        """Проверяет имя класса из совпадения CLASS_PATTERN в строке index и дописывает ошибки в errors"""
+
+        if class_name_match:
+            self._check_name(
+                class_name_match.group(1),
+                class_name_match.start(1) + 1,
+                _compile_naming_rules(self._class_dialect, "CLASS"),
+                index,
+                filename,
+                errors,
+            )
+
+    def _check_method_name_in_line(self, line: str, index: int, filename: str, errors: list[ErrorEntry]) -> None:
+        """Проверяет имя метода, объявленного в строке index, и дописывает ошибки в errors"""
+        self.check_method_name_match(JavaPatterns.METHOD_PATTERN.search(line), line, index, filename, errors)
+
+    def check_method_name_match(
+        self, method_name_match: re.Match[str] | None, line: str, index: int, filename: str, errors: list[ErrorEntry]
+    ) -> None:
+        """Проверяет имя метода из совпадения METHOD_PATTERN в строке index и дописывает ошибки в errors"""
+
+        if method_name_match and "(" in line and ")" in line:
+            self._check_name(
+                method_name_match.group(2),
+                method_name_match.start(2) + 1,
+                _compile_naming_rules(self._method_dialect, "METHOD"),
+                index,
+                filename,
+                errors,
+            )
+
+    def _check_var_name_in_line(self, line: str, index: int, filename: str, errors: list[ErrorEntry]) -> None:
+        """Проверяет имя переменной, объявленной в строке index, и дописывает ошибки в errors"""
+        self.check_var_name_match(JavaPatterns.VAR_PATTERN.search(line), index, filename, errors)
+
+    def check_var_name_match(
+        self,
+        variable_declaration_match: re.Match[str] | VarMatch | None,
+        index: int,
+        filename: str,
+        errors: list[ErrorEntry],
+    ) -> None:
+        """Проверяет имя переменной из совпадения VAR_PATTERN в строке index и дописывает ошибки в errors"""
+
+        if variable_declaration_match:
+
+            variable_name = variable_declaration_match.group(2)
+
+            if variable_declaration_match.group(1) not in (
+                "class",
+                "return",
+                "for",
+                "switch",
+                "case",
+                "if",
+                "extends",
+                "import",
+                "package",
+            ):
+                self._check_name(
+                    variable_name,
+                    variable_declaration_match.start(2) + 1,
+                    _compile_naming_rules(self._var_dialect, "VARIABLE"),
+                    index,
+                    filename,
+                    errors,
+                )
+
+    def _check_name(
+        self,
+        name: str,
+        column: int,
+        rules: tuple[tuple[Callable[[str], bool], MessageCode], ...],
+        index: int,
+        filename: str,
+        errors: list[ErrorEntry],
+    ) -> None:
+        """Проверяет имя по скомпилированным правилам и дописывает ошибки нарушенных правил в errors"""
+
+        for is_violated, code in rules:
+            if is_violated(name):
+                errors.append(ErrorEntry(file_name=filename, line=index + 1, column=column, code=code))
+
+
+def _is_snake_case(name: str) -> bool:
+    """Проверяет, соответствует ли имя соглашению snake_case"""
+    name = name.strip()
+
+    if not re.fullmatch(r"^[a-z][a-z0-9_]*[a-z0-9]$", name):
+        return False
+
+    if "__" in name:
+        return False
+
+    return True
+
+
+@cache
+def _compile_naming_rules(rule: NamingRule, subject: str) -> tuple[tuple[Callable[[str], bool], MessageCode], ...]:
+    """
+    Превращает NamingRule в набор пар (проверка нарушения, код сообщения) для имен subject ("CLASS", "METHOD",
+    "VARIABLE"), чтобы не разбирать правило заново для каждого найденного имени
+    """
+
+    rules: list[tuple[Callable[[str], bool], MessageCode]] = []
+
+    if rule == NamingRule.SNAKE_CASE:
+        rules.append((lambda name: not _is_snake_case(name), MessageCode[f"{subject}_SNAKE_CASE_REQUIRED"]))
+    else:
+        rules.append((lambda name: "_" in name, MessageCode[f"{subject}_SNAKE_CASE_FORBIDDEN"]))
+
+    if rule == NamingRule.CAMEL_CASE_CAPITAL:
+        rules.append((lambda name: not name[0].isupper(), MessageCode[f"{subject}_CAPITAL_REQUIRED"]))
+
+    elif rule == NamingRule.CAMEL_CASE_LOWER:
+        rules.append((lambda name: not name[0].islower(), MessageCode[f"{subject}_LOWER_REQUIRED"]))
+
+    return tuple(rules)
@@ -0,0 +1,198 @@
+from functools import cache
+from itertools import chain
+from typing import Any, NamedTuple, Sequence
+
+from java_linter.line_classes import CHARACTER_FLAGS, DECLARATION_WORDS, ClassifiedLines, LineFlag, classify_line
+
+try:
+    import numpy
+except ImportError:
+    HAS_NUMPY = False
+else:
+    HAS_NUMPY = True
+
+# Строки, которые бэкенд не классифицирует сам, а передает classify_line: import и package проверяются выражением
+_FALLBACK_WORDS = ("import", "package")
+
+# Номер любого не-ASCII символа в таблицах символов; символы ASCII - под своими кодами
+_NON_ASCII = 128
+
+# Флаги символов (CHARACTER_FLAGS) - биты с 8-го, так что сдвинутые помещаются в 16 бит
+_CHAR_FLAGS_SHIFT = 8
+
+
+class NumpyUnavailableError(ImportError):
+    """numpy, нужный для numpy_backend, не установлен"""
+
+
+class LineArrays(NamedTuple):
+    """
+    Построчные величины для строк одного или нескольких файлов, посчитанные массивами numpy по одному буферу.
+    Смещения - номера символов в буфере, куда строки записаны подряд
+    """
+
+    starts: Any
+    ends: Any
+    flags: Any
+    # Изменение глубины фигурных скобок на каждой строке
+    depth_changes: Any
+
+
+class NumpyClassifiedLines(ClassifiedLines):
+    """ClassifiedLines, флаги которых посчитаны массивами numpy; индексы строк по фильтру тоже ищутся numpy"""
+
+    def __init__(self, lines: Sequence[str], flags: Any, depths: Any):
+        super().__init__(lines, flags=flags.tolist(), depths=depths.tolist())
+
+        self._flag_array = flags
+
+    def _find_indexes(self, required: int, forbidden: int) -> list[int]:
+        mask = self._flag_array & required == required
+
+        if forbidden:
+            mask &= self._flag_array & forbidden == 0
+
+        indexes: list[int] = numpy.flatnonzero(mask).tolist()
+
+        return indexes
+
+
+def require_numpy() -> None:
+    """Бросает NumpyUnavailableError, если numpy не установлен"""
+
+    if not HAS_NUMPY:
+        raise NumpyUnavailableError("Для numpy_backend нужен пакет numpy (pip install numpy)")
+
+
+def classify_lines_numpy(lines: Sequence[str]) -> ClassifiedLines:
+    """То же, что classify_lines, но флаги считаются массивами numpy (см. classify_batch)"""
+
+    if isinstance(lines, ClassifiedLines):
+        return lines
+
+    return classify_batch([lines])[0]
+
+
+def classify_batch(files: Sequence[Sequence[str]]) -> list[ClassifiedLines]:
+    """
+    Классифицирует строки нескольких файлов за один проход массивами numpy: все строки записываются в один буфер,
+    и флаги, пустота строк и глубина скобок считаются операциями над массивами, а не циклом по строкам
+    """
+
+    require_numpy()
+
+    all_lines = list(chain.from_iterable(files))
+    arrays = line_arrays(all_lines)
+    depths = numpy.cumsum(arrays.depth_changes)
+    result: list[ClassifiedLines] = []
+    first = 0
+
+    for lines in files:
+        last = first + len(lines)
+        # Глубина каждого файла считается от нуля
+        before = depths[first - 1] if first else 0
+        result.append(NumpyClassifiedLines(lines, arrays.flags[first:last], depths[first:last] - before))
+        first = last
+
+    return result
+
+
+def line_arrays(lines: Sequence[str]) -> LineArrays:
+    """
+    Считает LineArrays для строк lines. Буфер хранит по элементу на символ (байт для ASCII-текста, иначе код UTF-32),
+    так что смещения в нем совпадают с номерами символов в строках. Флаги строк с не-ASCII символом там, где от него
+    зависит классификация (в начале строки или сразу после первого слова, если оно начинается с ключевого слова), и
+    строк import и package считаются classify_line
+    """
+
+    require_numpy()
+
+    flag_table, word_table = _tables()
+
+    # В конце - символ-ограничитель: не пробел, не символ слова и без флагов
+    text = "".join(chain(lines, "\0"))
+
+    if text.isascii():
+        kinds = numpy.frombuffer(text.encode("ascii"), dtype=numpy.uint8)
+    else:
+        codes = numpy.frombuffer(text.encode("utf-32-le"), dtype=numpy.uint32)
+        kinds = numpy.minimum(codes, _NON_ASCII).astype(numpy.uint8)
+
+    total = len(kinds) - 1
+
+    lengths = numpy.fromiter(map(len, lines), dtype=numpy.int64, count=len(lines))
+    ends = numpy.cumsum(lengths)
+    starts = ends - lengths
+    empty = lengths == 0
+
+    # Флаги символов занимают биты с 8-го, поэтому таблица хранит их сдвинутыми
+    flags = numpy.bitwise_or.reduceat(flag_table[kinds], starts).astype(numpy.int64) << _CHAR_FLAGS_SHIFT
+    # reduceat для пустого отрезка возвращает символ на его начале, а не ноль
+    flags[empty] = 0
+    # Скобок мало, поэтому их число на строке - разность номеров первых скобок после конца и начала строки
+    depth_changes = _count_in_lines(kinds, ord("{"), starts, ends) - _count_in_lines(kinds, ord("}"), starts, ends)
+
+    # Отступ - по str.lstrip, который, как и \s, считает пробельными и не-ASCII пробелы
+    first = ends - numpy.fromiter(map(len, map(str.lstrip, lines)), dtype=numpy.int64, count=len(lines))
+    first_kinds = kinds[first]
+    blank = first == ends
+    word = ~blank & word_table[first_kinds]
+
+    second_kinds = kinds[numpy.minimum(first + 1, total)]
+    # Комментарий начинается с //, /* или *
+    slashes = (first_kinds == ord("/")) & (first + 1 < ends) & ((second_kinds == ord("/")) | (second_kinds == ord("*")))
+    comment = ~blank & ((first_kinds == ord("*")) | slashes)
+    # Не-ASCII символ в начале строки может быть буквой, и тогда строка начинается со слова
+    fallback = ~blank & (first_kinds == _NON_ASCII)
+
+    flags[blank] |= LineFlag.BLANK.value
+    flags[comment] |= LineFlag.COMMENT.value
+    flags[word] |= LineFlag.WORD.value
+
+    for keyword in chain(DECLARATION_WORDS, _FALLBACK_WORDS):
+        candidates = numpy.flatnonzero(word & (ends - first >= len(keyword)))
+
+        for shift, char in enumerate(keyword):
+            candidates = candidates[kinds[first[candidates] + shift] == ord(char)]
+
+        # Слово совпадает с keyword, если следующий символ - не символ слова; не-ASCII символ может продолжать слово
+        after_keyword = first[candidates] + len(keyword)
+        after = numpy.where(after_keyword < ends[candidates], kinds[after_keyword], 0)
+        fallback[candidates[after == _NON_ASCII]] = True
+        candidates = candidates[~word_table[after]]
+
+        if keyword in DECLARATION_WORDS:
+            flags[candidates] |= LineFlag.DECLARATION.value
+        else:
+            fallback[candidates] = True
+
+    for i in numpy.flatnonzero(fallback).tolist():
+        flags[i] = classify_line(lines[i])[0]
+
+    return LineArrays(starts=starts, ends=ends, flags=flags, depth_changes=depth_changes)
+
+
+def _count_in_lines(kinds: Any, kind: int, starts: Any, ends: Any) -> Any:
+    """Число символов kind на каждой строке"""
+
+    positions = numpy.flatnonzero(kinds == kind)
+
+    return numpy.searchsorted(positions, ends) - numpy.searchsorted(positions, starts)
+
+
+@cache
+def _tables() -> tuple[Any, Any]:
+    """
+    Таблицы по номеру символа (см. line_arrays): флаги LineFlag со сдвигом _CHAR_FLAGS_SHIFT и символ ли слова
+    """
+
+    flag_table = numpy.zeros(_NON_ASCII + 1, dtype=numpy.uint16)
+    word_table = numpy.zeros(_NON_ASCII + 1, dtype=bool)
+
+    for char, flags in CHARACTER_FLAGS.items():
+        flag_table[ord(char)] = flags >> _CHAR_FLAGS_SHIFT
+
+    for code in range(_NON_ASCII):
+        word_table[code] = chr(code).isalnum() or chr(code) == "_"
+
+    return flag_table, word_table
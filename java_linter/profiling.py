@@ -0,0 +1,212 @@
+import json
+import sys
+import time
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Iterable, Iterator, NamedTuple, TextIO
+
+from java_linter.shared import Check, ErrorEntry
+
+
+class CheckStats(NamedTuple):
+    """Число вызовов проверки и суммарное время их выполнения"""
+
+    calls: int
+    seconds: float
+
+
+class FileProfile(NamedTuple):
+    """Профиль одного файла: время линтинга целиком и по проверкам"""
+
+    filename: str
+    lines: int
+    bytes: int
+    seconds: float
+    checks: dict[str, CheckStats]
+
+
+def check_name(check: Check) -> str:
+    """Возвращает имя проверки в виде "Класс.метод"; для построчных проверок - имя построчного метода"""
+
+    function: Any = check.args[0] if isinstance(check, partial) else check
+    owner = getattr(function, "__self__", None)
+
+    return f"{type(owner).__name__}.{function.__name__}" if owner is not None else function.__name__
+
+
+class Profiler:
+    """
+    Собирает время и число вызовов проверок Linter'а по файлам.
+    Проверки оборачиваются только при включенном профилировании (см. Linter), поэтому без него профилировщик
+    ничего не стоит
+    """
+
+    def __init__(self) -> None:
+        self._current: dict[str, list[float]] = {}
+        self._files: list[FileProfile] = []
+
+    def wrap_checks(self, checks: Iterable[Check]) -> tuple[Check, ...]:
+        """Оборачивает проверки так, что время их выполнения и число вызовов попадают в текущий файл"""
+        return tuple(self._wrap(check) for check in checks)
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """
+        Замеряет блок как один вызов проверки name в текущем файле. Так учитываются FusedLinter и MmapScanner:
+        они проходят файл один раз и не делятся на отдельные проверки
+        """
+
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self._record(name, time.perf_counter() - start)
+
+    def start_file(self) -> None:
+        """Начинает сбор статистики нового файла"""
+        self._current = {}
+
+    def finish_file(self, filename: str, lines: int, size: int, seconds: float) -> FileProfile:
+        """Завершает сбор статистики файла и возвращает его профиль"""
+
+        profile = FileProfile(
+            filename=filename,
+            lines=lines,
+            bytes=size,
+            seconds=seconds,
+            checks={
+                name: CheckStats(calls=int(calls), seconds=spent) for name, (calls, spent) in self._current.items()
+            },
+        )
+
+        self._current = {}
+        self.add(profile)
+
+        return profile
+
+    def add(self, profile: FileProfile) -> None:
+        """Добавляет профиль файла, например полученный из другого процесса"""
+        self._files.append(profile)
+
+    def report(self, top: int = 10) -> dict[str, Any]:
+        """Собирает итоговый отчет: суммы по проверкам и подлинтерам, пропускная способность и самые медленные файлы"""
+
+        checks: dict[str, list[float]] = {}
+
+        for profile in self._files:
+            for name, stats in profile.checks.items():
+                total = checks.setdefault(name, [0, 0.0])
+                total[0] += stats.calls
+                total[1] += stats.seconds
+
+        sub_linters: dict[str, list[float]] = {}
+
+        for name, (calls, seconds) in checks.items():
+            total = sub_linters.setdefault(name.split(".")[0], [0, 0.0])
+            total[0] += calls
+            total[1] += seconds
+
+        seconds = sum(profile.seconds for profile in self._files)
+        lines = sum(profile.lines for profile in self._files)
+        size = sum(profile.bytes for profile in self._files)
+
+        return {
+            "files": len(self._files),
+            "lines": lines,
+            "bytes": size,
+            "seconds": seconds,
+            "lines_per_second": lines / seconds if seconds else 0.0,
+            "bytes_per_second": size / seconds if seconds else 0.0,
+            "sub_linters": self._sorted_stats(sub_linters),
+            "checks": self._sorted_stats(checks),
+            "slowest_files": [
+                {
+                    "filename": profile.filename,
+                    "lines": profile.lines,
+                    "bytes": profile.bytes,
+                    "seconds": profile.seconds,
+                }
+                for profile in sorted(self._files, key=lambda profile: profile.seconds, reverse=True)[:top]
+            ],
+        }
+
+    def print_report(self, top: int = 10, stream: TextIO | None = None) -> None:
+        """
+        Печатает отчет таблицами в stream, по умолчанию - в stderr, чтобы не смешивать его с выводом ошибок
+        в форматах jsonl и sarif
+        """
+
+        stream = stream or sys.stderr
+        report = self.report(top)
+
+        print("Профиль проверок:", file=stream)
+        self._print_stats(report["sub_linters"], "Подлинтер", stream)
+        print(file=stream)
+        self._print_stats(report["checks"], "Проверка", stream)
+        print(file=stream)
+        print(
+            f"Файлов: {report['files']}, строк: {report['lines']}, байт: {report['bytes']}, "
+            f"время: {report['seconds']:.3f} с",
+            file=stream,
+        )
+        print(
+            f"Строк в секунду: {report['lines_per_second']:.0f}, байт в секунду: {report['bytes_per_second']:.0f}",
+            file=stream,
+        )
+
+        if report["slowest_files"]:
+            print(file=stream)
+            print(f"Самые медленные файлы (до {top}):", file=stream)
+
+            for file in report["slowest_files"]:
+                print(f"  {file['seconds']:.4f} с  {file['lines']:>8} строк  {file['filename']}", file=stream)
+
+    def write_json(self, filename: str, top: int = 10) -> None:
+        """Записывает отчет в json-файл"""
+
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(self.report(top), f, ensure_ascii=False, indent=2)
+
+    def _wrap(self, check: Check) -> Check:
+        """Оборачивает одну проверку; ленивые проверки выполняются целиком внутри замера"""
+
+        name = check_name(check)
+
+        def profiled_check(lines: list[str], filename: str) -> list[ErrorEntry]:
+            start = time.perf_counter()
+            errors = list(check(lines, filename))
+            self._record(name, time.perf_counter() - start)
+
+            return errors
+
+        return profiled_check
+
+    def _record(self, name: str, spent: float) -> None:
+        """Добавляет вызов проверки name, занявший spent секунд, в текущий файл"""
+
+        stats = self._current.setdefault(name, [0, 0.0])
+        stats[0] += 1
+        stats[1] += spent
+
+    def _sorted_stats(self, stats: dict[str, list[float]]) -> list[dict[str, Any]]:
+        """Переводит суммы в список словарей, начиная с самых долгих"""
+        return [
+            {"name": name, "calls": int(calls), "seconds": seconds}
+            for name, (calls, seconds) in sorted(stats.items(), key=lambda item: item[1][1], reverse=True)
+        ]
+
+    def _print_stats(self, stats: list[dict[str, Any]], title: str, stream: TextIO) -> None:
+        """Печатает таблицу вызовов и времени с долей от общего времени проверок"""
+
+        total = sum(item["seconds"] for item in stats) or 1.0
+        width = max([len(title)] + [len(item["name"]) for item in stats])
+
+        print(f"{title:<{width}}  {'Вызовов':>8}  {'Время, с':>10}  {'Доля':>6}", file=stream)
+
+        for item in stats:
+            print(
+                f"{item['name']:<{width}}  {item['calls']:>8}  {item['seconds']:>10.4f}  "
+                f"{item['seconds'] / total:>6.1%}",
+                file=stream,
+            )
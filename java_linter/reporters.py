@@ -0,0 +1,169 @@
+import json
+import sys
+from abc import ABC, abstractmethod
+from typing import TextIO
+
+from java_linter import __version__
+from java_linter.error_store import ErrorStore
+from java_linter.messages import DEFAULT_LANGUAGE, MESSAGES, MessageCode
+from java_linter.shared import ErrorEntry
+
+# Размер буфера вывода: запись в поток происходит кусками такого размера, а не на каждую ошибку
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+
+def open_output(path: str | None) -> TextIO:
+    """
+    Открывает поток вывода с большим буфером: файл path или stdout, если path - None или "-".
+    stdout при закрытии потока не закрывается
+    """
+
+    if path is None or path == "-":
+        sys.stdout.flush()
+        return open(sys.stdout.fileno(), "w", buffering=OUTPUT_BUFFER_SIZE, encoding="utf-8", closefd=False)
+
+    return open(path, "w", buffering=OUTPUT_BUFFER_SIZE, encoding="utf-8")
+
+
+class Reporter(ABC):
+    """
+    Записывает ошибки в поток по мере проверки файлов: start перед первым файлом, report_file для каждого файла,
+    finish после последнего. Вывод копится в буфере потока и не сбрасывается после каждого файла
+    """
+
+    def __init__(self, stream: TextIO, language: str = DEFAULT_LANGUAGE):
+        self._stream = stream
+        self._language = language
+
+    def start(self) -> None:
+        pass
+
+    @abstractmethod
+    def report_file(self, filename: str, errors: list[ErrorEntry] | ErrorStore) -> None:
+        """Записывает ошибки файла filename"""
+
+    def finish(self) -> None:
+        self._stream.flush()
+
+
+class TextReporter(Reporter):
+    """Человекочитаемый вывод, как у print_errors; каждый файл записывается в поток одним вызовом"""
+
+    def report_file(self, filename: str, errors: list[ErrorEntry] | ErrorStore) -> None:
+        if not len(errors):
+            self._stream.write(f"Проблем не найдено в файле: {filename}\n")
+            return
+
+        parts = [f"Ошибки в файле: {filename}\n"]
+        parts.extend(
+            f"  Строка: {error.line}, Столбец: {error.column}, Проблема: {error.render(self._language)}\n"
+            for error in errors
+        )
+        parts.append("-" * 20 + "\n")
+
+        self._stream.write("".join(parts))
+
+
+class JsonLinesReporter(Reporter):
+    """По одному json-объекту ErrorEntry на строку; файлы без ошибок ничего не выводят"""
+
+    def __init__(self, stream: TextIO, language: str = DEFAULT_LANGUAGE):
+        super().__init__(stream, language)
+
+        # Сообщения повторяются, поэтому каждое собирается и кодируется в json один раз на пару (код, параметры)
+        self._encoded_messages: dict[tuple[MessageCode, tuple[int, ...]], str] = {}
+
+    def report_file(self, filename: str, errors: list[ErrorEntry] | ErrorStore) -> None:
+        if not len(errors):
+            return
+
+        encoded_filename = json.dumps(filename, ensure_ascii=False)
+        parts = []
+
+        for error in errors:
+            key = (error.code, error.params)
+            message = self._encoded_messages.get(key)
+
+            if message is None:
+                message = self._encoded_messages[key] = json.dumps(error.render(self._language), ensure_ascii=False)
+
+            parts.append(
+                f'{{"file_name": {encoded_filename}, "line": {error.line}, "column": {error.column}, '
+                f'"message": {message}}}\n'
+            )
+
+        self._stream.write("".join(parts))
+
+
+class SarifReporter(Reporter):
+    """
+    Отчет SARIF 2.1.0 с одним запуском. Результаты пишутся в массив results по мере проверки файлов, поэтому
+    отчет не собирается в памяти целиком. Правила - все коды MessageCode, так что ruleId любого результата
+    есть в driver.rules
+    """
+
+    def __init__(self, stream: TextIO, language: str = DEFAULT_LANGUAGE):
+        super().__init__(stream, language)
+        self._has_results = False
+
+        # Начало json-результата до пути файла для каждой пары (код, параметры) и пути файлов в json
+        self._encoded_prefixes: dict[tuple[MessageCode, tuple[int, ...]], str] = {}
+        self._encoded_uris: dict[str, str] = {}
+
+    def start(self) -> None:
+        rules = [
+            {"id": code.name, "shortDescription": {"text": MESSAGES[self._language][code]}} for code in MessageCode
+        ]
+        tool = {"driver": {"name": "java_linter", "version": __version__, "rules": rules}}
+
+        # Документ пишется частями: здесь - все до массива results, в report_file - результаты, в finish - конец
+        # массива results, объекта запуска, массива runs и документа
+        self._stream.write(
+            f'{{"version": "2.1.0", "$schema": {json.dumps(SARIF_SCHEMA)}, '
+            f'"runs": [{{"tool": {json.dumps(tool, ensure_ascii=False)}, "results": [\n'
+        )
+
+    def report_file(self, filename: str, errors: list[ErrorEntry] | ErrorStore) -> None:
+        store = errors if isinstance(errors, ErrorStore) else ErrorStore.from_entries(errors)
+
+        if not len(store):
+            return
+
+        parts = []
+
+        for index in range(len(store)):
+            error = store.entry(index)
+            key = (error.code, error.params)
+            prefix = self._encoded_prefixes.get(key)
+
+            if prefix is None:
+                prefix = self._encoded_prefixes[key] = (
+                    f'{{"ruleId": "{key[0].name}", "level": "warning", '
+                    f'"message": {{"text": {json.dumps(error.render(self._language), ensure_ascii=False)}}}, '
+                    '"locations": [{"physicalLocation": {"artifactLocation": {"uri": '
+                )
+
+            uri = self._encoded_uris.get(error.file_name)
+
+            if uri is None:
+                uri = self._encoded_uris[error.file_name] = json.dumps(
+                    error.file_name.replace("\\", "/"), ensure_ascii=False
+                )
+
+            parts.append(
+                f'{prefix}{uri}}}, "region": {{"startLine": {max(error.line, 1)}, '
+                f'"startColumn": {max(error.column, 1)}}}}}}}]}}'
+            )
+
+        separator = ",\n" if self._has_results else ""
+        self._stream.write(separator + ",\n".join(parts))
+        self._has_results = True
+
+    def finish(self) -> None:
+        self._stream.write("\n]}]}\n")
+        super().finish()
+
+
+REPORTERS: dict[str, type[Reporter]] = {"text": TextReporter, "jsonl": JsonLinesReporter, "sarif": SarifReporter}
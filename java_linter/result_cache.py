@@ -0,0 +1,295 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from functools import cache
+from typing import Any, Iterable, Mapping
+
+from java_linter import __version__
+from java_linter.dialects import Dialect
+from java_linter.messages import MessageCode
+from java_linter.shared import ErrorEntry
+
+DEFAULT_CACHE_DIR = ".java_linter_cache"
+
+# Меняется при изменении формата записей, чтобы старые записи не читались
+_FORMAT_VERSION = 2
+
+# Файлы, измененные позже этого срока до записи, проверяются по хэшу даже при совпадении mtime и размера:
+# за такое время файл мог измениться еще раз, не поменяв mtime
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Файл в корне кэша с размером кэша после последней очистки и байтами, записанными с тех пор
+_SIZE_MARKER = "size"
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def dialect_hash(dialect: Dialect, options: Mapping[str, bool | int | None] | None = None) -> str:
+    """
+    Возвращает хэш нормализованного диалекта, опций Linter'а и версии линтера. В версию входит хэш исходников
+    пакета: правка правил или выражений без смены __version__ тоже делает старые записи непригодными
+    """
+
+    data = {
+        "format": _FORMAT_VERSION,
+        "version": __version__,
+        "source": _source_hash(),
+        "naming": {name: rule.value for name, rule in dialect.naming._asdict().items()},
+        "spaces": dialect.spaces._asdict(),
+        "empty_lines": dialect.empty_lines._asdict(),
+        "options": dict(options or {}),
+    }
+
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+@cache
+def _source_hash() -> str:
+    """Хэш исходников пакета java_linter; считается один раз за процесс"""
+
+    digest = hashlib.sha256()
+
+    for name in sorted(os.listdir(_PACKAGE_DIR)):
+        if name.endswith(".py"):
+            digest.update(name.encode("utf-8"))
+
+            with open(os.path.join(_PACKAGE_DIR, name), "rb") as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+
+    return digest.hexdigest()
+
+
+def content_hash(lines: Iterable[str]) -> str:
+    """Возвращает хэш содержимого файла в том виде, в котором его читает линтер; строки не собираются вместе"""
+
+    digest = hashlib.sha256()
+
+    for line in lines:
+        digest.update(line.encode("utf-8", "surrogateescape"))
+
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Кэш найденных в файлах ошибок на диске.
+    На каждый файл и хэш диалекта (см. dialect_hash) хранится своя запись с mtime, размером и хэшем содержимого
+    файла, так что запуски с разными диалектами и опциями (например, с mmap и без) не затирают записи друг друга.
+    Если mtime и размер не изменились, файл не читается, иначе сравнивается хэш содержимого.
+    Записи пишутся атомарно, при превышении max_bytes удаляются давно не использованные.
+    Чтобы не обходить кэш при каждом запуске, размер кэша после очистки и байты, записанные с тех пор, хранятся
+    в файле _SIZE_MARKER, и кэш обходится, только когда их сумма больше max_bytes
+    """
+
+    def __init__(
+        self,
+        dialect: Dialect,
+        options: Mapping[str, bool | int | None] | None = None,
+        cache_dir: str = DEFAULT_CACHE_DIR,
+        max_bytes: int = 256 * 1024 * 1024,
+    ):
+        self._cache_dir = cache_dir
+        self._dialect_hash = dialect_hash(dialect, options)
+        self._max_bytes = max_bytes
+        self._written = 0
+
+    def get(self, filename: str) -> list[ErrorEntry] | None:
+        """Возвращает ошибки файла из кэша или None, если записи нет или файл изменился"""
+
+        entry_path = self._entry_path(filename)
+        record = self._read_record(entry_path)
+
+        if record is None or record["dialect"] != self._dialect_hash:
+            return None
+
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return None
+
+        if record["mtime"] != stat.st_mtime_ns or record["size"] != stat.st_size:
+            try:
+                with open(filename, "r") as f:
+                    is_same_content = record["content"] == content_hash(f)
+            except (OSError, UnicodeDecodeError):
+                return None
+
+            if not is_same_content:
+                return None
+
+            record["mtime"], record["size"] = self._trusted_stat(stat)
+            self._written += self._write_record(entry_path, record)
+        else:
+            self._touch(entry_path)
+
+        return [
+            ErrorEntry(file_name=filename, line=line, column=column, code=MessageCode(code), params=tuple(params))
+            for line, column, code, params in record["errors"]
+        ]
+
+    def put(self, filename: str, lines: Iterable[str], errors: list[ErrorEntry]) -> None:
+        """
+        Сохраняет ошибки, найденные в файле с содержимым lines. Результаты с ошибкой SLOW_LINE не сохраняются:
+        они зависят от загрузки машины, а не только от содержимого файла
+        """
+
+        if any(error.code == MessageCode.SLOW_LINE for error in errors):
+            return
+
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return
+
+        mtime, size = self._trusted_stat(stat)
+
+        record = {
+            "dialect": self._dialect_hash,
+            "mtime": mtime,
+            "size": size,
+            "content": content_hash(lines),
+            "errors": [[error.line, error.column, int(error.code), list(error.params)] for error in errors],
+        }
+
+        self._written += self._write_record(self._entry_path(filename), record)
+
+    def take_written(self) -> int:
+        """
+        Возвращает байты, записанные этим ResultCache с прошлой очистки, и забывает их. Так процесс-обработчик
+        передает их ResultCache главного процесса (см. add_written), где вызывается evict
+        """
+
+        written, self._written = self._written, 0
+        return written
+
+    def add_written(self, written: int) -> None:
+        """Учитывает байты, записанные в тот же кэш другим ResultCache (см. take_written)"""
+        self._written += written
+
+    def evict(self) -> None:
+        """
+        Удаляет давно не использованные записи, пока размер кэша больше max_bytes. Перезапись записи считается
+        ростом кэша, поэтому оценка размера по _SIZE_MARKER не меньше настоящего; без маркера кэш обходится
+        """
+
+        marker_path = os.path.join(self._cache_dir, _SIZE_MARKER)
+        marker = self._read_record(marker_path)
+
+        if marker is not None and isinstance(marker.get("bytes"), int):
+            estimate = marker["bytes"] + self._written
+
+            if estimate <= self._max_bytes:
+                if self._written:
+                    self._write_record(marker_path, {"bytes": estimate})
+                    self._written = 0
+
+                return
+
+        entries: list[tuple[int, int, str]] = []
+        total = 0
+
+        for shard in self._scan(self._cache_dir):
+            for entry in self._scan(shard.path):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                total += stat.st_size
+
+        entries.sort()
+
+        for _, size, path in entries:
+            if total <= self._max_bytes:
+                break
+
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+            total -= size
+
+        if entries:
+            self._write_record(marker_path, {"bytes": total})
+
+        self._written = 0
+
+    def _entry_path(self, filename: str) -> str:
+        """
+        Возвращает путь записи для файла; ключ - хэш пути и хэша диалекта, записи разложены по подпапкам
+        по его первым символам
+        """
+
+        path = os.path.abspath(filename).encode("utf-8", "surrogateescape")
+        key = hashlib.sha1(path + b"\0" + self._dialect_hash.encode()).hexdigest()
+        return os.path.join(self._cache_dir, key[:2], key[2:] + ".json")
+
+    def _trusted_stat(self, stat: os.stat_result) -> tuple[int, int]:
+        """Возвращает mtime и размер для записи; для только что измененных файлов mtime не сохраняется"""
+
+        if time.time_ns() - stat.st_mtime_ns < _RACY_WINDOW_NS:
+            return 0, stat.st_size
+
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read_record(self, entry_path: str) -> dict[str, Any] | None:
+        """Читает запись кэша; поврежденная или отсутствующая запись считается промахом"""
+
+        try:
+            with open(entry_path, "r", encoding="utf-8") as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        return record if isinstance(record, dict) else None
+
+    def _write_record(self, entry_path: str, record: dict[str, Any]) -> int:
+        """
+        Записывает запись через временный файл и os.replace, чтобы параллельные запуски
+        никогда не видели записанную наполовину запись. Возвращает размер записи или 0, если записать не удалось
+        """
+
+        directory = os.path.dirname(entry_path)
+        data = json.dumps(record, ensure_ascii=False).encode("utf-8")
+
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        except OSError:
+            return 0
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+            return 0
+
+        return len(data)
+
+    def _touch(self, entry_path: str) -> None:
+        """Обновляет mtime записи, по которому evict определяет давно не использованные записи"""
+
+        try:
+            os.utime(entry_path)
+        except OSError:
+            pass
+
+    def _scan(self, directory: str) -> list[os.DirEntry[str]]:
+        """Возвращает содержимое папки или пустой список, если папки нет"""
+
+        try:
+            with os.scandir(directory) as entries:
+                return list(entries)
+        except OSError:
+            return []
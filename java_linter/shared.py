@@ -1,82 +1,306 @@
+import heapq
 import re
-from typing import NamedTuple
+from itertools import groupby
+from operator import attrgetter
+from typing import Callable, Iterable, Iterator, NamedTuple
+
+from java_linter.line_classes import ALL_LINES, LineFilter, filtered_lines
+from java_linter.messages import DEFAULT_LANGUAGE, MessageCode, render_message
 
 
 class ErrorEntry(NamedTuple):
-    """Запись найденной линтером ошибки"""
+    """
+    Запись найденной линтером ошибки. Проверки записывают только код сообщения и его параметры, а текст
+    собирается из каталога MESSAGES при выводе
+    """
 
     file_name: str
     line: int
     column: int
-    message: str
+    code: MessageCode
+    params: tuple[int, ...] = ()
+
+    @property
+    def message(self) -> str:
+        """Текст сообщения на DEFAULT_LANGUAGE"""
+        return render_message(self.code, self.params)
+
+    def render(self, language: str = DEFAULT_LANGUAGE) -> str:
+        """Текст сообщения на языке language"""
+        return render_message(self.code, self.params, language)
+
+
+Check = Callable[[list[str], str], Iterable[ErrorEntry]]
+"""Проверка подлинтера: принимает строки файла и его имя, возвращает или лениво выдает найденные ошибки"""
+
+LineCheck = Callable[[str, int, str, list[ErrorEntry]], None]
+"""Построчная проверка: принимает строку, ее индекс и имя файла, дописывает найденные ошибки в список"""
+
+
+def split_lines(text: str) -> list[str]:
+    """
+    Делит текст на строки с "\\n" на конце, как при чтении файла в текстовом режиме: концом строки считаются
+    только "\\n", "\\r\\n" и "\\r", в отличие от str.splitlines
+    """
+
+    parts = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    lines = [part + "\n" for part in parts[:-1]]
+
+    if parts[-1]:
+        lines.append(parts[-1])
+
+    return lines
+
+
+def iter_line_check(
+    line_check: LineCheck, lines: list[str], filename: str, line_filter: LineFilter = ALL_LINES
+) -> Iterator[ErrorEntry]:
+    """
+    Лениво выдает ошибки построчной проверки, строку за строкой.
+    Если строки классифицированы (см. ClassifiedLines), проверяются только строки, проходящие line_filter
+    """
+
+    errors: list[ErrorEntry] = []
+
+    for i, line in filtered_lines(lines, line_filter):
+        line_check(line, i, filename, errors)
+
+        if errors:
+            yield from errors
+            errors.clear()
+
+
+def iter_checks(
+    checks: Iterable[Check], lines: list[str], filename: str, ordered: bool = False
+) -> Iterator[ErrorEntry]:
+    """
+    Лениво выдает ошибки проверок checks.
+    При ordered=False ошибки идут по проверкам, как в seek_for_errors, и следующая проверка запускается только
+    после того, как выданы все ошибки предыдущей. При ordered=True потоки проверок, каждый из которых должен идти
+    по неубыванию строки, сливаются по строке, а ошибки одной строки упорядочиваются по столбцу
+    """
+
+    if not ordered:
+        for check in checks:
+            yield from check(lines, filename)
+
+        return
+
+    merged = heapq.merge(*(iter(check(lines, filename)) for check in checks), key=attrgetter("line"))
+
+    for _, line_errors in groupby(merged, key=attrgetter("line")):
+        yield from sorted(line_errors, key=attrgetter("column"))
+
+
+_VAR_MODIFIERS = "public|private|protected|static|final|synchronized|abstract|default|volatile"
+
+
+class VarMatch(NamedTuple):
+    """
+    Совпадение VarPattern, собранное из найденных границ типа и имени, без отдельного выражения под каждую длину
+    типа. Повторяет методы re.Match, которыми пользуется линтер; spans - границы совпадения и групп 1 и 2
+    """
+
+    string: str
+    spans: tuple[tuple[int, int], tuple[int, int], tuple[int, int]]
+
+    def span(self, group: int = 0) -> tuple[int, int]:
+        return self.spans[group]
+
+    def start(self, group: int = 0) -> int:
+        return self.spans[group][0]
+
+    def end(self, group: int = 0) -> int:
+        return self.spans[group][1]
+
+    def group(self, group: int = 0) -> str:
+        start, end = self.spans[group]
+        return self.string[start:end]
+
+    def groups(self) -> tuple[str, str]:
+        return self.group(1), self.group(2)
+
+
+class VarPattern:
+    r"""
+    Поиск объявления переменной за линейное от длины строки время. Совпадения (группы и их позиции) те же, что у
+    регулярного выражения
+    ^\s*(?:МОДИФИКАТОР\s+)*((?!МОДИФИКАТОР)\w+(?:\s*<.+>)*(?:\s*\[.*])*)\s+\b([a-zA-Z_]\w*)\b\s*(?!\(),
+    которое перебирает концы типа с возвратами и на строках вида "Foo<a><a>...<a>(" работает экспоненциально долго.
+    Тип заканчивается на самом правом '>', а затем на самом правом ']', после которых идет имя переменной;
+    эти концы ищутся одним проходом по строке
+    """
+
+    # Тип без дженериков и массивов; если за типом идет '<' или '[', совпадение есть, но группа 2 пуста
+    _SIMPLE = re.compile(
+        rf"""
+        \s*+
+        (?:(?:{_VAR_MODIFIERS})\s++)*+
+        ((?!{_VAR_MODIFIERS})\w++)
+        (?:
+            (?=\s*+[<\[])
+            |
+            \s+\b([a-zA-Z_]\w*)\b\s*(?!\()
+        )
+        """,
+        re.VERBOSE,
+    )
+
+    # Имя переменной после конца типа
+    _NAME = re.compile(r"\s++[a-zA-Z_]\w*+(?!\()")
+    _SPACES = re.compile(r"\s*+")
+
+    # Окончание выражения после типа; сопоставляется с концом типа, найденным _type_end
+    _TAIL = re.compile(r"\s+\b([a-zA-Z_]\w*)\b\s*(?!\()")
+
+    # Прежнее выражение нужно только для строк с переводом строки внутри, которых линтер не создает:
+    # у них части типа по разные стороны перевода строки соединяются иначе
+    _MULTILINE = re.compile(
+        rf"""
+        ^\s*
+        (?:(?:{_VAR_MODIFIERS})\s+)*
+        ((?!{_VAR_MODIFIERS})\w+(?:\s*<.+>)*(?:\s*\[.*])*)
+        \s+\b([a-zA-Z_]\w*)\b\s*(?!\()
+        """,
+        re.VERBOSE,
+    )
+
+    def match(self, line: str) -> re.Match[str] | VarMatch | None:
+        """Ищет объявление переменной в начале строки"""
+
+        simple = self._SIMPLE.match(line)
+
+        if simple is None or simple.group(2) is not None:
+            return simple
+
+        type_start, word_end = simple.span(1)
+
+        if line.find("\n", word_end, len(line) - 1) != -1:
+            return self._MULTILINE.match(line)
+
+        type_end = self._type_end(line, word_end)
+
+        if type_end is None:
+            return None
+
+        tail = self._TAIL.match(line, type_end)
+
+        if tail is None:
+            return None
+
+        return VarMatch(line, ((0, tail.end()), (type_start, type_end), tail.span(1)))
+
+    def search(self, line: str) -> re.Match[str] | VarMatch | None:
+        """То же, что match: объявление ищется только в начале строки"""
+        return self.match(line)
+
+    def _type_end(self, line: str, word_end: int) -> int | None:
+        """
+        Возвращает конец типа, который начинается словом, заканчивающимся в word_end, а продолжается дженериками
+        или массивами. Каждый символ строки просматривается O(1) раз
+        """
+
+        first = self._skip_spaces(line, word_end)
+        last_bracket: list[int | None] = []
+
+        if line[first] == "[":
+            return self._array_end(line, first, last_bracket)
+
+        # .+ в <.+> не бывает пустым, поэтому '>' ищется не раньше first + 2
+        close = line.rfind(">", first + 2)
+
+        while close != -1:
+            generic_end = close + 1
+            array_start = self._skip_spaces(line, generic_end)
+
+            if array_start < len(line) and line[array_start] == "[":
+                array_end = self._array_end(line, array_start, last_bracket)
+
+                if array_end is not None:
+                    return array_end
+
+            if self._NAME.match(line, generic_end):
+                return generic_end
+
+            close = line.rfind(">", first + 2, close)
+
+        return None
+
+    def _array_end(self, line: str, start: int, last_bracket: list[int | None]) -> int | None:
+        """
+        Возвращает конец массивной части, которая начинается с '[' в start: самый правый ']', после которого идет
+        имя переменной. Этот ']' ищется один раз на строку и запоминается в last_bracket
+        """
+
+        if not last_bracket:
+            bracket = line.rfind("]")
+
+            while bracket != -1 and not self._NAME.match(line, bracket + 1):
+                bracket = line.rfind("]", 0, bracket)
+
+            last_bracket.append(bracket + 1 if bracket != -1 else None)
+
+        end = last_bracket[0]
+
+        return end if end is not None and end > start + 1 else None
+
+    def _skip_spaces(self, line: str, position: int) -> int:
+        """Возвращает позицию первого непробельного символа, начиная с position"""
+
+        spaces = self._SPACES.match(line, position)
+        assert spaces is not None, r"\s*+ совпадает с любой строкой"
+
+        return spaces.end()
 
 
 class JavaPatterns:
-    """Регулярные выражения для поиска классов/методов/переменных в java-коде"""
+    """
+    Регулярные выражения для поиска классов/методов/переменных в java-коде.
+    Время сопоставления линейно от длины строки: повторения, которые могли бы отдавать символы при возврате,
+    записаны захватывающими (*+, ++, ?+) там, где возврат все равно не привел бы к совпадению, а переменные ищет
+    VarPattern
+    """
 
     CLASS_PATTERN = re.compile(
         r"""
-        ^\s*
+        ^\s*+
         (?:
             (?:public|private|protected|
             static|final|
             synchronized|abstract|default)
-            \s+
-        )*
-        (?:class|interface|enum)\s+([A-Za-z_]\w*
+            \s++
+        )*+
+        (?:class|interface|enum)\s++([A-Za-z_]\w*+
     )
     """,
         re.VERBOSE,
     )
 
-    VAR_PATTERN = re.compile(
-        r"""
-                    ^\s*
-            (?:
-                (?:public|private|protected|
-                static|final|
-                synchronized|abstract|default|volatile)
-                \s+
-            )*
-            (
-                (?!public|private|protected|
-                static|final|
-                synchronized|abstract|default|volatile)
-                \w+
-                (?:\s*<.+>)*
-                (?:\s*\[.*])*
-            )
-            \s+
-            \b([a-zA-Z_]\w*)\b
-            \s*
-            (?!\()
-            """,
-        re.VERBOSE,
-    )
+    VAR_PATTERN = VarPattern()
 
     METHOD_PATTERN = re.compile(
         r"""
-            ^\s*
+            ^\s*+
             (?:
                 (?:public|private|protected|
                 static|final|
                 synchronized|abstract|default)
-                \s+
-            )*
+                \s++
+            )*+
             (
                 (?!public|private|protected|
                 static|final|
                 synchronized|abstract|default)
-                \w+
-                (?:\s*<[^>]+>)?
-                (?:\s*\[\s*\])*
-                \s*
+                \w++
+                (?:\s*+<[^>]++>)?+
+                (?:\s*+\[\s*+\])*+
+                (?:\s(?=\s))*+
             )
-            \s+
-            ([a-zA-Z_]\w*)
-            \s*
+            \s
+            ([a-zA-Z_]\w*+)
+            \s*+
             \(
-            [^)]*
+            [^)]*+
             \)
             \s*
             (?:throws\s+[\w\s,]+)?
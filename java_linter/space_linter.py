@@ -1,13 +1,36 @@
 import re
+from functools import partial
+from typing import Iterator
 
 from java_linter.dialects import Dialect
-from java_linter.shared import ErrorEntry
+from java_linter.line_classes import LineFilter, LineFlag
+from java_linter.shared import Check, ErrorEntry, LineCheck, iter_checks, iter_line_check
+from java_linter.space_rules import (
+    AFTER_CLOSE_BRACKET,
+    AFTER_COMMA,
+    AFTER_DOT,
+    AFTER_OPEN_BRACKET,
+    BEFORE_BRACE,
+    BEFORE_CLOSE_BRACKET,
+    BEFORE_COMMA,
+    BEFORE_DOT,
+    BEFORE_DOT_COMMA,
+    BEFORE_OPEN_BRACKET,
+    BRACKET_KEYWORDS,
+    MANY_SPACES,
+    OPERATOR,
+)
+from java_linter.space_scanner import CombinedSpaceScanner
 
 
 class SpaceLinter:
     """Класс, ищущий синтаксические ошибки в .java файлах, связанные с пробелами"""
 
-    def __init__(self, dialect: Dialect):
+    _SPACES_MATCH = re.compile(r".*\S\s\s+.*")
+
+    def __init__(self, dialect: Dialect, combined: bool = False):
+        """При combined=True все проверки выполняются одним регулярным выражением (см. CombinedSpaceScanner)"""
+
         self._after_comma = dialect.spaces.after_comma
         self._no_before_comma = dialect.spaces.no_before_comma
         self._no_around_brackets = dialect.spaces.no_around_brackets
@@ -17,234 +40,181 @@ class SpaceLinter:
         self._no_before_dot_comma = dialect.spaces.no_before_dot_comma
         self._no_around_dot = dialect.spaces.no_around_dot
 
+        self._scanner = CombinedSpaceScanner(dialect.spaces) if combined else None
+
     def seek_for_errors(self, lines: list[str], filename: str) -> list[ErrorEntry]:
         """Ищет ошибки в java файле и выдает их в виде списка ErrorEntry"""
-        errors = []
+        return list(self.iter_errors(lines, filename))
+
+    def iter_errors(self, lines: list[str], filename: str, ordered: bool = False) -> Iterator[ErrorEntry]:
+        """Лениво выдает ошибки в порядке seek_for_errors или, при ordered=True, по строкам и столбцам"""
+        return iter_checks(self.get_checks(ordered), lines, filename, ordered)
+
+    @property
+    def scanner(self) -> CombinedSpaceScanner | None:
+        """Сканер, которым выполняются все проверки при combined=True, иначе None"""
+        return self._scanner
+
+    def get_checks(self, ordered: bool = False) -> tuple[Check, ...]:
+        """
+        Возвращает включенные в диалекте проверки в порядке их запуска.
+        При ordered=True каждая проверка выдает ошибки по неубыванию строки
+        """
+
+        if self._scanner:
+            return (self._scanner.iter_errors if ordered else self._scanner.seek_for_errors,)
+
+        return tuple(
+            partial(iter_line_check, line_check, line_filter=line_filter)
+            for line_check, line_filter in self._get_filtered_line_checks()
+        )
+
+    def get_line_checks(self) -> tuple[LineCheck, ...]:
+        """Возвращает построчные варианты включенных проверок в порядке их запуска"""
+        return tuple(line_check for line_check, _ in self._get_filtered_line_checks())
+
+    def get_line_filters(self) -> tuple[LineFilter, ...]:
+        """
+        Возвращает для каждой проверки из get_line_checks строки, в которых она может найти ошибку: со своим символом
+        (запятой, скобкой, оператором, ...), а для двойных пробелов - непустые
+        """
+        return tuple(line_filter for _, line_filter in self._get_filtered_line_checks())
+
+    def _get_filtered_line_checks(self) -> list[tuple[LineCheck, LineFilter]]:
+        """Возвращает включенные построчные проверки в порядке их запуска вместе с их фильтрами строк"""
+
+        checks: list[tuple[LineCheck, LineFilter]] = []
 
         if self._after_comma:
-            errors.extend(self._check_spaces_after_comma(lines, filename))
+            checks.append((self._check_spaces_after_comma_in_line, LineFilter(LineFlag.COMMA)))
 
         if self._no_before_comma:
-            errors.extend(self._check_no_spaces_before_comma(lines, filename))
+            checks.append((self._check_no_spaces_before_comma_in_line, LineFilter(LineFlag.COMMA)))
 
         if self._no_around_brackets:
-            errors.extend(self._check_no_spaces_around_brackets(lines, filename))
+            checks.append((self._check_no_spaces_around_brackets_in_line, LineFilter(LineFlag.BRACKET)))
 
         if self._around_operators:
-            errors.extend(self._check_no_spaces_around_operators(lines, filename))
+            checks.append((self._check_no_spaces_around_operators_in_line, LineFilter(LineFlag.OPERATOR)))
 
         if self._no_before_dot_comma:
-            errors.extend(self._check_no_spaces_before_dot_comma(lines, filename))
+            checks.append((self._check_no_spaces_before_dot_comma_in_line, LineFilter(LineFlag.SEMICOLON)))
 
         if self._no_around_dot:
-            errors.extend(self._check_no_spaces_around_dot(lines, filename))
+            checks.append((self._check_no_spaces_around_dot_in_line, LineFilter(LineFlag.DOT)))
 
         if not self._may_be_more_that_one_space:
-            errors.extend(self.check_no_spaces_more_that_one(lines, filename))
+            checks.append((self._check_no_spaces_more_that_one_in_line, LineFilter(forbidden=LineFlag.BLANK)))
 
-        return errors
+        return checks
 
     def _check_spaces_after_comma(self, lines: list[str], filename: str) -> list[ErrorEntry]:
         """Проверяет, есть ли пробел после каждой запятой"""
+        return list(iter_line_check(self._check_spaces_after_comma_in_line, lines, filename))
 
-        errors = []
-
-        for i, line in enumerate(lines):
-
-            if "," in line:
-                for match in re.finditer(r",\S", line):
-                    errors.append(
-                        ErrorEntry(
-                            file_name=filename,
-                            line=i + 1,
-                            column=match.start() + 1,
-                            message="После запятой должен быть пробел",
-                        )
-                    )
+    def _check_spaces_after_comma_in_line(self, line: str, index: int, filename: str, errors: list[ErrorEntry]) -> None:
+        """Проверяет пробелы после запятых в строке index и дописывает ошибки в errors"""
 
-        return errors
+        if "," in line:
+            for match in AFTER_COMMA.pattern.finditer(line):
+                errors.append(AFTER_COMMA.error(filename, index, match))
 
     def check_no_spaces_more_that_one(self, lines: list[str], filename: str) -> list[ErrorEntry]:
         """Проверяет, нет ли где-либо двух пробелов подряд"""
+        return list(iter_line_check(self._check_no_spaces_more_that_one_in_line, lines, filename))
 
-        errors = []
+    def _check_no_spaces_more_that_one_in_line(
+        self, line: str, index: int, filename: str, errors: list[ErrorEntry]
+    ) -> None:
+        """Проверяет двойные пробелы в строке index и дописывает ошибки в errors"""
 
-        spaces_match = re.compile(r".*\S\s\s+.*")
+        if self._SPACES_MATCH.match(line):
 
-        for i, line in enumerate(lines):
+            for match in MANY_SPACES.pattern.finditer(line):
 
-            if spaces_match.match(line):
-
-                for match in re.finditer(r"\S\s\s+", line):
-
-                    if line[match.end()] != "/":
-                        errors.append(
-                            ErrorEntry(
-                                file_name=filename,
-                                line=i + 1,
-                                column=match.start() + 1,
-                                message="Не должно быть более одного пробела подряд внутри строки",
-                            )
-                        )
-
-        return errors
+                if line[match.end()] != "/":
+                    errors.append(MANY_SPACES.error(filename, index, match))
 
     def _check_no_spaces_before_comma(self, lines: list[str], filename: str) -> list[ErrorEntry]:
         """Проверяет, нет ли пробелов перед запятыми"""
+        return list(iter_line_check(self._check_no_spaces_before_comma_in_line, lines, filename))
 
-        errors = []
-
-        for i, line in enumerate(lines):
+    def _check_no_spaces_before_comma_in_line(
+        self, line: str, index: int, filename: str, errors: list[ErrorEntry]
+    ) -> None:
+        """Проверяет пробелы перед запятыми в строке index и дописывает ошибки в errors"""
 
-            if "," in line:
-                for match in re.finditer(r"\s,", line):
-                    errors.append(
-                        ErrorEntry(
-                            file_name=filename,
-                            line=i + 1,
-                            column=match.start() + 1,
-                            message="Не должно быть пробелов перед запятой",
-                        )
-                    )
-
-        return errors
+        if "," in line:
+            for match in BEFORE_COMMA.pattern.finditer(line):
+                errors.append(BEFORE_COMMA.error(filename, index, match))
 
     def _check_no_spaces_around_dot(self, lines: list[str], filename: str) -> list[ErrorEntry]:
         """Проверяет, нет ли пробелов перед точками"""
+        return list(iter_line_check(self._check_no_spaces_around_dot_in_line, lines, filename))
+
+    def _check_no_spaces_around_dot_in_line(
+        self, line: str, index: int, filename: str, errors: list[ErrorEntry]
+    ) -> None:
+        """Проверяет пробелы вокруг точек в строке index и дописывает ошибки в errors"""
 
-        errors = []
-
-        for i, line in enumerate(lines):
-
-            if "." in line:
-                for match in re.finditer(r"\s\.", line):
-                    errors.append(
-                        ErrorEntry(
-                            file_name=filename,
-                            line=i + 1,
-                            column=match.start() + 1,
-                            message="Не должно быть пробелов перед точкой",
-                        )
-                    )
-                for match in re.finditer(r"\.\s", line):
-                    errors.append(
-                        ErrorEntry(
-                            file_name=filename,
-                            line=i + 1,
-                            column=match.start() + 1,
-                            message="После точки не должен быть пробел",
-                        )
-                    )
-
-        return errors
+        if "." in line:
+            for rule in (BEFORE_DOT, AFTER_DOT):
+                for match in rule.pattern.finditer(line):
+                    errors.append(rule.error(filename, index, match))
 
     def _check_no_spaces_before_dot_comma(self, lines: list[str], filename: str) -> list[ErrorEntry]:
         """Проверяет, нет ли пробелов перед точками с запятой"""
+        return list(iter_line_check(self._check_no_spaces_before_dot_comma_in_line, lines, filename))
 
-        errors = []
-
-        for i, line in enumerate(lines):
+    def _check_no_spaces_before_dot_comma_in_line(
+        self, line: str, index: int, filename: str, errors: list[ErrorEntry]
+    ) -> None:
+        """Проверяет пробелы перед точками с запятой в строке index и дописывает ошибки в errors"""
 
-            if ";" in line:
-                for match in re.finditer(r"\s;", line):
-                    errors.append(
-                        ErrorEntry(
-                            file_name=filename,
-                            line=i + 1,
-                            column=match.start() + 1,
-                            message="Не должно быть пробелов перед точкой с запятой",
-                        )
-                    )
-
-        return errors
+        if ";" in line:
+            for match in BEFORE_DOT_COMMA.pattern.finditer(line):
+                errors.append(BEFORE_DOT_COMMA.error(filename, index, match))
 
     def _check_no_spaces_around_brackets(self, lines: list[str], filename: str) -> list[ErrorEntry]:
         """Проверяет, не окружены ли все скобки пробелами"""
+        return list(iter_line_check(self._check_no_spaces_around_brackets_in_line, lines, filename))
 
-        errors = []
-
-        for i, line in enumerate(lines):
-
-            if "(" in line:
-                for match in re.finditer(r"(\w+)\s+(\()", line):
-                    if match.group(1) not in ("while", "for", "do", "if", "case", "switch", "catch"):
-                        errors.append(
-                            ErrorEntry(
-                                file_name=filename,
-                                line=i + 1,
-                                column=match.start(2),
-                                message="Перед открывающейся скобкой не должно быть пробела",
-                            )
-                        )
-
-                for match in re.finditer(r"(\(\s)", line):
-                    errors.append(
-                        ErrorEntry(
-                            file_name=filename,
-                            line=i + 1,
-                            column=match.start(1) + 2,
-                            message="После открывающейся скобкой не должно быть пробела",
-                        )
-                    )
-
-            if ")" in line:
-                for match in re.finditer(r"\S\s+(\))", line):
-                    errors.append(
-                        ErrorEntry(
-                            file_name=filename,
-                            line=i + 1,
-                            column=match.start(1),
-                            message="Перед закрывающейся скобкой не должно быть пробела",
-                        )
-                    )
-
-                for match in re.finditer(r"(\))\w", line):
-                    errors.append(
-                        ErrorEntry(
-                            file_name=filename,
-                            line=i + 1,
-                            column=match.start(1),
-                            message="После закрывающейся скобки должен быть пробел",
-                        )
-                    )
-
-            if "{" in line:
-                for match in re.finditer(r"\S{", line):
-                    errors.append(
-                        ErrorEntry(
-                            file_name=filename,
-                            line=i + 1,
-                            column=match.start() + 1,
-                            message="Перед открывающей фигурной скобкой должен быть пробел",
-                        )
-                    )
-
-        return errors
+    def _check_no_spaces_around_brackets_in_line(
+        self, line: str, index: int, filename: str, errors: list[ErrorEntry]
+    ) -> None:
+        """Проверяет пробелы вокруг скобок в строке index и дописывает ошибки в errors"""
 
-    def _check_no_spaces_around_operators(self, lines: list[str], filename: str) -> list[ErrorEntry]:
-        """Проверяет, окружен ли каждый оператор пробелами"""
+        if "(" in line:
+            for match in BEFORE_OPEN_BRACKET.pattern.finditer(line):
+                if match.group(1) not in BRACKET_KEYWORDS:
+                    errors.append(BEFORE_OPEN_BRACKET.error(filename, index, match))
 
-        errors = []
+            for match in AFTER_OPEN_BRACKET.pattern.finditer(line):
+                errors.append(AFTER_OPEN_BRACKET.error(filename, index, match))
 
-        operator_pattern = r"==|->|\+|-|\*|/(?:/)|="
+        if ")" in line:
+            for rule in (BEFORE_CLOSE_BRACKET, AFTER_CLOSE_BRACKET):
+                for match in rule.pattern.finditer(line):
+                    errors.append(rule.error(filename, index, match))
 
-        for i, line in enumerate(lines):
+        if "{" in line:
+            for match in BEFORE_BRACE.pattern.finditer(line):
+                errors.append(BEFORE_BRACE.error(filename, index, match))
+
+    def _check_no_spaces_around_operators(self, lines: list[str], filename: str) -> list[ErrorEntry]:
+        """Проверяет, окружен ли каждый оператор пробелами"""
+        return list(iter_line_check(self._check_no_spaces_around_operators_in_line, lines, filename))
 
-            if re.search(operator_pattern, line):
-                match = re.search(operator_pattern, line)
+    def _check_no_spaces_around_operators_in_line(
+        self, line: str, index: int, filename: str, errors: list[ErrorEntry]
+    ) -> None:
+        """Проверяет пробелы вокруг первого оператора в строке index и дописывает ошибки в errors"""
 
-                if match:
-                    start = match.start()
-                    end = match.end()
+        match = OPERATOR.pattern.search(line)
 
-                    if not (line[start - 1].isspace() and line[end].isspace()):
-                        errors.append(
-                            ErrorEntry(
-                                file_name=filename,
-                                line=i + 1,
-                                column=start + 1,
-                                message="Операторы должны быть окружены пробелами",
-                            )
-                        )
+        if match:
+            start = match.start()
+            end = match.end()
 
-        return errors
+            if not (line[start - 1].isspace() and line[end].isspace()):
+                errors.append(OPERATOR.error(filename, index, match))
@@ -0,0 +1,94 @@
+import re
+from typing import NamedTuple
+
+from java_linter.dialects import SpaceDialect
+from java_linter.messages import MessageCode
+from java_linter.shared import ErrorEntry
+
+# Номера проверок SpaceLinter в порядке их запуска
+AFTER_COMMA_CHECK = 0
+BEFORE_COMMA_CHECK = 1
+BRACKETS_CHECK = 2
+OPERATORS_CHECK = 3
+BEFORE_DOT_COMMA_CHECK = 4
+DOT_CHECK = 5
+MANY_SPACES_CHECK = 6
+
+BRACKET_KEYWORDS = ("while", "for", "do", "if", "case", "switch", "catch")
+
+
+class SpaceRule(NamedTuple):
+    """
+    Правило проверки пробелов: выражение построчной проверки SpaceLinter и код сообщения.
+    Столбец ошибки - match.start(group) + shift; check - номер проверки SpaceLinter, к которой относится правило
+    """
+
+    code: MessageCode
+    check: int
+    pattern: re.Pattern[str]
+    group: int = 0
+    shift: int = 1
+
+    def error(self, filename: str, index: int, match: re.Match[str]) -> ErrorEntry:
+        """Ошибка правила для совпадения match в строке index"""
+        return ErrorEntry(
+            file_name=filename, line=index + 1, column=match.start(self.group) + self.shift, code=self.code
+        )
+
+
+def _space_rule(code: MessageCode, check: int, pattern: str, group: int = 0, shift: int = 1) -> SpaceRule:
+    return SpaceRule(code=code, check=check, pattern=re.compile(pattern), group=group, shift=shift)
+
+
+AFTER_COMMA = _space_rule(MessageCode.SPACE_AFTER_COMMA, AFTER_COMMA_CHECK, r",\S")
+BEFORE_COMMA = _space_rule(MessageCode.SPACE_BEFORE_COMMA, BEFORE_COMMA_CHECK, r"\s,")
+
+# Перед скобкой после ключевого слова из BRACKET_KEYWORDS пробел нужен
+BEFORE_OPEN_BRACKET = _space_rule(
+    MessageCode.SPACE_BEFORE_OPEN_BRACKET, BRACKETS_CHECK, r"(\w+)\s+(\()", group=2, shift=0
+)
+AFTER_OPEN_BRACKET = _space_rule(MessageCode.SPACE_AFTER_OPEN_BRACKET, BRACKETS_CHECK, r"\(\s", shift=2)
+BEFORE_CLOSE_BRACKET = _space_rule(
+    MessageCode.SPACE_BEFORE_CLOSE_BRACKET, BRACKETS_CHECK, r"\S\s+(\))", group=1, shift=0
+)
+AFTER_CLOSE_BRACKET = _space_rule(MessageCode.SPACE_AFTER_CLOSE_BRACKET, BRACKETS_CHECK, r"(\))\w", group=1, shift=0)
+BEFORE_BRACE = _space_rule(MessageCode.SPACE_BEFORE_BRACE, BRACKETS_CHECK, r"\S\{")
+
+# Проверяется только первый оператор в строке
+OPERATOR = _space_rule(MessageCode.SPACE_AROUND_OPERATOR, OPERATORS_CHECK, r"==|->|\+|-|\*|//|=")
+
+BEFORE_DOT_COMMA = _space_rule(MessageCode.SPACE_BEFORE_DOT_COMMA, BEFORE_DOT_COMMA_CHECK, r"\s;")
+BEFORE_DOT = _space_rule(MessageCode.SPACE_BEFORE_DOT, DOT_CHECK, r"\s\.")
+AFTER_DOT = _space_rule(MessageCode.SPACE_AFTER_DOT, DOT_CHECK, r"\.\s")
+
+# Серия пробелов, после которой начинается комментарий, ошибкой не считается
+MANY_SPACES = _space_rule(MessageCode.MORE_THAN_ONE_SPACE, MANY_SPACES_CHECK, r"\S\s\s+")
+
+# Все правила в порядке, в котором SpaceLinter.seek_for_errors выдает их ошибки
+SPACE_RULES = (
+    AFTER_COMMA,
+    BEFORE_COMMA,
+    BEFORE_OPEN_BRACKET,
+    AFTER_OPEN_BRACKET,
+    BEFORE_CLOSE_BRACKET,
+    AFTER_CLOSE_BRACKET,
+    BEFORE_BRACE,
+    OPERATOR,
+    BEFORE_DOT_COMMA,
+    BEFORE_DOT,
+    AFTER_DOT,
+    MANY_SPACES,
+)
+
+
+def enabled_checks(dialect: SpaceDialect) -> tuple[bool, ...]:
+    """Возвращает для каждой проверки SpaceLinter (по номерам *_CHECK), включена ли она в диалекте"""
+    return (
+        dialect.after_comma,
+        dialect.no_before_comma,
+        dialect.no_around_brackets,
+        dialect.around_operators,
+        dialect.no_before_dot_comma,
+        dialect.no_around_dot,
+        not dialect.may_be_more_that_one_space,
+    )
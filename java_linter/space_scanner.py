@@ -0,0 +1,222 @@
+import re
+from operator import itemgetter
+from typing import Iterator
+
+from java_linter import space_rules
+from java_linter.dialects import SpaceDialect
+from java_linter.shared import ErrorEntry
+from java_linter.space_rules import BRACKET_KEYWORDS, SPACE_RULES, enabled_checks
+
+# Номера правил - их места в SPACE_RULES, то есть в порядке, в котором SpaceLinter.seek_for_errors выдает ошибки
+_AFTER_COMMA = SPACE_RULES.index(space_rules.AFTER_COMMA)
+_BEFORE_COMMA = SPACE_RULES.index(space_rules.BEFORE_COMMA)
+_BEFORE_OPEN_BRACKET = SPACE_RULES.index(space_rules.BEFORE_OPEN_BRACKET)
+_AFTER_OPEN_BRACKET = SPACE_RULES.index(space_rules.AFTER_OPEN_BRACKET)
+_BEFORE_CLOSE_BRACKET = SPACE_RULES.index(space_rules.BEFORE_CLOSE_BRACKET)
+_AFTER_CLOSE_BRACKET = SPACE_RULES.index(space_rules.AFTER_CLOSE_BRACKET)
+_BEFORE_BRACE = SPACE_RULES.index(space_rules.BEFORE_BRACE)
+_OPERATOR = SPACE_RULES.index(space_rules.OPERATOR)
+_BEFORE_DOT_COMMA = SPACE_RULES.index(space_rules.BEFORE_DOT_COMMA)
+_BEFORE_DOT = SPACE_RULES.index(space_rules.BEFORE_DOT)
+_AFTER_DOT = SPACE_RULES.index(space_rules.AFTER_DOT)
+_MANY_SPACES = SPACE_RULES.index(space_rules.MANY_SPACES)
+
+
+def _is_word_char(char: str) -> bool:
+    """Проверяет, подходит ли символ под \\w"""
+    return char.isalnum() or char == "_"
+
+
+class CombinedSpaceScanner:
+    """
+    Проверки SpaceLinter, собранные в одно регулярное выражение.
+    Каждое правило привязано к своему символу (запятая, скобка, точка, оператор, серия пробелов), а окружение
+    проверяется опережающими и ретроспективными проверками, так что выражение останавливается только на нарушениях.
+    Строка сканируется один раз, результат совпадает с SpaceLinter.seek_for_errors
+    """
+
+    def __init__(self, dialect: SpaceDialect):
+        enabled = enabled_checks(dialect)
+
+        self._rules = frozenset(rule for rule, space_rule in enumerate(SPACE_RULES) if enabled[space_rule.check])
+
+        checks = [check for check, is_enabled in enumerate(enabled) if is_enabled]
+        self._bucket_count = len(checks)
+        self._buckets = [checks.index(rule.check) if enabled[rule.check] else -1 for rule in SPACE_RULES]
+
+        self._pattern = self._compile({rule for rule in self._rules if rule != _OPERATOR})
+        self._pattern_with_operators = self._compile(set(self._rules)) if _OPERATOR in self._rules else None
+
+    def _compile(self, rules: set[int]) -> re.Pattern[str] | None:
+        """Собирает выражение из именованных групп по опорным символам для правил rules"""
+
+        anchors = (
+            ("comma", ",", ((_AFTER_COMMA, r"(?=\S)"), (_BEFORE_COMMA, r"(?<=\s,)"))),
+            ("open", r"\(", ((_BEFORE_OPEN_BRACKET, r"(?<=\s\()"), (_AFTER_OPEN_BRACKET, r"(?=\s)"))),
+            ("close", r"\)", ((_BEFORE_CLOSE_BRACKET, r"(?<=\s\))"), (_AFTER_CLOSE_BRACKET, r"(?=\w)"))),
+            ("brace", r"\{", ((_BEFORE_BRACE, r"(?<=\S\{)"),)),
+            ("dot_comma", ";", ((_BEFORE_DOT_COMMA, r"(?<=\s;)"),)),
+            ("dot", r"\.", ((_BEFORE_DOT, r"(?<=\s\.)"), (_AFTER_DOT, r"(?=\s)"))),
+            ("spaces", r"\s", ((_MANY_SPACES, r"(?<=\S\s)\s+"),)),
+            ("operator", "", ((_OPERATOR, space_rules.OPERATOR.pattern.pattern),)),
+        )
+
+        branches = []
+
+        for name, anchor, conditions in anchors:
+            enabled_conditions = [condition for rule, condition in conditions if rule in rules]
+
+            if enabled_conditions:
+                branches.append(f"(?P<{name}>{anchor}(?:{'|'.join(enabled_conditions)}))")
+
+        return re.compile("|".join(branches)) if branches else None
+
+    def seek_for_errors(self, lines: list[str], filename: str) -> list[ErrorEntry]:
+        """Ищет ошибки в java файле и выдает их в виде списка ErrorEntry"""
+
+        buckets = self.new_buckets()
+
+        for i, line in enumerate(lines):
+            self.scan_line(line, i, filename, buckets)
+
+        return [error for bucket in buckets for error in bucket]
+
+    def iter_errors(self, lines: list[str], filename: str) -> Iterator[ErrorEntry]:
+        """Лениво выдает ошибки строку за строкой; внутри строки ошибки идут в порядке проверок SpaceLinter"""
+
+        buckets = self.new_buckets()
+
+        for i, line in enumerate(lines):
+            self.scan_line(line, i, filename, buckets)
+
+            for bucket in buckets:
+                if bucket:
+                    yield from bucket
+                    bucket.clear()
+
+    def new_buckets(self) -> list[list[ErrorEntry]]:
+        """Возвращает пустые списки ошибок для каждой включенной проверки"""
+        return [[] for _ in range(self._bucket_count)]
+
+    def scan_line(self, line: str, index: int, filename: str, buckets: list[list[ErrorEntry]]) -> None:
+        """Сканирует строку index и раскладывает найденные ошибки по спискам buckets из new_buckets"""
+
+        pattern = self._pattern_with_operators or self._pattern
+
+        if not pattern:
+            return
+
+        rules = self._rules
+
+        # (номер правила, начало совпадения, конец совпадения, столбец)
+        hits: list[tuple[int, int, int, int]] = []
+
+        position = 0
+        match = pattern.search(line)
+
+        while match:
+            anchor = match.lastgroup
+            pos = match.start()
+
+            if anchor == "comma":
+                if _AFTER_COMMA in rules and pos + 1 < len(line) and not line[pos + 1].isspace():
+                    hits.append((_AFTER_COMMA, pos, pos + 2, pos + 1))
+                if _BEFORE_COMMA in rules and pos > 0 and line[pos - 1].isspace():
+                    hits.append((_BEFORE_COMMA, pos - 1, pos + 1, pos))
+
+            elif anchor == "open":
+                if _BEFORE_OPEN_BRACKET in rules:
+                    word_end = pos
+                    while word_end > 0 and line[word_end - 1].isspace():
+                        word_end -= 1
+
+                    word_start = word_end
+                    while word_start > 0 and _is_word_char(line[word_start - 1]):
+                        word_start -= 1
+
+                    if word_end < pos and word_start < word_end:
+                        hits.append((_BEFORE_OPEN_BRACKET, word_start, pos + 1, pos))
+
+                if _AFTER_OPEN_BRACKET in rules and pos + 1 < len(line) and line[pos + 1].isspace():
+                    hits.append((_AFTER_OPEN_BRACKET, pos, pos + 2, pos + 2))
+
+            elif anchor == "close":
+                if _BEFORE_CLOSE_BRACKET in rules:
+                    start = pos
+                    while start > 0 and line[start - 1].isspace():
+                        start -= 1
+
+                    if 0 < start < pos:
+                        hits.append((_BEFORE_CLOSE_BRACKET, start - 1, pos + 1, pos))
+
+                if _AFTER_CLOSE_BRACKET in rules and pos + 1 < len(line) and _is_word_char(line[pos + 1]):
+                    hits.append((_AFTER_CLOSE_BRACKET, pos, pos + 2, pos))
+
+            elif anchor == "brace":
+                hits.append((_BEFORE_BRACE, pos - 1, pos + 1, pos))
+
+            elif anchor == "dot_comma":
+                hits.append((_BEFORE_DOT_COMMA, pos - 1, pos + 1, pos))
+
+            elif anchor == "dot":
+                if _BEFORE_DOT in rules and pos > 0 and line[pos - 1].isspace():
+                    hits.append((_BEFORE_DOT, pos - 1, pos + 1, pos))
+                if _AFTER_DOT in rules and pos + 1 < len(line) and line[pos + 1].isspace():
+                    hits.append((_AFTER_DOT, pos, pos + 2, pos + 1))
+
+            elif anchor == "spaces":
+                hits.append((_MANY_SPACES, pos - 1, match.end(), pos))
+
+            else:
+                hits.append((_OPERATOR, pos, match.end(), pos + 1))
+
+                # Как и SpaceLinter, проверяем только первый оператор в строке
+                pattern = self._pattern
+
+                if not pattern:
+                    break
+
+            position = match.end()
+            match = pattern.search(line, position)
+
+        if hits:
+            self._dispatch(hits, line, index, filename, buckets)
+
+    def _dispatch(
+        self,
+        hits: list[tuple[int, int, int, int]],
+        line: str,
+        index: int,
+        filename: str,
+        buckets: list[list[ErrorEntry]],
+    ) -> None:
+        """Отбрасывает совпадения, которые не нашел бы re.finditer по отдельному правилу, и раскладывает ошибки"""
+
+        hits.sort(key=itemgetter(0, 1))
+        next_allowed = -1
+        previous_rule = -1
+
+        for rule, start, end, column in hits:
+
+            # Как и re.finditer по одному правилу, не берем совпадения, пересекающиеся с предыдущим
+            if rule == previous_rule and start < next_allowed:
+                continue
+
+            previous_rule = rule
+            next_allowed = end
+
+            if rule == _BEFORE_OPEN_BRACKET:
+                if line[start : end - 1].rstrip() in BRACKET_KEYWORDS:
+                    continue
+
+            elif rule == _OPERATOR:
+                if line[start - 1].isspace() and line[end].isspace():
+                    continue
+
+            elif rule == _MANY_SPACES:
+                if line[end] == "/":
+                    continue
+
+            buckets[self._buckets[rule]].append(
+                ErrorEntry(file_name=filename, line=index + 1, column=column, code=SPACE_RULES[rule].code)
+            )
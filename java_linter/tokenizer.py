@@ -0,0 +1,223 @@
+import re
+from enum import Enum
+from typing import NamedTuple
+
+
+class TokenKind(Enum):
+    IDENTIFIER = "IDENTIFIER"
+    KEYWORD = "KEYWORD"
+    OPERATOR = "OPERATOR"
+    PUNCTUATION = "PUNCTUATION"
+    NUMBER = "NUMBER"
+    STRING = "STRING"
+    CHAR = "CHAR"
+    COMMENT = "COMMENT"
+
+
+class Token(NamedTuple):
+    """Токен java-кода. Строка и столбец его начала считаются с единицы, как в ErrorEntry"""
+
+    kind: TokenKind
+    text: str
+    line: int
+    column: int
+
+
+class TokenizedSource(NamedTuple):
+    """
+    Поток токенов файла и строки кода, в которых содержимое литералов и комментариев заменено на MASK_CHAR.
+    Длина и переносы строк сохраняются, так что столбцы совпадают с исходными
+    """
+
+    tokens: list[Token]
+    code_lines: list[str]
+
+
+MASK_CHAR = "#"
+
+JAVA_KEYWORDS = frozenset(
+    (
+        "abstract",
+        "assert",
+        "boolean",
+        "break",
+        "byte",
+        "case",
+        "catch",
+        "char",
+        "class",
+        "const",
+        "continue",
+        "default",
+        "do",
+        "double",
+        "else",
+        "enum",
+        "extends",
+        "final",
+        "finally",
+        "float",
+        "for",
+        "goto",
+        "if",
+        "implements",
+        "import",
+        "instanceof",
+        "int",
+        "interface",
+        "long",
+        "native",
+        "new",
+        "package",
+        "private",
+        "protected",
+        "public",
+        "return",
+        "short",
+        "static",
+        "strictfp",
+        "super",
+        "switch",
+        "synchronized",
+        "this",
+        "throw",
+        "throws",
+        "transient",
+        "try",
+        "void",
+        "volatile",
+        "while",
+        "true",
+        "false",
+        "null",
+    )
+)
+
+_COMMENT = r"//[^\n]*|/\*(?s:.*?)(?:\*/|\Z)"
+_STRING = r"""\"\"\"(?s:(?:\\.|[^\\])*?)(?:\"\"\"|\Z)|"(?:\\.|[^"\\\n])*"?"""
+_CHAR = r"'(?:\\.|[^'\\\n])*'?"
+
+_TOKEN_PATTERN = re.compile(
+    rf"""
+    (?P<COMMENT>{_COMMENT})
+    |(?P<STRING>{_STRING})
+    |(?P<CHAR>{_CHAR})
+    |(?P<NUMBER>\.?\d(?:[\w.]|(?<=[eEpP])[+-])*)
+    |(?P<IDENTIFIER>[^\W\d][\w$]*|\$[\w$]*)
+    |(?P<PUNCTUATION>\.\.\.|::|[(){{}}\[\];,.@])
+    |(?P<OPERATOR>>>>=|<<=|>>=|>>>|->|\+\+|--|&&|\|\||<<|>>|[=!<>+\-*/%&|^]=|[=<>!~?:+\-*/%&|^])
+    |(?P<SPACE>\s+)
+    |(?P<OTHER>.)
+    """,
+    re.VERBOSE,
+)
+
+# Только литералы и комментарии. Остальные токены _TOKEN_PATTERN не содержат кавычек, а '/' в них не стоит
+# перед '/' или '*', поэтому поиск только этих токенов находит их на тех же местах, что и полный разбор
+_MASK_PATTERN = re.compile(rf"(?P<COMMENT>{_COMMENT})|(?P<STRING>{_STRING})|(?P<CHAR>{_CHAR})")
+
+_MASKED_KINDS = (TokenKind.COMMENT, TokenKind.STRING, TokenKind.CHAR)
+_NOT_NEWLINE = re.compile(r"[^\n]")
+
+
+def tokenize(lines: list[str]) -> TokenizedSource:
+    """
+    Разбирает строки файла на токены за один проход и строит по ним строки кода без литералов и комментариев.
+    Если нужны только строки кода, mask_code_lines строит их без объектов Token
+    """
+
+    source, added_newlines = _join_lines(lines)
+
+    tokens: list[Token] = []
+    code_parts: list[str] = []
+    copied_until = 0
+
+    line_number = 1
+    line_start = 0
+    counted_until = 0
+
+    for match in _TOKEN_PATTERN.finditer(source):
+        kind_name = match.lastgroup
+
+        if kind_name == "SPACE" or kind_name == "OTHER":
+            continue
+
+        start = match.start()
+        text = match.group()
+
+        newlines = source.count("\n", counted_until, start)
+        counted_until = start
+
+        if newlines:
+            line_number += newlines
+            line_start = source.rfind("\n", 0, start) + 1
+
+        kind = TokenKind(kind_name)
+
+        if kind == TokenKind.IDENTIFIER and text in JAVA_KEYWORDS:
+            kind = TokenKind.KEYWORD
+
+        tokens.append(Token(kind=kind, text=text, line=line_number, column=start - line_start + 1))
+
+        if kind in _MASKED_KINDS:
+            code_parts.append(source[copied_until:start])
+            code_parts.append(_mask(kind, text))
+            copied_until = match.end()
+
+    code_parts.append(source[copied_until:])
+
+    return TokenizedSource(tokens=tokens, code_lines=_split_code(code_parts, added_newlines))
+
+
+def mask_code_lines(lines: list[str]) -> list[str]:
+    """
+    Возвращает то же, что tokenize(lines).code_lines, но ищет только литералы и комментарии (см. _MASK_PATTERN)
+    и не строит объекты Token
+    """
+
+    source, added_newlines = _join_lines(lines)
+
+    code_parts: list[str] = []
+    copied_until = 0
+
+    for match in _MASK_PATTERN.finditer(source):
+        code_parts.append(source[copied_until : match.start()])
+        code_parts.append(_mask(TokenKind(match.lastgroup), match.group()))
+        copied_until = match.end()
+
+    code_parts.append(source[copied_until:])
+
+    return _split_code(code_parts, added_newlines)
+
+
+def _join_lines(lines: list[str]) -> tuple[str, list[bool]]:
+    """Склеивает строки в один текст, дописывая перевод строки строкам без него; возвращает и сами эти отметки"""
+
+    added_newlines = [not line.endswith("\n") for line in lines]
+    source = "".join(line + "\n" if added else line for line, added in zip(lines, added_newlines))
+
+    return source, added_newlines
+
+
+def _split_code(code_parts: list[str], added_newlines: list[bool]) -> list[str]:
+    """Разбивает маскированный текст обратно на строки, убирая переводы строк, дописанные _join_lines"""
+
+    code_lines = "".join(code_parts).split("\n")[:-1]
+
+    return [line if added else line + "\n" for line, added in zip(code_lines, added_newlines)]
+
+
+def _mask(kind: TokenKind, text: str) -> str:
+    """
+    Заменяет содержимое литерала или комментария на MASK_CHAR, оставляя кавычки литерала и первую '/' комментария,
+    чтобы проверки, смотрящие на соседние символы (например, на '//' после пробелов), работали как раньше
+    """
+
+    if kind == TokenKind.COMMENT:
+        return text[0] + _NOT_NEWLINE.sub(MASK_CHAR, text[1:])
+
+    quote = '"""' if text.startswith('"""') else text[0]
+    closed = len(text) >= 2 * len(quote) and text.endswith(quote)
+    body = text[len(quote) : -len(quote)] if closed else text[len(quote) :]
+
+    return quote + _NOT_NEWLINE.sub(MASK_CHAR, body) + (quote if closed else "")
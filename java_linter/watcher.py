@@ -0,0 +1,316 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from collections import Counter
+from stat import S_ISREG
+from typing import Iterable, Iterator, Sequence
+
+from java_linter.discovery import JAVA_EXTENSION, iter_java_files
+from java_linter.shared import ErrorEntry
+
+# Флаги inotify из <sys/inotify.h>
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF
+
+_EVENT_HEADER = struct.Struct("iIII")
+
+DEFAULT_POLL_INTERVAL = 0.5
+DEFAULT_DEBOUNCE = 0.3
+
+
+class PollingWatcher:
+    """
+    Следит за файлами, периодически обходя папки (через iter_java_files) и сравнивая mtime и размер файлов.
+    Работает везде, но каждый опрос стоит одного os.stat на файл
+    """
+
+    def __init__(self, paths: Iterable[str], excludes: Iterable[str] = (), interval: float = DEFAULT_POLL_INTERVAL):
+        self._paths = tuple(paths)
+        self._excludes = tuple(excludes)
+        self._interval = interval
+        self._stats = self._scan()
+
+    @property
+    def files(self) -> list[str]:
+        """Файлы, за которыми сейчас идет слежение"""
+        return list(self._stats)
+
+    def poll(self, timeout: float | None) -> set[str]:
+        """Возвращает новые, измененные и удаленные файлы; пустое множество - если за timeout изменений не было"""
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            delay = self._interval if deadline is None else min(self._interval, deadline - time.monotonic())
+
+            if delay > 0:
+                time.sleep(delay)
+
+            stats = self._scan()
+            changed = {path for path in stats.keys() | self._stats.keys() if stats.get(path) != self._stats.get(path)}
+            self._stats = stats
+
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self) -> None:
+        pass
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        stats = {}
+
+        for path in iter_java_files(self._paths, self._excludes):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+
+            if not S_ISREG(stat.st_mode):
+                continue
+
+            stats[path] = (stat.st_mtime_ns, stat.st_size)
+
+        return stats
+
+
+class InotifyWatcher:
+    """
+    Следит за файлами через inotify Linux (вызовами libc через ctypes): ядро само сообщает об изменениях в папках,
+    поэтому ожидание ничего не стоит. Слежение ставится на все папки, которые обходит iter_java_files, и на папки
+    явно переданных файлов. Новые папки и файлы подхватываются повторным обходом
+    """
+
+    def __init__(self, paths: Iterable[str], excludes: Iterable[str] = ()):
+        self._paths = tuple(paths)
+        self._excludes = tuple(excludes)
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1")
+
+        self._directories: dict[int, str] = {}
+        self._watched: set[str] = set()
+
+        # Нормализованный путь -> путь в том виде, в котором его выдает iter_java_files
+        self._files: dict[str, str] = {}
+        self._rescan()
+
+    @property
+    def files(self) -> list[str]:
+        """Файлы, за которыми сейчас идет слежение"""
+        return list(self._files.values())
+
+    def poll(self, timeout: float | None) -> set[str]:
+        """Возвращает новые, измененные и удаленные файлы; пустое множество - если за timeout изменений не было"""
+
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+
+        if not readable:
+            return set()
+
+        candidates, directories_changed, overflow = self._read_events()
+        changed = {self._files[path] for path in candidates if path in self._files}
+
+        for path in candidates:
+            if path in self._files and not os.path.isfile(self._files[path]):
+                del self._files[path]
+
+        if directories_changed or overflow or any(path not in self._files for path in candidates):
+            old_files = self._files
+            self._rescan()
+
+            added = self._files.keys() - old_files.keys()
+            removed = old_files.keys() - self._files.keys()
+            changed |= {self._files[path] for path in added} | {old_files[path] for path in removed}
+
+            # После переполнения очереди неизвестно, какие файлы менялись
+            if overflow:
+                changed |= set(self._files.values())
+
+        return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def _rescan(self) -> None:
+        """Обходит папки заново, ставя слежение на новые папки, и обновляет список файлов"""
+
+        files = {}
+
+        for path in iter_java_files(self._paths, self._excludes, on_directory=self._add_watch):
+            # Для явно переданного файла следим за его папкой, даже пока самого файла нет
+            if not os.path.isdir(path):
+                self._add_watch(os.path.dirname(path) or ".")
+
+            if os.path.isfile(path):
+                files[os.path.normpath(path)] = path
+
+        self._files = files
+
+    def _add_watch(self, directory: str) -> None:
+        if directory in self._watched:
+            return
+
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK | _IN_ONLYDIR)
+
+        if wd < 0:
+            return
+
+        # Переименованная папка сохраняет слежение, но теперь под новым путем
+        if wd in self._directories:
+            self._watched.discard(self._directories[wd])
+
+        self._directories[wd] = directory
+        self._watched.add(directory)
+
+    def _read_events(self) -> tuple[set[str], bool, bool]:
+        """
+        Читает накопившиеся события. Возвращает нормализованные пути измененных файлов, признак изменения папок
+        и признак переполнения очереди событий
+        """
+
+        candidates = set()
+        directories_changed = False
+        overflow = False
+
+        while True:
+            try:
+                data = os.read(self._fd, 1 << 16)
+            except BlockingIOError:
+                break
+
+            offset = 0
+
+            while offset < len(data):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+                offset += length
+
+                if mask & _IN_Q_OVERFLOW:
+                    overflow = True
+                    continue
+
+                directory = self._directories.get(wd)
+
+                if directory is None:
+                    continue
+
+                if mask & (_IN_IGNORED | _IN_DELETE_SELF):
+                    del self._directories[wd]
+                    self._watched.discard(directory)
+                    directories_changed = True
+                elif mask & _IN_ISDIR:
+                    directories_changed = True
+                elif name.endswith(JAVA_EXTENSION):
+                    candidates.add(os.path.normpath(os.path.join(directory, name)))
+
+        return candidates, directories_changed, overflow
+
+
+Watcher = PollingWatcher | InotifyWatcher
+
+
+def create_watcher(paths: Iterable[str], excludes: Iterable[str] = (), polling: bool = False) -> Watcher:
+    """Возвращает InotifyWatcher на Linux и PollingWatcher, если inotify недоступен или polling=True"""
+
+    paths = tuple(paths)
+    excludes = tuple(excludes)
+
+    if not polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(paths, excludes)
+        except (OSError, AttributeError):
+            pass
+
+    return PollingWatcher(paths, excludes)
+
+
+def iter_batches(watcher: Watcher, debounce: float = DEFAULT_DEBOUNCE) -> Iterator[set[str]]:
+    """Выдает измененные файлы пачками: пачка отдается, когда изменений не было debounce секунд"""
+
+    pending: set[str] = set()
+
+    while True:
+        changed = watcher.poll(debounce if pending else None)
+
+        if changed:
+            pending |= changed
+        elif pending:
+            yield pending
+            pending = set()
+
+
+def diff_errors(
+    old: list[ErrorEntry], new: list[ErrorEntry], old_lines: Sequence[str] = (), new_lines: Sequence[str] = ()
+) -> tuple[list[ErrorEntry], list[ErrorEntry]]:
+    """
+    Возвращает ошибки, которые появились в new, и ошибки old, которые исчезли; повторы считаются по количеству.
+    При переданном содержимом файла до и после правки (old_lines и new_lines) ошибки сопоставляются по тексту своей
+    строки и ее номеру среди строк с тем же текстом, а не по номеру в файле, так что вставка или удаление других
+    строк выше не делает прежние ошибки новыми, а ошибка, переехавшая на другую такую же строку (например, пустую),
+    считается новой
+    """
+
+    old_line_keys = _line_keys(old_lines)
+    new_line_keys = _line_keys(new_lines)
+    old_keys = [_error_key(error, old_line_keys) for error in old]
+    new_keys = [_error_key(error, new_line_keys) for error in new]
+    old_counts = Counter(old_keys)
+    new_counts = Counter(new_keys)
+    added = []
+    resolved = []
+
+    for error, key in zip(new, new_keys):
+        if old_counts[key]:
+            old_counts[key] -= 1
+        else:
+            added.append(error)
+
+    for error, key in zip(old, old_keys):
+        if new_counts[key]:
+            new_counts[key] -= 1
+        else:
+            resolved.append(error)
+
+    return added, resolved
+
+
+def _line_keys(lines: Sequence[str]) -> list[tuple[str, int]]:
+    """Для каждой строки - ее текст и сколько строк с тем же текстом стоит выше"""
+
+    seen: Counter[str] = Counter()
+    keys = []
+
+    for line in lines:
+        keys.append((line, seen[line]))
+        seen[line] += 1
+
+    return keys
+
+
+def _error_key(error: ErrorEntry, line_keys: list[tuple[str, int]]) -> tuple[object, ...]:
+    """Ключ ошибки для diff_errors: вместо номера строки - ключ строки из _line_keys, если он известен"""
+
+    line: object = line_keys[error.line - 1] if 0 < error.line <= len(line_keys) else error.line
+
+    return error.file_name, line, error.column, error.code, error.params
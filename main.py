@@ -1,46 +1,595 @@
+import argparse
+import os
 import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Iterable, NamedTuple, Sequence
 
-from java_linter.linter import Linter
+from java_linter.discovery import filter_java_files, iter_java_files
+from java_linter.error_store import ErrorStore
+from java_linter.git_diff import ChangedLines, GitDiffError, git_changed_lines
+from java_linter.line_guard import DEFAULT_LINE_TIME_LIMIT
+from java_linter.linter import Linter, LinterOptions, load_linter
+from java_linter.messages import DEFAULT_LANGUAGE, LANGUAGES
+from java_linter.mmap_scanner import MappedLines, map_file
+from java_linter.numpy_backend import HAS_NUMPY
+from java_linter.profiling import FileProfile, Profiler
+from java_linter.reporters import REPORTERS, Reporter, TextReporter, open_output
+from java_linter.result_cache import DEFAULT_CACHE_DIR, ResultCache
 from java_linter.shared import ErrorEntry
+from java_linter.watcher import DEFAULT_DEBOUNCE, create_watcher, diff_errors, iter_batches
 
+# Сколько файлов на один процесс может одновременно находиться в пуле при потоковой подаче файлов
+_IN_FLIGHT_PER_JOB = 4
+
+
+def lint_java_code(
+    filename: str,
+    linter: Linter,
+    cache: ResultCache | None = None,
+    mapped: bool = False,
+    max_errors: int | None = None,
+    changed: ChangedLines | None = None,
+    lines: list[str] | None = None,
+) -> list[ErrorEntry]:
+    """
+    Выполняет линтинг Java-кода в заданном файле. При переданном cache неизмененные файлы берутся из него.
+    При переданных lines (уже прочитанном содержимом файла) файл не читается повторно, а mapped не используется.
+    При mapped=True файл отображается в память и не читается в список строк (см. Linter.seek_for_errors_in_buffer).
+    При переданном max_errors возвращаются только первые max_errors ошибок, а проверка файла прекращается,
+    как только они найдены.
+    При переданном changed возвращаются только ошибки на измененных строках (см. Linter.seek_for_changed_errors),
+    кэш и mapped в этом случае не используются
+    """
+
+    if changed is not None:
+        return _lint_changed(filename, linter, changed)[:max_errors]
+
+    if cache:
+        cached_errors = cache.get(filename)
+
+        if cached_errors is not None:
+            return cached_errors[:max_errors]
+
+    if lines is None:
+        try:
+            if mapped:
+                return _lint_mapped(filename, linter, cache)[:max_errors]
+
+            with open(filename, "r") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            print(f"Файл не найден: {filename}", file=sys.stderr)
+            sys.exit(1)
+        except Exception as e:
+            print(f"Ошибка при чтении файла: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    all_errors = linter.seek_for_errors(lines, filename, max_errors)
+
+    # Обрезанный по max_errors результат не годится для кэша
+    if cache and (max_errors is None or len(all_errors) < max_errors):
+        cache.put(filename, lines, all_errors)
+
+    return all_errors
+
+
+def _lint_changed(filename: str, linter: Linter, changed: ChangedLines) -> list[ErrorEntry]:
+    """Линтит только измененные строки файла"""
 
-def lint_java_code(filename: str, linter: Linter) -> list[ErrorEntry]:
-    """Выполняет линтинг Java-кода в заданном файле."""
     try:
         with open(filename, "r") as f:
             lines = f.readlines()
     except FileNotFoundError:
-        print(f"Файл не найден: {filename}")
+        print(f"Файл не найден: {filename}", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
-        print(f"Ошибка при чтении файла: {e}")
+        print(f"Ошибка при чтении файла: {e}", file=sys.stderr)
         sys.exit(1)
 
-    all_errors = linter.seek_for_errors(lines, filename)
+    return linter.seek_for_changed_errors(lines, filename, changed)
+
+
+def _lint_mapped(filename: str, linter: Linter, cache: ResultCache | None) -> list[ErrorEntry]:
+    """Линтит файл, отображенный в память; хэш для кэша считается по тому же отображению"""
+
+    with map_file(filename) as buffer:
+        errors = linter.seek_for_errors_in_buffer(buffer, filename)
+
+        if cache:
+            cache.put(filename, MappedLines(buffer), errors)
+
+    return errors
+
+
+def print_errors(filename: str, errors: list[ErrorEntry] | ErrorStore, language: str = DEFAULT_LANGUAGE) -> None:
+    """Печатает найденные в файле ошибки с сообщениями на языке language"""
+    TextReporter(sys.stdout, language).report_file(filename, errors)
+
+
+class LintSettings(NamedTuple):
+    """Настройки линтинга, общие для главного процесса и процессов-обработчиков"""
+
+    dialect_filename: str
+    linter_options: LinterOptions
+    cache_dir: str | None = None
+    mapped: bool = False
+    profile: bool = False
+    language: str = DEFAULT_LANGUAGE
+
+
+class LintSession:
+    """Linter, кэш результатов и профилировщик одного процесса"""
+
+    def __init__(self, settings: LintSettings):
+        self.settings = settings
+        self.profiler = Profiler() if settings.profile else None
+
+        # Профилировщик оборачивает проверки, поэтому такой Linter не берется из общего кэша load_linter
+        self.linter = (
+            Linter.from_options(settings.dialect_filename, settings.linter_options, self.profiler)
+            if self.profiler
+            else load_linter(settings.dialect_filename, settings.linter_options)
+        )
+        self.cache = _make_cache(self.linter, settings)
+
+    def lint(
+        self,
+        filename: str,
+        max_errors: int | None = None,
+        changed: ChangedLines | None = None,
+        lines: list[str] | None = None,
+    ) -> tuple[list[ErrorEntry], FileProfile | None]:
+        """
+        Линтит файл (при переданном changed - только измененные строки), находя не больше max_errors ошибок.
+        Уже прочитанное содержимое файла передается в lines (см. lint_java_code).
+        При включенном профилировании возвращает и профиль файла
+        """
+
+        mapped = self.settings.mapped
+
+        if not self.profiler:
+            return lint_java_code(filename, self.linter, self.cache, mapped, max_errors, changed, lines), None
+
+        self.profiler.start_file()
+        start = time.perf_counter()
+        errors = lint_java_code(filename, self.linter, self.cache, mapped, max_errors, changed, lines)
+        seconds = time.perf_counter() - start
+
+        line_count, size = _count_lines(filename)
+
+        return errors, self.profiler.finish_file(filename, line_count, size, seconds)
+
+
+_worker_session: LintSession | None = None
+
+
+def _init_worker(settings: LintSettings) -> None:
+    """Создает в процессе-обработчике LintSession, которая используется для всех его файлов"""
+    global _worker_session
+    _worker_session = LintSession(settings)
+
+
+class WorkerResult(NamedTuple):
+    """
+    Результат проверки файла в процессе-обработчике: ошибки, профиль файла при включенном профилировании
+    и байты, записанные в кэш результатов (их учитывает кэш главного процесса перед evict)
+    """
+
+    errors: ErrorStore
+    profile: FileProfile | None
+    cache_written: int
+
+
+def _lint_in_worker(filename: str, max_errors: int | None = None, changed: ChangedLines | None = None) -> WorkerResult:
+    """
+    Линтит файл в LintSession, созданной в _init_worker. Ошибки возвращаются в ErrorStore: пока результат ждет
+    печати в главном процессе, он занимает в несколько раз меньше памяти, чем список ErrorEntry
+    """
+    assert _worker_session is not None
+    errors, profile = _worker_session.lint(filename, max_errors, changed)
+    cache_written = _worker_session.cache.take_written() if _worker_session.cache else 0
+    return WorkerResult(ErrorStore.from_entries(errors), profile, cache_written)
+
+
+class ErrorLimits:
+    """Ограничения числа выводимых ошибок: в одном файле и за весь запуск; None - без ограничения"""
+
+    def __init__(self, per_file: int | None = None, total: int | None = None):
+        self.per_file = per_file
+        self.total = total
+        self.found = 0
+
+    @property
+    def exhausted(self) -> bool:
+        """Выведено столько ошибок, сколько разрешено за весь запуск"""
+        return self.total is not None and self.found >= self.total
+
+    def file_limit(self) -> int | None:
+        """Сколько ошибок можно найти в следующем файле"""
+
+        if self.total is None:
+            return self.per_file
+
+        remaining = max(self.total - self.found, 0)
+
+        return remaining if self.per_file is None else min(self.per_file, remaining)
+
+    def take(self, errors: list[ErrorEntry] | ErrorStore) -> list[ErrorEntry] | ErrorStore:
+        """Обрезает ошибки файла по оставшимся ограничениям и учитывает их"""
+
+        limit = self.file_limit()
+
+        if limit is not None and len(errors) > limit:
+            if isinstance(errors, ErrorStore):
+                errors.truncate(limit)
+            else:
+                errors = errors[:limit]
+
+        self.found += len(errors)
+
+        return errors
+
+
+def _make_cache(linter: Linter, settings: LintSettings) -> ResultCache | None:
+    """Создает кэш результатов в settings.cache_dir или возвращает None, если кэш выключен"""
+
+    if not settings.cache_dir:
+        return None
+
+    # В режиме mmap опции Linter'а не используются, а результат может отличаться на крайних случаях
+    options = {"mmap": True} if settings.mapped else settings.linter_options._asdict()
+
+    return ResultCache(linter.dialect, options, settings.cache_dir)
+
+
+def _count_lines(filename: str) -> tuple[int, int]:
+    """Возвращает число строк и размер файла в байтах, читая его кусками"""
+
+    lines = 0
+    size = 0
+    last_chunk = b""
+
+    with open(filename, "rb") as f:
+        while chunk := f.read(1 << 20):
+            lines += chunk.count(b"\n")
+            size += len(chunk)
+            last_chunk = chunk
+
+    if last_chunk and not last_chunk.endswith(b"\n"):
+        lines += 1
+
+    return lines, size
 
-    return all_errors
+
+def lint_in_parallel(
+    settings: LintSettings,
+    filenames: Iterable[str],
+    jobs: int,
+    ordered: bool,
+    reporter: Reporter,
+    profiler: Profiler | None = None,
+    limits: ErrorLimits | None = None,
+    changes: dict[str, ChangedLines] | None = None,
+    cache: ResultCache | None = None,
+) -> None:
+    """
+    Линтит файлы в пуле из jobs процессов и передает результаты в reporter по мере готовности.
+    Файлы отправляются в пул по мере их получения из filenames, но в работе одновременно не больше
+    _IN_FLIGHT_PER_JOB * jobs файлов. При ordered=True результаты выводятся в порядке filenames.
+    Профили файлов из процессов-обработчиков добавляются в profiler, а записанные ими в кэш байты - в cache,
+    чтобы cache.evict знал о росте кэша.
+    Когда исчерпаны limits, новые файлы не отправляются, а ждущие в пуле отменяются.
+    При переданном changes в файлах проверяются только измененные строки из changes
+    """
+
+    limits = limits or ErrorLimits()
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(settings,)) as executor:
+
+        # Словарь сохраняет порядок отправки, он нужен для ordered
+        pending: dict[Future[WorkerResult], str] = {}
+
+        try:
+            for filename in filenames:
+                changed = changes[filename] if changes is not None else None
+                pending[executor.submit(_lint_in_worker, filename, limits.file_limit(), changed)] = filename
+                _print_finished(
+                    pending,
+                    ordered,
+                    reporter,
+                    profiler,
+                    limits,
+                    block=len(pending) >= _IN_FLIGHT_PER_JOB * jobs,
+                    cache=cache,
+                )
+
+                if limits.exhausted:
+                    break
+
+            while pending and not limits.exhausted:
+                _print_finished(pending, ordered, reporter, profiler, limits, block=True, cache=cache)
+
+            if pending:
+                executor.shutdown(wait=True, cancel_futures=True)
+        except BaseException:
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+
+
+def _print_finished(
+    pending: dict[Future[WorkerResult], str],
+    ordered: bool,
+    reporter: Reporter,
+    profiler: Profiler | None,
+    limits: ErrorLimits,
+    block: bool,
+    cache: ResultCache | None = None,
+) -> None:
+    """
+    Передает в reporter и убирает из pending готовые результаты. При block=True сначала дожидается хотя бы одного
+    из них. При ordered=True выводит только готовые результаты из начала pending. После исчерпания limits
+    ничего не выводит
+    """
+
+    if ordered:
+        while pending and not limits.exhausted:
+            future = next(iter(pending))
+
+            if not future.done() and not block:
+                return
+
+            _handle_result(pending.pop(future), future.result(), reporter, profiler, limits, cache)
+            block = False
+
+        return
+
+    done, _ = wait(pending, timeout=None if block else 0, return_when=FIRST_COMPLETED)
+
+    for future in done:
+        if limits.exhausted:
+            return
+
+        _handle_result(pending.pop(future), future.result(), reporter, profiler, limits, cache)
+
+
+def _handle_result(
+    filename: str,
+    result: WorkerResult,
+    reporter: Reporter,
+    profiler: Profiler | None,
+    limits: ErrorLimits,
+    cache: ResultCache | None = None,
+) -> None:
+    """
+    Передает ошибки файла, обрезанные по limits, в reporter, добавляет его профиль в profiler,
+    а записанные в кэш байты - в cache
+    """
+
+    reporter.report_file(filename, limits.take(result.errors))
+
+    if profiler and result.profile:
+        profiler.add(result.profile)
+
+    if cache:
+        cache.add_written(result.cache_written)
+
+
+def watch(session: LintSession, paths: list[str], excludes: list[str], polling: bool, debounce: float) -> None:
+    """
+    Проверяет файлы, а затем следит за ними и перепроверяет только измененные, печатая появившиеся и исчезнувшие
+    ошибки. Работает до Ctrl+C; сбой проверки одного файла печатается в stderr и не останавливает наблюдение
+    """
+
+    watcher = create_watcher(paths, excludes, polling)
+
+    # Ошибки и строки каждого файла с его последней проверки
+    previous: dict[str, tuple[list[ErrorEntry], list[str]]] = {}
+
+    try:
+        for filename in watcher.files:
+            result = _lint_watched(session, filename)
+
+            if result is not None:
+                print_errors(filename, result[0], session.settings.language)
+                previous[filename] = result
+
+        print("Ожидание изменений...", file=sys.stderr)
+
+        for batch in iter_batches(watcher, debounce):
+            for filename in sorted(batch):
+                exists = os.path.isfile(filename)
+                new = _lint_watched(session, filename) if exists else ([], [])
+
+                # Прежние ошибки сохраняются до следующей успешной проверки файла
+                if new is None:
+                    continue
+
+                old_errors, old_lines = previous.pop(filename, ([], []))
+                print_error_changes(filename, old_errors, new[0], session.settings.language, old_lines, new[1])
+
+                if exists:
+                    previous[filename] = new
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+
+
+def _lint_watched(session: LintSession, filename: str) -> tuple[list[ErrorEntry], list[str]] | None:
+    """
+    Проверяет файл в режиме watch и возвращает его ошибки и строки: файл читается один раз, и эти же строки
+    линтятся и сохраняются для diff_errors. Если чтение или проверка упали, печатает сбой в stderr и возвращает None
+    """
+
+    try:
+        with open(filename, "r") as f:
+            lines = f.readlines()
+
+        errors, _ = session.lint(filename, lines=lines)
+    except Exception as e:
+        print(f"Ошибка при проверке файла {filename}: {type(e).__name__}: {e}", file=sys.stderr)
+        return None
+
+    return errors, lines
+
+
+def print_error_changes(
+    filename: str,
+    old: list[ErrorEntry],
+    new: list[ErrorEntry],
+    language: str = DEFAULT_LANGUAGE,
+    old_lines: Sequence[str] = (),
+    new_lines: Sequence[str] = (),
+) -> None:
+    """
+    Печатает ошибки, которые появились (+) и исчезли (-) в файле с прошлой проверки, на языке language.
+    Ошибки сопоставляются по тексту строк old_lines и new_lines (см. diff_errors)
+    """
+
+    added, resolved = diff_errors(old, new, old_lines, new_lines)
+
+    if not (added or resolved):
+        return
+
+    print(f"Изменения в файле: {filename}")
+    for sign, errors in (("+", added), ("-", resolved)):
+        for error in errors:
+            print(f"  {sign} Строка: {error.line}, Столбец: {error.column}, Проблема: {error.render(language)}")
+    print("-" * 20)
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    """Разбирает аргументы командной строки"""
+
+    parser = argparse.ArgumentParser(prog="main.py", add_help=False)
+    parser.add_argument("dialect")
+    parser.add_argument("files", nargs="+")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--ordered", action="store_true")
+    parser.add_argument("--fused", action="store_true")
+    parser.add_argument("--combined-spaces", action="store_true")
+    parser.add_argument("--tokenized", action="store_true")
+    parser.add_argument("--cache", action="store_true")
+    parser.add_argument("--cache-dir", default=None)
+    parser.add_argument("--exclude", action="append", default=[])
+    parser.add_argument("--mmap", action="store_true")
+    parser.add_argument("--profile", action="store_true")
+    parser.add_argument("--profile-json", default="java_linter_profile.json")
+    parser.add_argument("--profile-top", type=int, default=10)
+    parser.add_argument("--watch", action="store_true")
+    parser.add_argument("--watch-polling", action="store_true")
+    parser.add_argument("--debounce", type=float, default=DEFAULT_DEBOUNCE)
+    parser.add_argument("--lang", choices=LANGUAGES, default=DEFAULT_LANGUAGE)
+    parser.add_argument("--format", choices=REPORTERS, default="text")
+    parser.add_argument("--output", "-o", default=None)
+    parser.add_argument("--max-errors", type=int, default=None)
+    parser.add_argument("--max-errors-per-file", type=int, default=None)
+    parser.add_argument("--fail-fast", action="store_true")
+    parser.add_argument("--diff", default=None, metavar="BASE")
+    parser.add_argument("--line-time-limit", type=int, default=None, metavar="MS")
+    parser.add_argument("--skip-slow-lines", action="store_true")
+    parser.add_argument("--numpy", action="store_true")
+
+    return parser.parse_args(argv)
 
 
 def main() -> None:
     """Главная функция для запуска линтера."""
 
     if len(sys.argv) < 3 or sys.argv[1] in ("help", "-h", "--h", "--help", "-help"):
-        print("Использование: python main.py <Файл со стилем.json> <java_file1> <java_file2> ...")
-        print("Описание файла стиля есть в README.md")
+        print("Использование: python main.py <Файл со стилем.json> <java_file_or_dir1> <java_file_or_dir2> ... [опции]")
+        print("Описание файла стиля и опций есть в README.md")
+        sys.exit(1)
+
+    args = _parse_args(sys.argv[1:])
+
+    if args.numpy and not HAS_NUMPY:
+        print("Для --numpy нужен пакет numpy: pip install numpy", file=sys.stderr)
         sys.exit(1)
 
-    for filename in sys.argv[2:]:
+    if args.profile and (args.fused or args.mmap):
+        print("С --fused и --mmap профиль замеряет проход по файлу целиком, без разбивки по проверкам", file=sys.stderr)
+
+    settings = LintSettings(
+        dialect_filename=args.dialect,
+        linter_options=LinterOptions(
+            fused=args.fused,
+            combined_spaces=args.combined_spaces,
+            tokenized=args.tokenized,
+            line_time_limit=(
+                args.line_time_limit
+                if args.line_time_limit is not None or not args.skip_slow_lines
+                else DEFAULT_LINE_TIME_LIMIT
+            ),
+            skip_slow_lines=args.skip_slow_lines,
+            numpy_backend=args.numpy,
+        ),
+        cache_dir=args.cache_dir or (DEFAULT_CACHE_DIR if args.cache else None),
+        mapped=args.mmap,
+        profile=args.profile,
+        language=args.lang,
+    )
+
+    session = LintSession(settings)
+    filenames: Iterable[str] = iter_java_files(args.files, args.exclude)
+    changes: dict[str, ChangedLines] | None = None
+
+    if args.diff:
+        try:
+            changes = git_changed_lines(args.diff, args.files)
+        except GitDiffError as e:
+            print(f"Ошибка git diff: {e}", file=sys.stderr)
+            sys.exit(1)
+
+        filenames = list(filter_java_files(changes, args.exclude))
 
-        linter = Linter(sys.argv[1])
-        errors = lint_java_code(filename, linter)
+    limits = ErrorLimits(args.max_errors_per_file, 1 if args.fail_fast else args.max_errors)
 
-        if errors:
-            print(f"Ошибки в файле: {filename}")
-            for error in errors:
-                print(f"  Строка: {error.line}, Столбец: {error.column}, Проблема: {error.message}")
-            print("-" * 20)
-        else:
-            print(f"Проблем не найдено в файле: {filename}")
+    if args.watch or args.watch_polling:
+        watch(session, args.files, args.exclude, args.watch_polling, args.debounce)
+    else:
+        output = open_output(args.output)
+        reporter = REPORTERS[args.format](output, settings.language)
+        reporter.start()
+
+        try:
+            if args.jobs > 1 and (len(args.files) > 1 or os.path.isdir(args.files[0])):
+                lint_in_parallel(
+                    settings,
+                    filenames,
+                    args.jobs,
+                    args.ordered,
+                    reporter,
+                    session.profiler,
+                    limits,
+                    changes,
+                    session.cache,
+                )
+            else:
+                for filename in filenames:
+                    changed = changes[filename] if changes is not None else None
+
+                    errors, _ = session.lint(filename, limits.file_limit(), changed)
+
+                    reporter.report_file(filename, limits.take(errors))
+
+                    if limits.exhausted:
+                        break
+        finally:
+            reporter.finish()
+            output.close()
+
+    if session.cache:
+        session.cache.evict()
+
+    if session.profiler:
+        session.profiler.print_report(args.profile_top)
+        session.profiler.write_json(args.profile_json, args.profile_top)
+
+    # Найденные ошибки - ненулевой код возврата, как у других линтеров
+    if limits.found:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
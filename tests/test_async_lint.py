@@ -0,0 +1,136 @@
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from java_linter import async_lint
+from java_linter.async_lint import FileResult, iter_lint_paths, lint_paths
+from java_linter.linter import Linter, LinterOptions
+from java_linter.shared import ErrorEntry
+
+_FILES = ["BadMainApplicationFrame.java", "BadMyJMenu.java", "GoodMainApplicationFrame.java", "GoodMyJMenu.java"]
+
+
+def _expected(filenames: list[str], options: LinterOptions = LinterOptions()) -> dict[str, list[ErrorEntry]]:
+    linter = Linter.from_options(options=options)
+    expected = {}
+
+    for filename in filenames:
+        with open(filename, "r") as f:
+            expected[filename] = linter.seek_for_errors(f.readlines(), filename)
+
+    return expected
+
+
+def _write_files(directory: Path, count: int) -> list[str]:
+    filenames = []
+
+    for i in range(count):
+        path = directory / f"C{i}.java"
+        path.write_text(f"public class c{i} {{\n    int Bad_Name;\n}}\n")
+        filenames.append(str(path))
+
+    return filenames
+
+
+class TestLintPaths:
+
+    def test_same_errors_as_linter(self) -> None:
+        filenames = [f"test_files/{name}" for name in _FILES]
+
+        assert asyncio.run(lint_paths(filenames)) == _expected(filenames)
+        options = LinterOptions(fused=True)
+
+        assert asyncio.run(lint_paths(filenames, linter_options=options, jobs=1)) == _expected(filenames, options)
+
+    def test_directory(self, tmp_path: Path) -> None:
+        filenames = _write_files(tmp_path, 30)
+        (tmp_path / "notes.txt").write_text("text\n")
+
+        assert asyncio.run(lint_paths([str(tmp_path)], jobs=3, queue_size=1)) == _expected(filenames)
+
+    def test_max_errors(self) -> None:
+        filename = "test_files/BadMyJMenu.java"
+
+        assert asyncio.run(lint_paths([filename], max_errors=2))[filename] == _expected([filename])[filename][:2]
+
+    @pytest.mark.parametrize("executor_type", [ThreadPoolExecutor, ProcessPoolExecutor])
+    def test_executor(self, tmp_path: Path, executor_type: type[ThreadPoolExecutor | ProcessPoolExecutor]) -> None:
+        filenames = _write_files(tmp_path, 10)
+
+        with executor_type(max_workers=2) as executor:
+            assert asyncio.run(lint_paths(filenames, executor=executor, jobs=4)) == _expected(filenames)
+
+    def test_own_executor_for_lint_jobs(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        filenames = _write_files(tmp_path, 10)
+        threads: set[str] = set()
+        lint_lines = async_lint._lint_lines
+
+        def recording_lint_lines(*args: Any) -> list[ErrorEntry]:
+            threads.add(threading.current_thread().name)
+            return lint_lines(*args)
+
+        monkeypatch.setattr(async_lint, "_lint_lines", recording_lint_lines)
+
+        assert asyncio.run(lint_paths(filenames, jobs=2)) == _expected(filenames)
+        # Потоки цикла событий по умолчанию называются asyncio_N, в них идет только чтение
+        assert threads and not any(name.startswith("asyncio") for name in threads)
+
+    def test_missing_file(self) -> None:
+        with pytest.raises(FileNotFoundError):
+            asyncio.run(lint_paths(["test_files/Missing.java"]))
+
+
+class TestPipeline:
+
+    def test_back_pressure(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        filenames = _write_files(tmp_path, 50)
+        read: list[str] = []
+        read_lines = async_lint._read_lines
+
+        def counting_read_lines(filename: str) -> list[str]:
+            read.append(filename)
+            return read_lines(filename)
+
+        monkeypatch.setattr(async_lint, "_read_lines", counting_read_lines)
+
+        async def first_result() -> FileResult:
+            results = iter_lint_paths(filenames, jobs=1, readers=1, queue_size=1)
+            result = await anext(results)
+
+            # Потребитель не забирает результаты, и конвейер должен остановиться на заполненных очередях
+            await asyncio.sleep(0.2)
+            await results.aclose()
+
+            return result
+
+        assert asyncio.run(first_result()).filename == filenames[0]
+        # Файлы в очередях, в проверке и в каждой стадии чтения, но не все 50
+        assert len(read) < 10
+
+    def test_cancel(self, tmp_path: Path) -> None:
+        filenames = _write_files(tmp_path, 50)
+
+        async def cancel() -> set[asyncio.Task[object]]:
+            task = asyncio.create_task(lint_paths(filenames, jobs=1, readers=1, queue_size=1))
+            await asyncio.sleep(0.01)
+            task.cancel()
+
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            return asyncio.all_tasks() - {asyncio.current_task()}
+
+        assert asyncio.run(cancel()) == set()
+
+    def test_concurrent_requests(self, tmp_path: Path) -> None:
+        first = _write_files(tmp_path, 20)
+        second = [f"test_files/{name}" for name in _FILES]
+
+        async def lint_both() -> list[dict[str, list[ErrorEntry]]]:
+            return list(await asyncio.gather(lint_paths(first, jobs=2), lint_paths(second, jobs=2)))
+
+        assert asyncio.run(lint_both()) == [_expected(first), _expected(second)]
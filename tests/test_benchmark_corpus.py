@@ -0,0 +1,39 @@
+from benchmarks.bench_linter import discover_checks, make_linter
+from benchmarks.corpus import CorpusConfig, generate_java_source
+from java_linter.linter import Linter
+
+
+class TestCorpusGenerator:
+
+    def test_deterministic(self) -> None:
+        config = CorpusConfig(lines=500, seed=7)
+
+        assert generate_java_source(config) == generate_java_source(config)
+        assert generate_java_source(config) != generate_java_source(config._replace(seed=8))
+
+    def test_size_and_line_length(self) -> None:
+        lines = generate_java_source(CorpusConfig(lines=3000, line_length=100))
+
+        assert 3000 <= len(lines) < 3100
+        assert max(len(line) for line in lines) > 90
+
+    def test_violation_density(self) -> None:
+        linter = Linter()
+        clean = generate_java_source(CorpusConfig(lines=2000, violation_density=0))
+        dirty = generate_java_source(CorpusConfig(lines=2000, violation_density=0.2))
+
+        space_errors = [error for error in linter.seek_for_errors(clean, "A.java") if "пробел" in error.message]
+
+        assert space_errors == []
+        assert len(linter.seek_for_errors(dirty, "A.java")) > 100
+
+    def test_discover_checks(self) -> None:
+        linter = make_linter("plain")
+        lines = generate_java_source(CorpusConfig(lines=500, violation_density=0.2))
+        checks = discover_checks(linter)
+        names = [name for name, _ in checks]
+
+        assert "NamingLinter._check_class_name_in_line" in names
+        assert "EmptyLineLinter._check_empty_lines_after_blocks" in names
+        assert "SpaceLinter._check_no_spaces_more_that_one_in_line" in names
+        assert sum(len(check(lines, "A.java")) for _, check in checks) == len(linter.seek_for_errors(lines, "A.java"))
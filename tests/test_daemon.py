@@ -0,0 +1,113 @@
+import os
+import socket
+import tempfile
+import threading
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from java_linter.daemon import LintDaemon
+from java_linter.daemon_client import DaemonClient, DaemonError
+from java_linter.linter import Linter
+
+
+class TestLintDaemon:
+
+    @pytest.fixture
+    def socket_path(self) -> Iterator[str]:
+        # Путь к Unix-сокету ограничен ~100 символами, поэтому папка берется короткая
+        with tempfile.TemporaryDirectory(prefix="jl") as directory:
+            path = os.path.join(directory, "d.sock")
+            server = LintDaemon(path)
+            thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05})
+            thread.start()
+
+            yield path
+
+            server.shutdown()
+            thread.join()
+            server.server_close()
+
+    def test_lint_file(self, socket_path: str) -> None:
+        with open("test_files/BadMyJMenu.java", "r") as f:
+            expected = Linter().seek_for_errors(f.readlines(), "test_files/BadMyJMenu.java")
+
+        with DaemonClient(socket_path) as client:
+            errors = client.lint("test_files/BadMyJMenu.java")
+            assert [tuple(error.values()) for error in errors] == [
+                (error.file_name, error.line, error.column, error.message) for error in expected
+            ]
+
+            # Второй запрос по тому же соединению
+            assert client.lint("test_files/BadMyJMenu.java", tokenized=True) == errors
+
+    def test_lint_content(self, socket_path: str) -> None:
+        with DaemonClient(socket_path) as client:
+            errors = client.lint("A.java", content="int a,b;\n")
+
+        assert errors == [
+            {"file_name": "A.java", "line": 1, "column": 6, "message": "После запятой должен быть пробел"}
+        ]
+
+    def test_content_lines_split_like_file(self, socket_path: str, tmp_path: Path) -> None:
+        content = "int a,b;\x0cint c,d;\r\nint e\u2028,f;\rint g,h;\n"
+        path = tmp_path / "A.java"
+        path.write_bytes(content.encode("utf-8"))
+
+        # Строки делятся так же, как при чтении файла: "\x0c" и "\u2028" концом строки не считаются
+        with open(path, "r") as f:
+            expected = Linter().seek_for_errors(f.readlines(), "A.java")
+
+        with DaemonClient(socket_path) as client:
+            errors = client.lint("A.java", content=content)
+
+        assert [tuple(error.values()) for error in errors] == [
+            (error.file_name, error.line, error.column, error.message) for error in expected
+        ]
+        assert {error["line"] for error in errors} == {1, 2, 3}
+
+    def test_errors(self, socket_path: str) -> None:
+        with DaemonClient(socket_path) as client:
+            with pytest.raises(DaemonError, match="FileNotFoundError"):
+                client.lint("test_files/Missing.java")
+
+            with pytest.raises(DaemonError, match="unknown"):
+                client.lint("A.java", content="", unknown=True)
+
+            assert client.ping()
+
+    def test_no_daemon(self) -> None:
+        with pytest.raises(DaemonError):
+            DaemonClient("/nonexistent/d.sock")
+
+    def test_running_daemon_is_kept(self, socket_path: str) -> None:
+        with pytest.raises(OSError, match="уже запущен"):
+            LintDaemon(socket_path)
+
+    def test_stale_socket_is_replaced(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="jl") as directory:
+            path = os.path.join(directory, "d.sock")
+
+            stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            stale.bind(path)
+            stale.close()
+
+            with LintDaemon(path):
+                assert os.path.exists(path)
+
+    def test_shutdown(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="jl") as directory:
+            path = os.path.join(directory, "d.sock")
+
+            with LintDaemon(path) as server:
+                thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05})
+                thread.start()
+
+                with DaemonClient(path) as client:
+                    client.shutdown()
+
+                thread.join(timeout=5)
+                assert not thread.is_alive()
+
+            assert not os.path.exists(path)
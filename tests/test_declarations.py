@@ -0,0 +1,82 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from java_linter.declarations import Declaration, DeclarationKind, build_declaration_index, declaration_index
+from java_linter.empty_lines_liner import EmptyLineLinter
+from java_linter.line_classes import ClassifiedLines
+from java_linter.linter import Linter
+from java_linter.naming_linter import NamingLinter
+
+_FILES = ["BadMainApplicationFrame.java", "BadMyJMenu.java", "GoodMainApplicationFrame.java", "GoodMyJMenu.java"]
+
+
+def _lines(name: str) -> list[str]:
+    with open(f"test_files/{name}", "r") as f:
+        return f.readlines()
+
+
+class TestDeclarationIndex:
+
+    def test_build(self) -> None:
+        lines = ClassifiedLines(
+            [
+                "public class Outer {\n",
+                "    void run() {\n",
+                "        return value(1);\n",
+                "    }\n",
+                "    abstract int size();\n",
+                "    class Inner\n",
+                "    {\n",
+                "    }\n",
+                "}\n",
+            ]
+        )
+
+        index = build_declaration_index(lines)
+
+        assert index.classes == [
+            Declaration(DeclarationKind.CLASS, "Outer", 14, 0, 0, 8),
+            Declaration(DeclarationKind.CLASS, "Inner", 11, 5, None, 8),
+        ]
+        assert index.methods == [
+            Declaration(DeclarationKind.METHOD, "run", 10, 1, 1, 3),
+            Declaration(DeclarationKind.METHOD, "value", 16, 2, None, None),
+            Declaration(DeclarationKind.METHOD, "size", 18, 4, None, None),
+        ]
+        assert index.of_kind(DeclarationKind.CLASS) is index.classes
+
+    def test_index_is_built_once_per_file(self) -> None:
+        lines = ClassifiedLines(_lines("BadMyJMenu.java"))
+
+        assert declaration_index(lines) is declaration_index(lines)
+        assert declaration_index(list(lines)) is None
+        assert declaration_index(ClassifiedLines(lines)) is not declaration_index(lines)
+
+    def test_threads_share_linter(self) -> None:
+        linter = Linter()
+        files = [(_lines(name), name) for name in _FILES] * 20
+        expected = [linter.seek_for_errors(lines, name) for lines, name in files]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            assert list(executor.map(lambda file: linter.seek_for_errors(*file), files)) == expected
+
+
+class TestDeclarationChecks:
+
+    @pytest.mark.parametrize("name", _FILES)
+    def test_naming_errors_are_the_same(self, name: str) -> None:
+        lines = _lines(name)
+        linter = NamingLinter(Linter().dialect)
+
+        assert linter.seek_for_errors(ClassifiedLines(lines), name) == linter.seek_for_errors(lines, name)
+
+    @pytest.mark.parametrize("name", _FILES)
+    def test_structure_index_is_the_same(self, name: str) -> None:
+        lines = _lines(name)
+        linter = EmptyLineLinter(Linter().dialect)
+
+        for with_classes, with_methods in ((True, True), (True, False), (False, True)):
+            assert linter._build_index(ClassifiedLines(lines), with_classes, with_methods) == linter._build_index(
+                lines, with_classes, with_methods
+            )
@@ -0,0 +1,86 @@
+from pathlib import Path
+
+import pytest
+
+from java_linter.discovery import compile_ignore_rule, filter_java_files, is_ignored, iter_java_files
+
+
+class TestDiscovery:
+
+    @pytest.fixture
+    def tree(self, tmp_path: Path) -> Path:
+        for name in [
+            "A.java",
+            "notes.txt",
+            "src/B.java",
+            "src/gen/C.java",
+            "src/gen/Keep.java",
+            "target/D.java",
+            "build/E.java",
+            ".git/F.java",
+            "lib/G.java",
+            "lib/sub/H.java",
+        ]:
+            path = tmp_path / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("class A {}\n")
+
+        (tmp_path / ".gitignore").write_text("# generated\nsrc/gen/*\n!src/gen/Keep.java\n")
+        (tmp_path / "lib" / ".gitignore").write_text("/sub/\n")
+
+        return tmp_path
+
+    def _relative(self, files: list[str], root: Path) -> list[str]:
+        return [Path(file).relative_to(root).as_posix() for file in files]
+
+    def test_walk(self, tree: Path) -> None:
+        files = list(iter_java_files([str(tree)]))
+
+        assert self._relative(files, tree) == ["A.java", "lib/G.java", "src/B.java", "src/gen/Keep.java"]
+
+    def test_excludes(self, tree: Path) -> None:
+        files = list(iter_java_files([str(tree)], excludes=["**/B.java", "A*"]))
+
+        assert self._relative(files, tree) == ["lib/G.java", "src/gen/Keep.java"]
+
+    def test_files_are_passed_as_is(self, tree: Path) -> None:
+        paths = [str(tree / "target" / "D.java"), str(tree / "missing.java")]
+
+        assert list(iter_java_files(paths)) == paths
+
+    def test_crlf_gitignore(self, tree: Path) -> None:
+        (tree / "lib" / ".gitignore").write_bytes(b"/sub/\r\nG.java\r\n")
+
+        assert self._relative(list(iter_java_files([str(tree / "lib")])), tree) == []
+
+    def test_is_lazy(self, tree: Path) -> None:
+        files = iter_java_files([str(tree)])
+
+        assert Path(next(files)).name == "A.java"
+
+    def test_filter_java_files(self, tree: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.chdir(tree)
+        files = ["A.java", "notes.txt", "src/B.java", "target/D.java", "lib/sub/H.java", "lib/G.java"]
+
+        assert list(filter_java_files(files, excludes=["lib/"])) == ["A.java", "src/B.java"]
+
+    @pytest.mark.parametrize(
+        "pattern,path,is_dir,expected",
+        [
+            ("*.java", "a/b/C.java", False, True),
+            ("/C.java", "a/C.java", False, False),
+            ("a/*.java", "a/b/C.java", False, False),
+            ("a/**/C.java", "a/b/c/C.java", False, True),
+            ("out/", "out", False, False),
+            ("out/", "x/out", True, True),
+            ("Test[0-9].java", "Test5.java", False, True),
+            ("Test[!0-9].java", "Test5.java", False, False),
+            ("*.java\r\n", "a/C.java", False, True),
+            ("out/\r\n", "x/out", True, True),
+        ],
+    )
+    def test_patterns(self, pattern: str, path: str, is_dir: bool, expected: bool) -> None:
+        rule = compile_ignore_rule(pattern, "/root")
+
+        assert rule is not None
+        assert is_ignored("/root/" + path, is_dir, [rule]) is expected
@@ -2,6 +2,7 @@ import pytest
 
 from java_linter.dialects import Dialect, EmptyLineCountDialect, NamingDialect, NamingRule, SpaceDialect
 from java_linter.empty_lines_liner import EmptyLineLinter
+from java_linter.messages import MessageCode
 from java_linter.shared import ErrorEntry
 
 
@@ -39,10 +40,7 @@ class TestEmptyLineLinter:
                 2,
                 [
                     ErrorEntry(
-                        file_name="test.java",
-                        line=4,
-                        column=1,
-                        message="Обнаружено 3 последовательных пустых строк, а должно быть не больше 2",
+                        file_name="test.java", line=4, column=1, code=MessageCode.CONSECUTIVE_EMPTY_LINES, params=(3, 2)
                     )
                 ],
             ),
@@ -51,10 +49,7 @@ class TestEmptyLineLinter:
                 2,
                 [
                     ErrorEntry(
-                        file_name="test.java",
-                        line=5,
-                        column=1,
-                        message="Обнаружено 4 последовательных пустых строк, а должно быть не больше 2",
+                        file_name="test.java", line=5, column=1, code=MessageCode.CONSECUTIVE_EMPTY_LINES, params=(4, 2)
                     )
                 ],
             ),
@@ -63,10 +58,7 @@ class TestEmptyLineLinter:
                 1,
                 [
                     ErrorEntry(
-                        file_name="test.java",
-                        line=3,
-                        column=1,
-                        message="Обнаружено 3 последовательных пустых строк, а должно быть не больше 1",
+                        file_name="test.java", line=3, column=1, code=MessageCode.CONSECUTIVE_EMPTY_LINES, params=(3, 1)
                     )
                 ],
             ),
@@ -96,10 +88,7 @@ class TestEmptyLineLinter:
                 3,
                 [
                     ErrorEntry(
-                        file_name="test.java",
-                        line=3,
-                        column=1,
-                        message="Обнаружено 2 пустых строк после класса, а должно быть 3",
+                        file_name="test.java", line=3, column=1, code=MessageCode.EMPTY_LINES_AFTER_CLASS, params=(2, 3)
                     )
                 ],
             ),
@@ -108,10 +97,7 @@ class TestEmptyLineLinter:
                 3,
                 [
                     ErrorEntry(
-                        file_name="test.java",
-                        line=3,
-                        column=1,
-                        message="Обнаружено 0 пустых строк после класса, а должно быть 3",
+                        file_name="test.java", line=3, column=1, code=MessageCode.EMPTY_LINES_AFTER_CLASS, params=(0, 3)
                     )
                 ],
             ),
@@ -120,10 +106,7 @@ class TestEmptyLineLinter:
                 3,
                 [
                     ErrorEntry(
-                        file_name="test.java",
-                        line=5,
-                        column=1,
-                        message="Обнаружено 4 пустых строк после класса, а должно быть 3",
+                        file_name="test.java", line=5, column=1, code=MessageCode.EMPTY_LINES_AFTER_CLASS, params=(4, 3)
                     )
                 ],
             ),
@@ -157,7 +140,8 @@ class TestEmptyLineLinter:
                         file_name="test.java",
                         line=3,
                         column=1,
-                        message="Обнаружено 1 пустых строк после метода, а должно быть 2",
+                        code=MessageCode.EMPTY_LINES_AFTER_METHOD,
+                        params=(1, 2),
                     )
                 ],
             ),
@@ -169,7 +153,8 @@ class TestEmptyLineLinter:
                         file_name="test.java",
                         line=3,
                         column=1,
-                        message="Обнаружено 2 пустых строк после метода, а должно быть 3",
+                        code=MessageCode.EMPTY_LINES_AFTER_METHOD,
+                        params=(2, 3),
                     )
                 ],
             ),
@@ -183,7 +168,8 @@ class TestEmptyLineLinter:
                         file_name="test.java",
                         line=2,
                         column=1,
-                        message="Обнаружено 1 пустых строк после метода, а должно быть 2",
+                        code=MessageCode.EMPTY_LINES_AFTER_METHOD,
+                        params=(1, 2),
                     )
                 ],
             ),
@@ -195,7 +181,8 @@ class TestEmptyLineLinter:
                         file_name="test.java",
                         line=2,
                         column=1,
-                        message="Обнаружено 3 пустых строк после метода, а должно быть 2",
+                        code=MessageCode.EMPTY_LINES_AFTER_METHOD,
+                        params=(3, 2),
                     )
                 ],
             ),
@@ -240,22 +227,13 @@ class TestEmptyLineLinter:
 
         expected_errors = [
             ErrorEntry(
-                file_name="test.java",
-                line=17,
-                column=1,
-                message="Обнаружено 4 последовательных пустых строк, а должно быть не больше 3",
+                file_name="test.java", line=17, column=1, code=MessageCode.CONSECUTIVE_EMPTY_LINES, params=(4, 3)
             ),
             ErrorEntry(
-                file_name="test.java",
-                line=4,
-                column=1,
-                message="Обнаружено 2 пустых строк после класса, а должно быть 3",
+                file_name="test.java", line=4, column=1, code=MessageCode.EMPTY_LINES_AFTER_CLASS, params=(2, 3)
             ),
             ErrorEntry(
-                file_name="test.java",
-                line=10,
-                column=1,
-                message="Обнаружено 3 пустых строк после метода, а должно быть 2",
+                file_name="test.java", line=10, column=1, code=MessageCode.EMPTY_LINES_AFTER_METHOD, params=(3, 2)
             ),
         ]
 
@@ -293,3 +271,32 @@ class TestEmptyLineLinter:
         errors = linter.seek_for_errors(lines, "test.java")
 
         assert len(errors) == 0
+
+    def test_nested_blocks(self, linter: EmptyLineLinter) -> None:
+
+        lines = [
+            "class Outer {",
+            "    void first() {",
+            "        if (x) {",
+            "        }",
+            "    }",
+            "    void second() {",
+            "    }",
+            "",
+            "",
+            "}",
+            "",
+            "",
+            "",
+            "tail",
+        ]
+
+        errors = linter.seek_for_errors(lines, "test.java")
+
+        expected_errors = [
+            ErrorEntry(
+                file_name="test.java", line=6, column=1, code=MessageCode.EMPTY_LINES_AFTER_METHOD, params=(0, 2)
+            )
+        ]
+
+        assert errors == expected_errors
@@ -0,0 +1,72 @@
+import pickle
+
+import pytest
+
+from java_linter.error_store import ErrorStore
+from java_linter.linter import Linter
+from java_linter.messages import MESSAGES, MessageCode, render_message
+from java_linter.shared import ErrorEntry
+
+
+def _errors() -> list[ErrorEntry]:
+    with open("test_files/BadMyJMenu.java", "r") as f:
+        lines = f.readlines()
+
+    return Linter().seek_for_errors(lines, "BadMyJMenu.java")
+
+
+class TestErrorStore:
+
+    def test_catalogs_have_same_codes(self) -> None:
+        for catalog in MESSAGES.values():
+            assert set(catalog) == set(MessageCode)
+
+    def test_round_trip(self) -> None:
+        errors = _errors()
+        store = ErrorStore.from_entries(errors)
+
+        assert len(store) == len(errors)
+        assert list(store) == errors
+        assert store[0] == errors[0]
+        assert store[-1] == errors[-1]
+        assert store.filenames == ["BadMyJMenu.java"]
+
+    def test_pickle(self) -> None:
+        errors = _errors()
+
+        assert list(pickle.loads(pickle.dumps(ErrorStore.from_entries(errors)))) == errors
+
+    def test_index_out_of_range(self) -> None:
+        with pytest.raises(IndexError):
+            ErrorStore()[0]
+
+    def test_render_in_english(self) -> None:
+        store = ErrorStore()
+        store.append("A.java", 5, 0, MessageCode.EMPTY_LINES_AFTER_METHOD, 0, 1)
+        store.append("A.java", 7, 12, MessageCode.METHOD_LOWER_REQUIRED)
+
+        assert store.render(0, "en") == "Found 0 empty lines after method, expected 1"
+        assert store.render(1, "en") == "Method names must start with a lowercase letter"
+        assert store.render(1) == "Имена методов должны начинаться со строчной буквы"
+        assert store.entry(0) == ErrorEntry(
+            file_name="A.java", line=5, column=0, code=MessageCode.EMPTY_LINES_AFTER_METHOD, params=(0, 1)
+        )
+        assert store.entry(1) == ErrorEntry(
+            file_name="A.java", line=7, column=12, code=MessageCode.METHOD_LOWER_REQUIRED
+        )
+
+    def test_render_message(self) -> None:
+        errors = _errors()
+
+        assert [error.render() for error in errors] == [error.message for error in errors]
+        assert all(error.render("en") == render_message(error.code, error.params, "en") for error in errors)
+        assert render_message(MessageCode.CONSECUTIVE_EMPTY_LINES, (3, 2)) == (
+            "Обнаружено 3 последовательных пустых строк, а должно быть не больше 2"
+        )
+
+    def test_truncate(self) -> None:
+        errors = _errors()
+        store = ErrorStore.from_entries(errors)
+        store.truncate(3)
+
+        assert list(store) == errors[:3]
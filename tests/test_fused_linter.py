@@ -0,0 +1,101 @@
+import pytest
+
+from java_linter.dialects import Dialect, EmptyLineCountDialect, NamingDialect, NamingRule, SpaceDialect
+from java_linter.linter import Linter
+
+
+class TestFusedLinter:
+
+    @pytest.fixture
+    def dialect(self) -> Dialect:
+        return Dialect(
+            naming=NamingDialect(
+                classes=NamingRule.CAMEL_CASE_CAPITAL,
+                methods=NamingRule.CAMEL_CASE_LOWER,
+                variables=NamingRule.CAMEL_CASE_LOWER,
+            ),
+            spaces=SpaceDialect(
+                around_operators=True,
+                no_around_brackets=True,
+                after_comma=True,
+                no_before_comma=True,
+                no_around_dot=True,
+                no_before_dot_comma=True,
+                may_be_more_that_one_space=False,
+            ),
+            empty_lines=EmptyLineCountDialect(max_empty=3, after_method=1, after_class=2),
+        )
+
+    @pytest.mark.parametrize(
+        "file_name",
+        [
+            "test_files/BadMyJMenu.java",
+            "test_files/GoodMyJMenu.java",
+            "test_files/BadMainApplicationFrame.java",
+            "test_files/GoodMainApplicationFrame.java",
+        ],
+    )
+    def test_same_errors_as_sequential(self, dialect: Dialect, file_name: str) -> None:
+
+        with open(file_name, "r") as f:
+            lines = f.readlines()
+
+        expected = Linter(dialect=dialect).seek_for_errors(lines, file_name)
+        errors = Linter(dialect=dialect, fused=True).seek_for_errors(lines, file_name)
+
+        assert errors == expected
+
+    @pytest.mark.parametrize(
+        "lines",
+        [
+            [
+                "class Outer {",
+                "    static class Inner {",
+                "        void method() {",
+                "        }",
+                "",
+                "        int get() { return 1; }",
+                "    }",
+                "",
+                "",
+                "    void other();",
+                "}",
+                "",
+                "x",
+            ],
+            ["class A {", "}", "", "class B {", "}", "", "", "", "", "y"],
+            ["void method()", "{", "}", "", "", "", "", "", "z"],
+            ["class Unclosed {", "void method() {", "", ""],
+            ["", "", "", "", "", "int x = 5;", "", "", "", ""],
+            [],
+        ],
+    )
+    def test_block_checks_same_as_sequential(self, dialect: Dialect, lines: list[str]) -> None:
+
+        expected = Linter(dialect=dialect).seek_for_errors(lines, "test.java")
+        errors = Linter(dialect=dialect, fused=True).seek_for_errors(lines, "test.java")
+
+        assert errors == expected
+
+    def test_disabled_checks(self) -> None:
+        custom_dialect = Dialect(
+            naming=NamingDialect(
+                classes=NamingRule.SNAKE_CASE, methods=NamingRule.SNAKE_CASE, variables=NamingRule.SNAKE_CASE
+            ),
+            spaces=SpaceDialect(
+                around_operators=False,
+                no_around_brackets=False,
+                after_comma=False,
+                no_before_comma=False,
+                no_around_dot=False,
+                no_before_dot_comma=False,
+                may_be_more_that_one_space=True,
+            ),
+            empty_lines=EmptyLineCountDialect(max_empty=0, after_method=0, after_class=0),
+        )
+        lines = ["class my_class {", "int a,b", "", "", "", "", "x=5", "}"]
+
+        expected = Linter(dialect=custom_dialect).seek_for_errors(lines, "test.java")
+        errors = Linter(dialect=custom_dialect, fused=True).seek_for_errors(lines, "test.java")
+
+        assert errors == expected
@@ -0,0 +1,112 @@
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from java_linter.git_diff import ChangedLines, GitDiffError, git_changed_lines, parse_diff
+
+_DIFF = """diff --git a/A.java b/A.java
+index 2714503..3e78c55 100644
+--- a/A.java
++++ b/A.java
+@@ -11 +11 @@ class A {
+-    int a;
++    int b;
+@@ -20,2 +19,0 @@ class A {
+-++ x
+--- y
+@@ -30,0 +29,3 @@ class A {
+++++ b/Fake.java
++
++
+diff --git "a/sub/\\321\\204 c.java" "b/sub/\\321\\204 c.java"
+--- "a/sub/\\321\\204 c.java"
++++ "b/sub/\\321\\204 c.java"
+@@ -1 +1,2 @@
+-class B {}
++class B {
++}
+\\ No newline at end of file
+diff --git a/Old.java b/Old.java
+deleted file mode 100644
+--- a/Old.java
++++ /dev/null
+@@ -1 +0,0 @@
+-class Old {}
+diff --git a/B c.java b/B c.java
+--- a/B c.java\t
++++ b/B c.java\t
+@@ -5 +5 @@
+-a
++b
+"""
+
+
+class TestChangedLines:
+
+    def test_merges_intervals(self) -> None:
+        changed = ChangedLines([(5, 7), (1, 2), (3, 3), (6, 9), (12, 12)])
+
+        assert changed.intervals == [(1, 3), (5, 9), (12, 12)]
+        assert len(changed) == 9
+        assert list(changed) == [1, 2, 3, 5, 6, 7, 8, 9, 12]
+
+    def test_contains_and_intersects(self) -> None:
+        changed = ChangedLines([(3, 5), (10, 10)])
+
+        assert 3 in changed and 10 in changed
+        assert 2 not in changed and 6 not in changed and 11 not in changed
+        assert changed.intersects(1, 3)
+        assert changed.intersects(6, 12)
+        assert not changed.intersects(6, 9)
+        assert not ChangedLines().intersects(1, 100)
+
+
+class TestParseDiff:
+
+    def test_parse_diff(self) -> None:
+        changes = parse_diff(_DIFF)
+
+        assert {path: changed.intervals for path, changed in changes.items()} == {
+            "A.java": [(11, 11), (19, 20), (29, 31)],
+            "sub/ф c.java": [(1, 2)],
+            "B c.java": [(5, 5)],
+        }
+
+    def test_bad_hunk_header(self) -> None:
+        with pytest.raises(GitDiffError):
+            parse_diff("+++ b/A.java\n@@ broken @@\n")
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git не установлен")
+class TestGitChangedLines:
+
+    def _git(self, repo: Path, *args: str) -> None:
+        subprocess.run(
+            ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+            cwd=repo,
+            check=True,
+            capture_output=True,
+        )
+
+    def test_git_changed_lines(self, tmp_path: Path) -> None:
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "A.java").write_text("class A {\n    int a;\n}\n")
+        (tmp_path / "B.java").write_text("class B {}\n")
+
+        self._git(tmp_path, "init", "-q")
+        self._git(tmp_path, "add", ".")
+        self._git(tmp_path, "commit", "-q", "-m", "init")
+
+        (tmp_path / "src" / "A.java").write_text("class A {\n    int a;\n    int b;\n}\n")
+
+        changes = git_changed_lines("HEAD", cwd=str(tmp_path / "src"))
+
+        assert {path: changed.intervals for path, changed in changes.items()} == {"A.java": [(3, 3)]}
+
+    def test_bad_revision(self, tmp_path: Path) -> None:
+        self._git(tmp_path, "init", "-q")
+
+        with pytest.raises(GitDiffError):
+            git_changed_lines("no-such-revision", cwd=str(tmp_path))
@@ -0,0 +1,110 @@
+import pytest
+
+from java_linter.line_classes import (
+    ALL_LINES,
+    CLASS_HEADER_LINES,
+    ClassifiedLines,
+    LineFilter,
+    LineFlag,
+    blank_lines,
+    classify_line,
+    classify_lines,
+    filtered_lines,
+)
+from java_linter.linter import Linter
+from java_linter.shared import ErrorEntry, JavaPatterns, iter_line_check
+
+_FILES = ["BadMainApplicationFrame.java", "BadMyJMenu.java", "GoodMainApplicationFrame.java", "GoodMyJMenu.java"]
+
+
+def _lines(name: str) -> list[str]:
+    with open(f"test_files/{name}", "r") as f:
+        return f.readlines()
+
+
+class TestClassifyLine:
+
+    @pytest.mark.parametrize(
+        "line, flags, first_word",
+        [
+            ("   \n", LineFlag.BLANK, ""),
+            ("", LineFlag.BLANK, ""),
+            ("  // a, b\n", LineFlag.COMMENT | LineFlag.COMMA | LineFlag.OPERATOR, ""),
+            (" * text.\n", LineFlag.COMMENT | LineFlag.DOT | LineFlag.OPERATOR, ""),
+            ("import java.util.List;\n", LineFlag.WORD | LineFlag.IMPORT | LineFlag.DOT | LineFlag.SEMICOLON, "import"),
+            ("importance = 1;\n", LineFlag.WORD | LineFlag.OPERATOR | LineFlag.SEMICOLON, "importance"),
+            (
+                "public class A {\n",
+                LineFlag.WORD | LineFlag.DECLARATION | LineFlag.OPEN_BRACE | LineFlag.BRACKET | LineFlag.BRACE,
+                "public",
+            ),
+            (
+                "    int f(int a) {\n",
+                LineFlag.WORD
+                | LineFlag.OPEN_PAREN
+                | LineFlag.CLOSE_PAREN
+                | LineFlag.OPEN_BRACE
+                | LineFlag.BRACKET
+                | LineFlag.BRACE,
+                "int",
+            ),
+            ("    }\n", LineFlag.CLOSE_BRACE | LineFlag.BRACE, ""),
+        ],
+    )
+    def test_classify_line(self, line: str, flags: LineFlag, first_word: str) -> None:
+        assert classify_line(line) == (flags, first_word)
+
+    def test_class_header_lines_are_declarations(self) -> None:
+        for name in _FILES:
+            for line in _lines(name):
+                if JavaPatterns.CLASS_PATTERN.search(line):
+                    assert classify_line(line)[0] & LineFlag.DECLARATION, line
+
+
+class TestClassifiedLines:
+
+    def test_is_list_of_lines(self) -> None:
+        lines = ["class A {\n", "\n", "}\n"]
+        classified = classify_lines(lines)
+
+        assert classified == lines
+        assert classify_lines(classified) is classified
+        assert [classified.first_word(i) for i in range(len(lines))] == ["class", "", ""]
+        assert blank_lines(classified) == blank_lines(lines) == [False, True, False]
+
+    def test_indexes(self) -> None:
+        classified = ClassifiedLines(["class A {\n", "\n", "    int a, b;\n", "}\n"])
+
+        assert classified.indexes(CLASS_HEADER_LINES) == [0]
+        assert classified.indexes(LineFilter(LineFlag.COMMA)) == [2]
+        assert classified.indexes(LineFilter(forbidden=LineFlag.BLANK)) == [0, 2, 3]
+        assert classified.indexes(CLASS_HEADER_LINES) is classified.indexes(CLASS_HEADER_LINES)
+
+    def test_filtered_lines(self) -> None:
+        lines = ["a,\n", "b\n"]
+
+        assert list(filtered_lines(lines, LineFilter(LineFlag.COMMA))) == [(0, "a,\n"), (1, "b\n")]
+        assert list(filtered_lines(ClassifiedLines(lines), LineFilter(LineFlag.COMMA))) == [(0, "a,\n")]
+        assert list(filtered_lines(ClassifiedLines(lines), ALL_LINES)) == [(0, "a,\n"), (1, "b\n")]
+
+
+class TestFilteredChecks:
+
+    @pytest.mark.parametrize("name", _FILES)
+    def test_filters_do_not_change_errors(self, name: str) -> None:
+        lines = _lines(name)
+        classified = ClassifiedLines(lines)
+        linter = Linter()
+
+        for sublinter in (linter._naming_linter, linter._space_linter):
+            for line_check, line_filter in zip(sublinter.get_line_checks(), sublinter.get_line_filters()):
+                expected: list[ErrorEntry] = list(iter_line_check(line_check, lines, name))
+
+                assert list(iter_line_check(line_check, classified, name, line_filter)) == expected
+
+    @pytest.mark.parametrize("name", _FILES)
+    @pytest.mark.parametrize("fused", [False, True])
+    def test_same_errors_as_lazy_checks(self, name: str, fused: bool) -> None:
+        lines = _lines(name)
+
+        assert Linter(fused=fused).seek_for_errors(lines, name) == list(Linter().iter_errors(lines, name))
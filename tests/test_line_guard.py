@@ -0,0 +1,86 @@
+from java_linter.line_classes import ClassifiedLines
+from java_linter.line_guard import LineGuard
+from java_linter.linter import Linter
+from java_linter.messages import MessageCode
+from java_linter.shared import ErrorEntry
+
+
+def _lines() -> list[str]:
+    with open("test_files/BadMyJMenu.java", "r") as f:
+        return f.readlines()
+
+
+def _checked_lines(lines: list[str]) -> list[int]:
+    """Номера строк (с 1), которые проверяет хоть одна построчная проверка базового диалекта"""
+
+    linter = Linter()
+    classified = ClassifiedLines(lines)
+    line_filters = linter._naming_linter.get_line_filters() + linter._space_linter.get_line_filters()
+
+    return sorted({i + 1 for line_filter in line_filters for i in classified.indexes(line_filter)})
+
+
+def _is_slow_line(error: ErrorEntry) -> bool:
+    return error.code == MessageCode.SLOW_LINE
+
+
+class TestLineGuard:
+
+    def test_fast_lines_are_not_reported(self) -> None:
+        lines = _lines()
+        linter = Linter(line_time_limit=10_000)
+
+        assert linter.seek_for_errors(lines, "A.java") == Linter().seek_for_errors(lines, "A.java")
+        assert list(linter.iter_errors(lines, "A.java", ordered=True)) == list(
+            Linter().iter_errors(lines, "A.java", ordered=True)
+        )
+
+    def test_report_slow_lines(self) -> None:
+        lines = _lines()
+        errors = Linter(line_time_limit=0).seek_for_errors(lines, "A.java")
+        slow = [error for error in errors if _is_slow_line(error)]
+        other = [error for error in errors if not _is_slow_line(error)]
+
+        # Каждая проверенная строка медленнее 0 мс, но сообщается только один раз, и остальные ошибки не теряются
+        assert sorted(error.line for error in slow) == _checked_lines(lines)
+        assert all(error.column == 1 for error in slow)
+        assert other == Linter().seek_for_errors(lines, "A.java")
+
+    def test_skip_slow_lines(self) -> None:
+        lines = _lines()
+        errors = Linter(line_time_limit=0, skip_slow_lines=True).seek_for_errors(lines, "A.java")
+        expected = Linter().seek_for_errors(lines, "A.java")
+
+        # Строку проверяет только первая построчная проверка, которой она нужна, и проверки целого файла
+        assert sum(_is_slow_line(error) for error in errors) == len(_checked_lines(lines))
+        assert {error for error in errors if not _is_slow_line(error)} < set(expected)
+        assert [error for error in expected if "классов" in error.message] == [
+            error for error in errors if "классов" in error.message
+        ]
+
+    def test_fused_option_is_ignored(self) -> None:
+        lines = _lines()
+        errors = Linter(fused=True, line_time_limit=0).seek_for_errors(lines, "A.java")
+
+        assert sum(_is_slow_line(error) for error in errors) == len(_checked_lines(lines))
+
+    def test_new_file_resets_slow_lines(self) -> None:
+        guard = LineGuard(limit=0, skip=True)
+        plan = Linter()._build_check_plan(ordered=False)
+
+        for _ in range(2):
+            lines = _lines()
+            checks = guard.wrap_checks(plan)
+            errors = [error for check in checks for error in check(lines, "A.java")]
+
+            assert sum(_is_slow_line(error) for error in errors) == len(lines)
+
+    def test_same_lines_checked_again(self) -> None:
+        lines = _lines()
+        linter = Linter(line_time_limit=0)
+
+        # Без классификации проверки получают тот же список строк, но долгие строки не переходят между вызовами
+        for _ in range(2):
+            errors = linter.seek_for_errors(lines, "A.java", max_errors=100_000)
+
+            assert sum(_is_slow_line(error) for error in errors) == len(lines)
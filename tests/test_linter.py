@@ -1,7 +1,12 @@
+import os
+from pathlib import Path
+from typing import Iterator
+
 import pytest
 
 from java_linter.dialects import Dialect, EmptyLineCountDialect, NamingDialect, NamingRule, SpaceDialect
-from java_linter.linter import Linter
+from java_linter.linter import Linter, LinterOptions, load_linter
+from java_linter.messages import MessageCode
 from java_linter.shared import ErrorEntry
 
 
@@ -34,169 +39,135 @@ class TestLinter:
                         file_name="test_files/BadMyJMenu.java",
                         line=12,
                         column=7,
-                        message="Имена классов должны начинаться с заглавной буквы",
+                        code=MessageCode.CLASS_CAPITAL_REQUIRED,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMyJMenu.java",
                         line=27,
                         column=22,
-                        message="Имена методов должны начинаться со строчной буквы",
+                        code=MessageCode.METHOD_LOWER_REQUIRED,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMyJMenu.java",
                         line=35,
                         column=19,
-                        message="Имена методов не должны быть в snake_case",
+                        code=MessageCode.METHOD_SNAKE_CASE_FORBIDDEN,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMyJMenu.java",
                         line=39,
                         column=21,
-                        message="Имена методов должны начинаться со строчной буквы",
+                        code=MessageCode.METHOD_LOWER_REQUIRED,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMyJMenu.java",
                         line=13,
                         column=26,
-                        message="Имена переменных должны начинаться со строчной буквы",
+                        code=MessageCode.VARIABLE_LOWER_REQUIRED,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMyJMenu.java",
                         line=14,
                         column=26,
-                        message="Имена переменных не должны быть в snake_case",
+                        code=MessageCode.VARIABLE_SNAKE_CASE_FORBIDDEN,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMyJMenu.java",
                         line=28,
                         column=17,
-                        message="Имена переменных должны начинаться со строчной буквы",
+                        code=MessageCode.VARIABLE_LOWER_REQUIRED,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMyJMenu.java",
                         line=33,
                         column=1,
-                        message="Обнаружено 2 пустых строк после метода, а должно быть 1",
+                        code=MessageCode.EMPTY_LINES_AFTER_METHOD,
+                        params=(2, 1),
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMyJMenu.java",
                         line=39,
                         column=1,
-                        message="Обнаружено 0 пустых строк после метода, а должно быть 1",
+                        code=MessageCode.EMPTY_LINES_AFTER_METHOD,
+                        params=(0, 1),
                     ),
                     ErrorEntry(
-                        file_name="test_files/BadMyJMenu.java",
-                        line=17,
-                        column=56,
-                        message="После запятой должен быть пробел",
+                        file_name="test_files/BadMyJMenu.java", line=17, column=56, code=MessageCode.SPACE_AFTER_COMMA
                     ),
                     ErrorEntry(
-                        file_name="test_files/BadMyJMenu.java",
-                        line=36,
-                        column=46,
-                        message="После запятой должен быть пробел",
+                        file_name="test_files/BadMyJMenu.java", line=36, column=46, code=MessageCode.SPACE_AFTER_COMMA
                     ),
                     ErrorEntry(
-                        file_name="test_files/BadMyJMenu.java",
-                        line=17,
-                        column=46,
-                        message="Не должно быть пробелов перед запятой",
+                        file_name="test_files/BadMyJMenu.java", line=17, column=46, code=MessageCode.SPACE_BEFORE_COMMA
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMyJMenu.java",
                         line=17,
                         column=12,
-                        message="Перед открывающейся скобкой не должно быть пробела",
+                        code=MessageCode.SPACE_BEFORE_OPEN_BRACKET,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMyJMenu.java",
                         line=17,
                         column=14,
-                        message="После открывающейся скобкой не должно быть пробела",
+                        code=MessageCode.SPACE_AFTER_OPEN_BRACKET,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMyJMenu.java",
                         line=17,
                         column=88,
-                        message="Перед закрывающейся скобкой не должно быть пробела",
+                        code=MessageCode.SPACE_BEFORE_CLOSE_BRACKET,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMyJMenu.java",
                         line=24,
                         column=28,
-                        message="Операторы должны быть окружены пробелами",
+                        code=MessageCode.SPACE_AROUND_OPERATOR,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMyJMenu.java",
                         line=1,
                         column=14,
-                        message="Не должно быть пробелов перед точкой с запятой",
+                        code=MessageCode.SPACE_BEFORE_DOT_COMMA,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMyJMenu.java",
                         line=30,
                         column=18,
-                        message="Не должно быть пробелов перед точкой с запятой",
+                        code=MessageCode.SPACE_BEFORE_DOT_COMMA,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMyJMenu.java",
                         line=37,
                         column=96,
-                        message="Не должно быть пробелов перед точкой с запятой",
+                        code=MessageCode.SPACE_BEFORE_DOT_COMMA,
                     ),
                     ErrorEntry(
-                        file_name="test_files/BadMyJMenu.java",
-                        line=3,
-                        column=18,
-                        message="После точки не должен быть пробел",
+                        file_name="test_files/BadMyJMenu.java", line=3, column=18, code=MessageCode.SPACE_AFTER_DOT
                     ),
                     ErrorEntry(
-                        file_name="test_files/BadMyJMenu.java",
-                        line=31,
-                        column=20,
-                        message="Не должно быть пробелов перед точкой",
+                        file_name="test_files/BadMyJMenu.java", line=31, column=20, code=MessageCode.SPACE_BEFORE_DOT
                     ),
                     ErrorEntry(
-                        file_name="test_files/BadMyJMenu.java",
-                        line=31,
-                        column=21,
-                        message="После точки не должен быть пробел",
+                        file_name="test_files/BadMyJMenu.java", line=31, column=21, code=MessageCode.SPACE_AFTER_DOT
                     ),
                     ErrorEntry(
-                        file_name="test_files/BadMyJMenu.java",
-                        line=37,
-                        column=68,
-                        message="После точки не должен быть пробел",
+                        file_name="test_files/BadMyJMenu.java", line=37, column=68, code=MessageCode.SPACE_AFTER_DOT
                     ),
                     ErrorEntry(
-                        file_name="test_files/BadMyJMenu.java",
-                        line=1,
-                        column=11,
-                        message="Не должно быть более одного пробела подряд внутри строки",
+                        file_name="test_files/BadMyJMenu.java", line=1, column=11, code=MessageCode.MORE_THAN_ONE_SPACE
                     ),
                     ErrorEntry(
-                        file_name="test_files/BadMyJMenu.java",
-                        line=3,
-                        column=18,
-                        message="Не должно быть более одного пробела подряд внутри строки",
+                        file_name="test_files/BadMyJMenu.java", line=3, column=18, code=MessageCode.MORE_THAN_ONE_SPACE
                     ),
                     ErrorEntry(
-                        file_name="test_files/BadMyJMenu.java",
-                        line=8,
-                        column=29,
-                        message="Не должно быть более одного пробела подряд внутри строки",
+                        file_name="test_files/BadMyJMenu.java", line=8, column=29, code=MessageCode.MORE_THAN_ONE_SPACE
                     ),
                     ErrorEntry(
-                        file_name="test_files/BadMyJMenu.java",
-                        line=12,
-                        column=27,
-                        message="Не должно быть более одного пробела подряд внутри строки",
+                        file_name="test_files/BadMyJMenu.java", line=12, column=27, code=MessageCode.MORE_THAN_ONE_SPACE
                     ),
                     ErrorEntry(
-                        file_name="test_files/BadMyJMenu.java",
-                        line=39,
-                        column=18,
-                        message="Не должно быть более одного пробела подряд внутри строки",
+                        file_name="test_files/BadMyJMenu.java", line=39, column=18, code=MessageCode.MORE_THAN_ONE_SPACE
                     ),
                 ],
             ),
@@ -245,253 +216,261 @@ class TestLinter:
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=37,
                         column=14,
-                        message="Имена классов должны начинаться с заглавной буквы",
+                        code=MessageCode.CLASS_CAPITAL_REQUIRED,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=86,
                         column=17,
-                        message="Имена методов должны начинаться со строчной буквы",
+                        code=MessageCode.METHOD_LOWER_REQUIRED,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=169,
                         column=19,
-                        message="Имена методов должны начинаться со строчной буквы",
+                        code=MessageCode.METHOD_LOWER_REQUIRED,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=41,
                         column=43,
-                        message="Имена переменных не должны быть в snake_case",
+                        code=MessageCode.VARIABLE_SNAKE_CASE_FORBIDDEN,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=43,
                         column=39,
-                        message="Имена переменных должны начинаться со строчной буквы",
+                        code=MessageCode.VARIABLE_LOWER_REQUIRED,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=61,
                         column=19,
-                        message="Имена переменных должны начинаться со строчной буквы",
+                        code=MessageCode.VARIABLE_LOWER_REQUIRED,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=113,
                         column=18,
-                        message="Имена переменных не должны быть в snake_case",
+                        code=MessageCode.VARIABLE_SNAKE_CASE_FORBIDDEN,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=29,
                         column=1,
-                        message="Обнаружено 6 последовательных пустых строк, а должно быть не больше 3",
+                        code=MessageCode.CONSECUTIVE_EMPTY_LINES,
+                        params=(6, 3),
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=51,
                         column=1,
-                        message="Обнаружено 5 последовательных пустых строк, а должно быть не больше 3",
+                        code=MessageCode.CONSECUTIVE_EMPTY_LINES,
+                        params=(5, 3),
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=168,
                         column=1,
-                        message="Обнаружено 6 последовательных пустых строк, а должно быть не больше 3",
+                        code=MessageCode.CONSECUTIVE_EMPTY_LINES,
+                        params=(6, 3),
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=215,
                         column=1,
-                        message="Обнаружено 4 последовательных пустых строк, а должно быть не больше 3",
+                        code=MessageCode.CONSECUTIVE_EMPTY_LINES,
+                        params=(4, 3),
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=84,
                         column=1,
-                        message="Обнаружено 2 пустых строк после метода, а должно быть 1",
+                        code=MessageCode.EMPTY_LINES_AFTER_METHOD,
+                        params=(2, 1),
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=95,
                         column=1,
-                        message="Обнаружено 0 пустых строк после метода, а должно быть 1",
+                        code=MessageCode.EMPTY_LINES_AFTER_METHOD,
+                        params=(0, 1),
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=163,
                         column=1,
-                        message="Обнаружено 6 пустых строк после метода, а должно быть 1",
+                        code=MessageCode.EMPTY_LINES_AFTER_METHOD,
+                        params=(6, 1),
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=211,
                         column=1,
-                        message="Обнаружено 0 пустых строк после метода, а должно быть 1",
+                        code=MessageCode.EMPTY_LINES_AFTER_METHOD,
+                        params=(0, 1),
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=102,
                         column=38,
-                        message="Не должно быть пробелов перед запятой",
+                        code=MessageCode.SPACE_BEFORE_COMMA,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=43,
                         column=76,
-                        message="Перед открывающейся скобкой не должно быть пробела",
+                        code=MessageCode.SPACE_BEFORE_OPEN_BRACKET,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=58,
                         column=23,
-                        message="Перед открывающейся скобкой не должно быть пробела",
+                        code=MessageCode.SPACE_BEFORE_OPEN_BRACKET,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=66,
                         column=38,
-                        message="Перед открывающейся скобкой не должно быть пробела",
+                        code=MessageCode.SPACE_BEFORE_OPEN_BRACKET,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=101,
                         column=26,
-                        message="Перед закрывающейся скобкой не должно быть пробела",
+                        code=MessageCode.SPACE_BEFORE_CLOSE_BRACKET,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=107,
                         column=26,
-                        message="Перед открывающейся скобкой не должно быть пробела",
+                        code=MessageCode.SPACE_BEFORE_OPEN_BRACKET,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=107,
                         column=28,
-                        message="После открывающейся скобкой не должно быть пробела",
+                        code=MessageCode.SPACE_AFTER_OPEN_BRACKET,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=140,
                         column=19,
-                        message="Перед закрывающейся скобкой не должно быть пробела",
+                        code=MessageCode.SPACE_BEFORE_CLOSE_BRACKET,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=52,
                         column=19,
-                        message="Операторы должны быть окружены пробелами",
+                        code=MessageCode.SPACE_AROUND_OPERATOR,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=55,
                         column=33,
-                        message="Операторы должны быть окружены пробелами",
+                        code=MessageCode.SPACE_AROUND_OPERATOR,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=61,
                         column=28,
-                        message="Операторы должны быть окружены пробелами",
+                        code=MessageCode.SPACE_AROUND_OPERATOR,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=113,
                         column=26,
-                        message="Операторы должны быть окружены пробелами",
+                        code=MessageCode.SPACE_AROUND_OPERATOR,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=170,
                         column=29,
-                        message="Операторы должны быть окружены пробелами",
+                        code=MessageCode.SPACE_AROUND_OPERATOR,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=43,
                         column=79,
-                        message="Не должно быть пробелов перед точкой с запятой",
+                        code=MessageCode.SPACE_BEFORE_DOT_COMMA,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=66,
                         column=44,
-                        message="Не должно быть пробелов перед точкой с запятой",
+                        code=MessageCode.SPACE_BEFORE_DOT_COMMA,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=204,
                         column=96,
-                        message="Не должно быть пробелов перед точкой с запятой",
+                        code=MessageCode.SPACE_BEFORE_DOT_COMMA,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=12,
                         column=19,
-                        message="После точки не должен быть пробел",
+                        code=MessageCode.SPACE_AFTER_DOT,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=13,
                         column=91,
-                        message="Не должно быть пробелов перед точкой",
+                        code=MessageCode.SPACE_BEFORE_DOT,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=13,
                         column=98,
-                        message="После точки не должен быть пробел",
+                        code=MessageCode.SPACE_AFTER_DOT,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=107,
                         column=14,
-                        message="Не должно быть пробелов перед точкой",
+                        code=MessageCode.SPACE_BEFORE_DOT,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=152,
                         column=17,
-                        message="Не должно быть пробелов перед точкой",
+                        code=MessageCode.SPACE_BEFORE_DOT,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=203,
                         column=18,
-                        message="После точки не должен быть пробел",
+                        code=MessageCode.SPACE_AFTER_DOT,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=12,
                         column=19,
-                        message="Не должно быть более одного пробела подряд внутри строки",
+                        code=MessageCode.MORE_THAN_ONE_SPACE,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=13,
                         column=29,
-                        message="Не должно быть более одного пробела подряд внутри строки",
+                        code=MessageCode.MORE_THAN_ONE_SPACE,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=13,
                         column=88,
-                        message="Не должно быть более одного пробела подряд внутри строки",
+                        code=MessageCode.MORE_THAN_ONE_SPACE,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=66,
                         column=35,
-                        message="Не должно быть более одного пробела подряд внутри строки",
+                        code=MessageCode.MORE_THAN_ONE_SPACE,
                     ),
                     ErrorEntry(
                         file_name="test_files/BadMainApplicationFrame.java",
                         line=66,
                         column=41,
-                        message="Не должно быть более одного пробела подряд внутри строки",
+                        code=MessageCode.MORE_THAN_ONE_SPACE,
                     ),
                 ],
             ),
@@ -534,3 +513,108 @@ class TestLinter:
 
         for expected in expected_errors:
             assert expected in errors
+
+    def test_check_plan_skips_disabled_checks(self) -> None:
+        dialect = Dialect(
+            naming=NamingDialect(
+                classes=NamingRule.CAMEL_CASE_CAPITAL,
+                methods=NamingRule.CAMEL_CASE_LOWER,
+                variables=NamingRule.CAMEL_CASE_LOWER,
+            ),
+            spaces=SpaceDialect(
+                around_operators=False,
+                no_around_brackets=False,
+                after_comma=True,
+                no_before_comma=False,
+                no_around_dot=False,
+                no_before_dot_comma=False,
+                may_be_more_that_one_space=True,
+            ),
+            empty_lines=EmptyLineCountDialect(max_empty=0, after_method=0, after_class=0),
+        )
+
+        linter = Linter(dialect=dialect)
+
+        assert len(linter._check_plan) == 4
+        assert linter.seek_for_errors(["int a,b;", "", "", "", "x=1;"], "test.java") == [
+            ErrorEntry(file_name="test.java", line=1, column=6, code=MessageCode.SPACE_AFTER_COMMA)
+        ]
+
+    def test_load_linter_reloads_changed_dialect(self, tmp_path: Path) -> None:
+        dialect_file = tmp_path / "dialect.json"
+        with open("../dialect_example.json", "r", encoding="utf-8") as f:
+            dialect_file.write_text(f.read(), encoding="utf-8")
+
+        linter = load_linter(str(dialect_file))
+
+        assert load_linter(str(dialect_file)) is linter
+        assert load_linter(str(dialect_file), LinterOptions(fused=True)) is not linter
+        assert load_linter(str(dialect_file), LinterOptions(fused=True)) is load_linter(
+            str(dialect_file), LinterOptions(fused=True)
+        )
+
+        stat = os.stat(dialect_file)
+        os.utime(dialect_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert load_linter(str(dialect_file)) is not linter
+
+    def test_from_options(self) -> None:
+        with open("test_files/BadMyJMenu.java", "r") as f:
+            lines = f.readlines()
+
+        for options in (LinterOptions(fused=True), LinterOptions(tokenized=True), LinterOptions(combined_spaces=True)):
+            assert Linter.from_options(options=options).seek_for_errors(lines, "A.java") == Linter(
+                **options._asdict()
+            ).seek_for_errors(lines, "A.java")
+
+    def test_iter_errors_matches_seek_for_errors(self) -> None:
+        with open("test_files/BadMainApplicationFrame.java", "r") as f:
+            lines = f.readlines()
+
+        linter = Linter()
+        errors = linter.seek_for_errors(lines, "test.java")
+
+        assert list(linter.iter_errors(lines, "test.java")) == errors
+        assert list(linter.iter_errors(lines, "test.java", ordered=True)) == sorted(
+            errors, key=lambda error: (error.line, error.column)
+        )
+
+    def test_iter_errors_is_lazy(self) -> None:
+        checked_lines = []
+
+        class CountingLines(list[str]):
+            def __iter__(self) -> Iterator[str]:
+                for line in super().__iter__():
+                    checked_lines.append(line)
+                    yield line
+
+        lines = CountingLines(["class bad_name {"] + ["int a;"] * 100)
+
+        first = next(Linter().iter_errors(lines, "test.java"))
+
+        assert first.line == 1
+        assert checked_lines == ["class bad_name {"]
+
+    @pytest.mark.parametrize("fused", [False, True])
+    @pytest.mark.parametrize("max_errors", [0, 1, 7, 10_000])
+    def test_seek_for_errors_with_max_errors(self, fused: bool, max_errors: int) -> None:
+        with open("test_files/BadMainApplicationFrame.java", "r") as f:
+            lines = f.readlines()
+
+        errors = Linter().seek_for_errors(lines, "test.java")
+
+        assert Linter(fused=fused).seek_for_errors(lines, "test.java", max_errors) == errors[:max_errors]
+
+    def test_seek_for_errors_stops_at_max_errors(self) -> None:
+        checked_lines = []
+
+        class CountingLines(list[str]):
+            def __iter__(self) -> Iterator[str]:
+                for line in super().__iter__():
+                    checked_lines.append(line)
+                    yield line
+
+        lines = CountingLines(["class bad_name {"] + ["int a;"] * 100)
+
+        assert len(Linter().seek_for_errors(lines, "test.java", max_errors=1)) == 1
+        assert checked_lines == ["class bad_name {"]
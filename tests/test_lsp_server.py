@@ -0,0 +1,141 @@
+import io
+import random
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+from java_linter.lsp_server import TextDocument, index_to_utf16, read_message, utf16_to_index, write_message
+
+_PACKAGE_ROOT = str(Path(__file__).resolve().parent.parent)
+
+
+def _offset(text: str, line: int, character: int) -> int:
+    """Позиция LSP в тексте; строки документа делятся только по "\\n\" """
+
+    lines = text.split("\n")
+    return sum(len(previous) + 1 for previous in lines[:line]) + utf16_to_index(lines[line], character)
+
+
+class TestTextDocument:
+
+    def test_full_change(self) -> None:
+        document = TextDocument("file:///A.java", "int a;\n")
+        document.apply_change({"text": "int b;\r\nint c;"})
+
+        assert document.lines == ["int b;\n", "int c;"]
+
+    def test_incremental_changes_match_full_text(self) -> None:
+        rand = random.Random(0)
+        alphabet = ["a", "b", " ", "\n", "{", "}", "ё", "😀"]
+
+        for _ in range(300):
+            text = "".join(rand.choice(alphabet) for _ in range(rand.randint(0, 40)))
+            document = TextDocument("file:///A.java", text)
+
+            for _ in range(5):
+                lines = text.split("\n")
+                start_line = rand.randrange(len(lines))
+                end_line = rand.randint(start_line, len(lines) - 1)
+                start = index_to_utf16(lines[start_line], rand.randint(0, len(lines[start_line])))
+                end = index_to_utf16(lines[end_line], rand.randint(0, len(lines[end_line])))
+
+                if start_line == end_line and end < start:
+                    start, end = end, start
+
+                new_text = "".join(rand.choice(alphabet) for _ in range(rand.randint(0, 6)))
+                text = text[: _offset(text, start_line, start)] + new_text + text[_offset(text, end_line, end) :]
+
+                line_change = document.apply_change(
+                    {
+                        "range": {
+                            "start": {"line": start_line, "character": start},
+                            "end": {"line": end_line, "character": end},
+                        },
+                        "text": new_text,
+                    }
+                )
+
+                assert "".join(document.lines) == text
+                assert document.changes[-1] == line_change
+
+    def test_utf16_positions(self) -> None:
+        line = "a😀b"
+
+        assert index_to_utf16(line, 2) == 3
+        assert utf16_to_index(line, 3) == 2
+
+
+class TestLanguageServer:
+
+    def _send(self, stream: Any, message: dict[str, Any]) -> None:
+        write_message(stream, {"jsonrpc": "2.0", **message})
+
+    def test_scripted_session(self) -> None:
+        process = subprocess.Popen(
+            [sys.executable, "-m", "java_linter.lsp_server", "--debounce", "0.2"],
+            cwd=_PACKAGE_ROOT,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        assert process.stdin is not None and process.stdout is not None
+
+        uri = "file:///A.java"
+
+        self._send(process.stdin, {"id": 1, "method": "initialize", "params": {}})
+        response = read_message(process.stdout)
+        assert response is not None
+        assert response["result"]["capabilities"]["textDocumentSync"]["change"] == 2
+
+        self._send(process.stdin, {"method": "initialized", "params": {}})
+        document = {"uri": uri, "version": 1, "text": "int a;\n"}
+        self._send(process.stdin, {"method": "textDocument/didOpen", "params": {"textDocument": document}})
+        published = read_message(process.stdout)
+        assert published is not None
+        assert published["params"]["diagnostics"] == []
+
+        # Серия изменений перепроверяется один раз, по последней версии
+        for version, character in ((2, 5), (3, 6), (4, 7)):
+            self._send(
+                process.stdin,
+                {
+                    "method": "textDocument/didChange",
+                    "params": {
+                        "textDocument": {"uri": uri, "version": version},
+                        "contentChanges": [
+                            {
+                                "range": {
+                                    "start": {"line": 0, "character": character},
+                                    "end": {"line": 0, "character": character},
+                                },
+                                "text": ",b" if version == 2 else "",
+                            }
+                        ],
+                    },
+                },
+            )
+
+        published = read_message(process.stdout)
+        assert published is not None
+        assert published["params"]["version"] == 4
+        assert published["params"]["diagnostics"] == [
+            {
+                "range": {"start": {"line": 0, "character": 5}, "end": {"line": 0, "character": 6}},
+                "severity": 2,
+                "source": "java_linter",
+                "message": "После запятой должен быть пробел",
+            }
+        ]
+
+        self._send(process.stdin, {"id": 2, "method": "shutdown"})
+        response = read_message(process.stdout)
+        assert response is not None and response["id"] == 2
+
+        self._send(process.stdin, {"method": "exit"})
+        process.stdin.close()
+
+        assert process.wait(timeout=10) == 0
+        process.stdout.close()
+
+    def test_read_message_at_end_of_input(self) -> None:
+        assert read_message(io.BytesIO(b"")) is None
@@ -0,0 +1,80 @@
+import builtins
+import io
+from pathlib import Path
+
+import pytest
+
+import main
+from java_linter.linter import Linter, LinterOptions
+from java_linter.reporters import TextReporter
+from java_linter.result_cache import ResultCache
+from main import LintSession, LintSettings, lint_in_parallel
+
+
+def _write_files(directory: Path, names: list[str]) -> list[str]:
+    filenames = []
+
+    for name in names:
+        path = directory / f"{name}.java"
+        path.write_text(f"public class {name} {{\n    int Bad_Name;\n}}\n")
+        filenames.append(str(path))
+
+    return filenames
+
+
+class TestLintInParallel:
+
+    def test_cache_evicted_after_parallel_run(self, tmp_path: Path) -> None:
+        cache_dir = tmp_path / "cache"
+        settings = LintSettings(dialect_filename="", linter_options=LinterOptions(), cache_dir=str(cache_dir))
+        dialect = Linter().dialect
+
+        cache = ResultCache(dialect, cache_dir=str(cache_dir))
+        lint_in_parallel(
+            settings,
+            _write_files(tmp_path, ["A0", "A1", "A2", "A3"]),
+            2,
+            True,
+            TextReporter(io.StringIO()),
+            cache=cache,
+        )
+        cache.evict()
+
+        records = list(cache_dir.rglob("*.json"))
+        cache_size = sum(record.stat().st_size for record in records)
+
+        # Записи пишут процессы-обработчики, а evict в главном процессе должен узнать о росте кэша
+        limited = ResultCache(dialect, cache_dir=str(cache_dir), max_bytes=cache_size)
+        lint_in_parallel(
+            settings,
+            _write_files(tmp_path, ["B0", "B1", "B2", "B3"]),
+            2,
+            True,
+            TextReporter(io.StringIO()),
+            cache=limited,
+        )
+        limited.evict()
+
+        assert len(records) == 4
+        assert len(list(cache_dir.rglob("*.json"))) == 4
+
+
+class TestLintWatched:
+
+    def test_file_read_once(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        (filename,) = _write_files(tmp_path, ["A"])
+        session = LintSession(LintSettings(dialect_filename="", linter_options=LinterOptions()))
+        opened = []
+        real_open = builtins.open
+
+        def counting_open(file: str, *args: object, **kwargs: object) -> object:
+            opened.append(file)
+            return real_open(file, *args, **kwargs)  # type: ignore[call-overload]
+
+        monkeypatch.setattr(builtins, "open", counting_open)
+        result = main._lint_watched(session, filename)
+
+        assert result is not None
+        assert result[1] == Path(filename).read_text().splitlines(keepends=True)
+        assert {error.line for error in result[0]} == {2}
+        assert opened.count(filename) == 1
@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import pytest
+
+from java_linter import mmap_scanner
+from java_linter.linter import Linter
+from java_linter.messages import MessageCode
+from java_linter.mmap_scanner import MappedLines, map_file
+from java_linter.shared import ErrorEntry
+from java_linter.space_rules import SPACE_RULES
+
+
+class TestMmapScanner:
+
+    @pytest.mark.parametrize(
+        "file_name",
+        [
+            "test_files/BadMyJMenu.java",
+            "test_files/GoodMyJMenu.java",
+            "test_files/BadMainApplicationFrame.java",
+            "test_files/GoodMainApplicationFrame.java",
+        ],
+    )
+    def test_same_errors_on_files(self, file_name: str) -> None:
+        linter = Linter()
+
+        with open(file_name, "r") as f:
+            expected = linter.seek_for_errors(f.readlines(), file_name)
+
+        with map_file(file_name) as buffer:
+            errors = linter.seek_for_errors_in_buffer(buffer, file_name)
+
+        assert errors == expected
+
+    def test_crlf_and_non_ascii(self) -> None:
+        lines = ['String имя= "я";\n', "  foo (a,b)  ;\n", "x=1;"]
+        data = "".join(lines).replace("\n", "\r\n").encode("utf-8")
+
+        linter = Linter()
+        errors = linter.seek_for_errors_in_buffer(data, "test.java")
+
+        assert errors == linter.seek_for_errors(lines, "test.java")
+        assert ErrorEntry(file_name="test.java", line=1, column=11, code=MessageCode.SPACE_AROUND_OPERATOR) in errors
+
+    def test_mapped_lines(self, tmp_path: Path) -> None:
+        path = tmp_path / "A.java"
+        path.write_bytes(b"class A {\r\n\r\n}")
+
+        with map_file(str(path)) as buffer:
+            assert list(MappedLines(buffer)) == ["class A {\n", "\n", "}"]
+
+    def test_empty_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "Empty.java"
+        path.write_bytes(b"")
+
+        with map_file(str(path)) as buffer:
+            assert Linter().seek_for_errors_in_buffer(buffer, str(path)) == []
+
+    @pytest.mark.parametrize("line", ["f( a,b ) {x . y ;", "if (a)  // c\n", "a  \n", "a \n", "g(\n", "h.\n"])
+    def test_rules_follow_space_rules(self, line: str) -> None:
+        for rule, space_rule in zip(mmap_scanner._RULES, SPACE_RULES):
+            assert rule.code == space_rule.code
+            assert [match.start(rule.group) for match in rule.pattern.finditer(line.encode())] == [
+                match.start(space_rule.group) for match in space_rule.pattern.finditer(line)
+            ]
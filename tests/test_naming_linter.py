@@ -1,8 +1,9 @@
 import pytest
 
 from java_linter.dialects import Dialect, EmptyLineCountDialect, NamingDialect, NamingRule, SpaceDialect
-from java_linter.naming_linter import NamingLinter
-from java_linter.shared import ErrorEntry
+from java_linter.messages import MessageCode
+from java_linter.naming_linter import NamingLinter, _is_snake_case
+from java_linter.shared import ErrorEntry, iter_line_check
 
 
 class TestNamingLinter:
@@ -36,78 +37,46 @@ class TestNamingLinter:
             (
                 "class MyClass {}",
                 NamingRule.SNAKE_CASE,
-                [ErrorEntry(file_name="test.java", line=1, column=7, message="Имена классов должны быть в snake_case")],
+                [ErrorEntry(file_name="test.java", line=1, column=7, code=MessageCode.CLASS_SNAKE_CASE_REQUIRED)],
             ),
             (
                 "class my_class {}",
                 NamingRule.CAMEL_CASE_CAPITAL,
                 [
-                    ErrorEntry(
-                        file_name="test.java", line=1, column=7, message="Имена классов не должны быть в snake_case"
-                    ),
-                    ErrorEntry(
-                        file_name="test.java",
-                        line=1,
-                        column=7,
-                        message="Имена классов должны начинаться с заглавной буквы",
-                    ),
+                    ErrorEntry(file_name="test.java", line=1, column=7, code=MessageCode.CLASS_SNAKE_CASE_FORBIDDEN),
+                    ErrorEntry(file_name="test.java", line=1, column=7, code=MessageCode.CLASS_CAPITAL_REQUIRED),
                 ],
             ),
             (
                 "class my_Class {}",
                 NamingRule.CAMEL_CASE_CAPITAL,
                 [
-                    ErrorEntry(
-                        file_name="test.java", line=1, column=7, message="Имена классов не должны быть в snake_case"
-                    ),
-                    ErrorEntry(
-                        file_name="test.java",
-                        line=1,
-                        column=7,
-                        message="Имена классов должны начинаться с заглавной буквы",
-                    ),
+                    ErrorEntry(file_name="test.java", line=1, column=7, code=MessageCode.CLASS_SNAKE_CASE_FORBIDDEN),
+                    ErrorEntry(file_name="test.java", line=1, column=7, code=MessageCode.CLASS_CAPITAL_REQUIRED),
                 ],
             ),
             (
                 "class My_class {}",
                 NamingRule.CAMEL_CASE_LOWER,
                 [
-                    ErrorEntry(
-                        file_name="test.java", line=1, column=7, message="Имена классов не должны быть в snake_case"
-                    ),
-                    ErrorEntry(
-                        file_name="test.java",
-                        line=1,
-                        column=7,
-                        message="Имена классов должны начинаться со строчной буквы",
-                    ),
+                    ErrorEntry(file_name="test.java", line=1, column=7, code=MessageCode.CLASS_SNAKE_CASE_FORBIDDEN),
+                    ErrorEntry(file_name="test.java", line=1, column=7, code=MessageCode.CLASS_LOWER_REQUIRED),
                 ],
             ),
             (
                 "class Myclass {}",
                 NamingRule.CAMEL_CASE_LOWER,
-                [
-                    ErrorEntry(
-                        file_name="test.java",
-                        line=1,
-                        column=7,
-                        message="Имена классов должны начинаться со строчной буквы",
-                    )
-                ],
+                [ErrorEntry(file_name="test.java", line=1, column=7, code=MessageCode.CLASS_LOWER_REQUIRED)],
             ),
             (
                 "interface MyInterface {}",
                 NamingRule.SNAKE_CASE,
-                [
-                    ErrorEntry(
-                        file_name="test.java", line=1, column=11, message="Имена классов должны быть в snake_case"
-                    )
-                ],
+                [ErrorEntry(file_name="test.java", line=1, column=11, code=MessageCode.CLASS_SNAKE_CASE_REQUIRED)],
             ),
             (
                 "enum MyEnum {}",
                 NamingRule.SNAKE_CASE,
-                [ErrorEntry(file_name="test.java", line=1, column=6, message="Имена классов должны быть в snake_case")],
+                [ErrorEntry(file_name="test.java", line=1, column=6, code=MessageCode.CLASS_SNAKE_CASE_REQUIRED)],
             ),
             ("class MyClass {}", NamingRule.CAMEL_CASE_CAPITAL, []),
             ("class my_class_name {}", NamingRule.SNAKE_CASE, []),
@@ -117,7 +86,7 @@ class TestNamingLinter:
         self, linter: NamingLinter, line: str, class_dialect: NamingRule, expected_errors: list[ErrorEntry]
     ) -> None:
         linter._class_dialect = class_dialect
-        errors = linter._check_class_names([line], "test.java")
+        errors = list(iter_line_check(linter._check_class_name_in_line, [line], "test.java"))
 
         assert len(errors) == len(expected_errors)
 
@@ -130,49 +99,30 @@ class TestNamingLinter:
             (
                 "void myMethod() {}",
                 NamingRule.SNAKE_CASE,
-                [ErrorEntry(file_name="test.java", line=1, column=6, message="Имена методов должны быть в snake_case")],
+                [ErrorEntry(file_name="test.java", line=1, column=6, code=MessageCode.METHOD_SNAKE_CASE_REQUIRED)],
             ),
             (
                 "void his_method() {}",
                 NamingRule.CAMEL_CASE_LOWER,
-                [
-                    ErrorEntry(
-                        file_name="test.java", line=1, column=6, message="Имена методов не должны быть в snake_case"
-                    )
-                ],
+                [ErrorEntry(file_name="test.java", line=1, column=6, code=MessageCode.METHOD_SNAKE_CASE_FORBIDDEN)],
             ),
             (
                 "void Her_method() {}",
                 NamingRule.CAMEL_CASE_LOWER,
                 [
-                    ErrorEntry(
-                        file_name="test.java", line=1, column=6, message="Имена методов не должны быть в snake_case"
-                    ),
-                    ErrorEntry(
-                        file_name="test.java",
-                        line=1,
-                        column=6,
-                        message="Имена методов должны начинаться со строчной буквы",
-                    ),
+                    ErrorEntry(file_name="test.java", line=1, column=6, code=MessageCode.METHOD_SNAKE_CASE_FORBIDDEN),
+                    ErrorEntry(file_name="test.java", line=1, column=6, code=MessageCode.METHOD_LOWER_REQUIRED),
                 ],
             ),
             (
                 "public String get_value() {}",
                 NamingRule.CAMEL_CASE_LOWER,
-                [
-                    ErrorEntry(
-                        file_name="test.java", line=1, column=15, message="Имена методов не должны быть в snake_case"
-                    )
-                ],
+                [ErrorEntry(file_name="test.java", line=1, column=15, code=MessageCode.METHOD_SNAKE_CASE_FORBIDDEN)],
             ),
             (
                 "public void setVALUE(int value) {}",
                 NamingRule.SNAKE_CASE,
-                [
-                    ErrorEntry(
-                        file_name="test.java", line=1, column=13, message="Имена методов должны быть в snake_case"
-                    )
-                ],
+                [ErrorEntry(file_name="test.java", line=1, column=13, code=MessageCode.METHOD_SNAKE_CASE_REQUIRED)],
             ),
             ("public static void main(String[] args) {}", NamingRule.SNAKE_CASE, []),
             ("private volatile void main(String[] args) {}", NamingRule.CAMEL_CASE_LOWER, []),
@@ -182,7 +132,7 @@ class TestNamingLinter:
         self, linter: NamingLinter, line: str, method_dialect: NamingRule, expected_errors: list[ErrorEntry]
     ) -> None:
         linter._method_dialect = method_dialect
-        errors = linter._check_method_names([line], "test.java")
+        errors = list(iter_line_check(linter._check_method_name_in_line, [line], "test.java"))
 
         assert len(errors) == len(expected_errors)
 
@@ -195,71 +145,42 @@ class TestNamingLinter:
             (
                 "int myVariable;",
                 NamingRule.SNAKE_CASE,
-                [
-                    ErrorEntry(
-                        file_name="test.java", line=1, column=5, message="Имена переменных должны быть в snake_case"
-                    )
-                ],
+                [ErrorEntry(file_name="test.java", line=1, column=5, code=MessageCode.VARIABLE_SNAKE_CASE_REQUIRED)],
             ),
             (
                 "String my_variable;",
                 NamingRule.CAMEL_CASE_LOWER,
-                [
-                    ErrorEntry(
-                        file_name="test.java", line=1, column=8, message="Имена переменных не должны быть в snake_case"
-                    )
-                ],
+                [ErrorEntry(file_name="test.java", line=1, column=8, code=MessageCode.VARIABLE_SNAKE_CASE_FORBIDDEN)],
             ),
             (
                 "final int MY_VARIABLE = 123;",
                 NamingRule.CAMEL_CASE_LOWER,
                 [
                     ErrorEntry(
-                        file_name="test.java", line=1, column=11, message="Имена переменных не должны быть в snake_case"
-                    ),
-                    ErrorEntry(
-                        file_name="test.java",
-                        line=1,
-                        column=11,
-                        message="Имена переменных должны начинаться со строчной буквы",
+                        file_name="test.java", line=1, column=11, code=MessageCode.VARIABLE_SNAKE_CASE_FORBIDDEN
                     ),
+                    ErrorEntry(file_name="test.java", line=1, column=11, code=MessageCode.VARIABLE_LOWER_REQUIRED),
                 ],
             ),
             (
                 "private List<String> ListList;",
                 NamingRule.SNAKE_CASE,
-                [
-                    ErrorEntry(
-                        file_name="test.java", line=1, column=22, message="Имена переменных должны быть в snake_case"
-                    )
-                ],
+                [ErrorEntry(file_name="test.java", line=1, column=22, code=MessageCode.VARIABLE_SNAKE_CASE_REQUIRED)],
             ),
             (
                 "int _underscoreVar;",
                 NamingRule.SNAKE_CASE,
-                [
-                    ErrorEntry(
-                        file_name="test.java", line=1, column=5, message="Имена переменных должны быть в snake_case"
-                    )
-                ],
+                [ErrorEntry(file_name="test.java", line=1, column=5, code=MessageCode.VARIABLE_SNAKE_CASE_REQUIRED)],
             ),
             (
                 "int __invalidVar;",
                 NamingRule.SNAKE_CASE,
-                [
-                    ErrorEntry(
-                        file_name="test.java", line=1, column=5, message="Имена переменных должны быть в snake_case"
-                    )
-                ],
+                [ErrorEntry(file_name="test.java", line=1, column=5, code=MessageCode.VARIABLE_SNAKE_CASE_REQUIRED)],
             ),
             (
                 "int invalid_Var;",
                 NamingRule.SNAKE_CASE,
-                [
-                    ErrorEntry(
-                        file_name="test.java", line=1, column=5, message="Имена переменных должны быть в snake_case"
-                    )
-                ],
+                [ErrorEntry(file_name="test.java", line=1, column=5, code=MessageCode.VARIABLE_SNAKE_CASE_REQUIRED)],
             ),
         ],
     )
@@ -267,7 +188,7 @@ class TestNamingLinter:
         self, linter: NamingLinter, line: str, var_dialect: NamingRule, expected_errors: list[ErrorEntry]
     ) -> None:
         linter._var_dialect = var_dialect
-        errors = linter._check_var_names([line], "test.java")
+        errors = list(iter_line_check(linter._check_var_name_in_line, [line], "test.java"))
 
         assert len(errors) == len(expected_errors)
 
@@ -278,16 +199,10 @@ class TestNamingLinter:
         lines = ["class myClass {}", "public void JustMethod() {}", "int JUST_VAR = 5;"]
         errors = linter.seek_for_errors(lines, "test.java")
         expected_errors = [
-            ErrorEntry(
-                file_name="test.java", line=1, column=7, message="Имена классов должны начинаться с заглавной буквы"
-            ),
-            ErrorEntry(
-                file_name="test.java", line=2, column=13, message="Имена методов должны начинаться со строчной буквы"
-            ),
-            ErrorEntry(
-                file_name="test.java", line=3, column=5, message="Имена переменных должны начинаться со строчной буквы"
-            ),
-            ErrorEntry(file_name="test.java", line=3, column=5, message="Имена переменных не должны быть в snake_case"),
+            ErrorEntry(file_name="test.java", line=1, column=7, code=MessageCode.CLASS_CAPITAL_REQUIRED),
+            ErrorEntry(file_name="test.java", line=2, column=13, code=MessageCode.METHOD_LOWER_REQUIRED),
+            ErrorEntry(file_name="test.java", line=3, column=5, code=MessageCode.VARIABLE_LOWER_REQUIRED),
+            ErrorEntry(file_name="test.java", line=3, column=5, code=MessageCode.VARIABLE_SNAKE_CASE_FORBIDDEN),
         ]
         assert len(errors) == len(expected_errors)
         for expected in expected_errors:
@@ -314,5 +229,5 @@ class TestNamingLinter:
             ("a__b", False),
         ],
     )
-    def test_check_is_snake_case(self, linter: NamingLinter, name: str, expected: bool) -> None:
-        assert linter._check_is_snake_case(name) == expected
+    def test_is_snake_case(self, name: str, expected: bool) -> None:
+        assert _is_snake_case(name) == expected
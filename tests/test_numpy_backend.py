@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from java_linter import numpy_backend
+from java_linter.line_classes import ClassifiedLines
+from java_linter.linter import Linter, LinterOptions
+from java_linter.numpy_backend import HAS_NUMPY, NumpyUnavailableError, classify_batch, line_arrays
+
+_FILES = ["BadMainApplicationFrame.java", "BadMyJMenu.java", "GoodMainApplicationFrame.java", "GoodMyJMenu.java"]
+
+_TOKENS = list('ab(){};,.=-+*/ <>\t"\n_1') + ["ф", " ", "import ", "package", "public ", "class", "//", "/*"]
+
+
+def _lines(name: str) -> list[str]:
+    with open(f"test_files/{name}", "r") as f:
+        return f.readlines()
+
+
+def _random_files(count: int) -> list[list[str]]:
+    rnd = random.Random(0)
+
+    return [
+        ["".join(rnd.choice(_TOKENS) for _ in range(rnd.randint(0, 10))) for _ in range(rnd.randint(0, 10))]
+        for _ in range(count)
+    ]
+
+
+def test_linter_requires_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(numpy_backend, "HAS_NUMPY", False)
+
+    with pytest.raises(NumpyUnavailableError):
+        Linter(numpy_backend=True)
+
+
+@pytest.mark.skipif(not HAS_NUMPY, reason="numpy не установлен")
+class TestNumpyBackend:
+
+    def test_same_flags_as_python(self) -> None:
+        files = [_lines(name) for name in _FILES] + _random_files(500) + [["public"], ["publicф x"], ["import"]]
+
+        for lines, classified in zip(files, classify_batch(files)):
+            assert classified == lines
+            assert classified.flags == ClassifiedLines(lines).flags
+
+    def test_depths(self) -> None:
+        first, second = classify_batch([["class A {\n", "  {}\n", "}\n"], ["}\n", "{{\n"]])
+
+        assert first.depths == [1, 1, 0]
+        assert second.depths == [-1, 1]
+
+    def test_line_arrays(self) -> None:
+        arrays = line_arrays(["ab\n", "", "ф{\n"])
+
+        assert arrays.starts.tolist() == [0, 3, 3]
+        assert arrays.ends.tolist() == [3, 3, 6]
+        assert arrays.depth_changes.tolist() == [0, 0, 1]
+
+    @pytest.mark.parametrize("name", _FILES)
+    @pytest.mark.parametrize("options", [LinterOptions(), LinterOptions(fused=True), LinterOptions(tokenized=True)])
+    def test_same_errors(self, name: str, options: LinterOptions) -> None:
+        lines = _lines(name)
+        numpy_linter = Linter.from_options(options=options._replace(numpy_backend=True))
+
+        assert numpy_linter.seek_for_errors(lines, name) == Linter.from_options(options=options).seek_for_errors(
+            lines, name
+        )
+
+    def test_batch(self) -> None:
+        files = [(_lines(name), name) for name in _FILES]
+
+        assert Linter(numpy_backend=True).seek_for_errors_in_batch(files) == [
+            Linter().seek_for_errors(lines, name) for lines, name in files
+        ]
+        assert Linter().seek_for_errors_in_batch(files) == Linter(numpy_backend=True).seek_for_errors_in_batch(files)
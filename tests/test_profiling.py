@@ -0,0 +1,72 @@
+import json
+from pathlib import Path
+
+from java_linter.linter import Linter
+from java_linter.mmap_scanner import map_file
+from java_linter.profiling import Profiler, check_name
+
+
+class TestProfiler:
+
+    def test_check_name(self) -> None:
+        linter = Linter()
+        names = [check_name(check) for check in linter._build_check_plan(ordered=False)]
+
+        assert "NamingLinter._check_class_name_in_line" in names
+        assert "EmptyLineLinter._check_empty_lines_after_blocks" in names
+        assert "SpaceLinter._check_spaces_after_comma_in_line" in names
+
+    def test_profiled_linter_finds_same_errors(self) -> None:
+        with open("test_files/BadMyJMenu.java", "r") as f:
+            lines = f.readlines()
+
+        profiler = Profiler()
+
+        assert Linter(profiler=profiler).seek_for_errors(lines, "A.java") == Linter().seek_for_errors(lines, "A.java")
+        assert list(Linter(profiler=profiler).iter_errors(lines, "A.java", ordered=True)) == list(
+            Linter().iter_errors(lines, "A.java", ordered=True)
+        )
+
+    def test_report(self, tmp_path: Path) -> None:
+        with open("test_files/BadMyJMenu.java", "r") as f:
+            lines = f.readlines()
+
+        profiler = Profiler()
+        linter = Linter(profiler=profiler)
+
+        for number, seconds in enumerate((0.5, 2.0, 1.0)):
+            profiler.start_file()
+            linter.seek_for_errors(lines, f"{number}.java")
+            profile = profiler.finish_file(f"{number}.java", len(lines), 100, seconds)
+
+            assert all(stats.calls == 1 for stats in profile.checks.values())
+
+        report = profiler.report(top=2)
+
+        assert report["files"] == 3
+        assert report["lines"] == 3 * len(lines)
+        assert report["bytes_per_second"] == 300 / 3.5
+        assert [file["filename"] for file in report["slowest_files"]] == ["1.java", "2.java"]
+        assert {item["name"] for item in report["sub_linters"]} == {"NamingLinter", "EmptyLineLinter", "SpaceLinter"}
+        assert all(item["calls"] == 3 for item in report["checks"])
+
+        profiler.write_json(str(tmp_path / "profile.json"), top=2)
+
+        assert json.loads((tmp_path / "profile.json").read_text(encoding="utf-8")) == report
+
+    def test_fused_and_mapped_passes_are_measured_whole(self, tmp_path: Path) -> None:
+        path = tmp_path / "A.java"
+        path.write_text("public class a {\n    int Bad_Name;\n}\n")
+        lines = path.read_text().splitlines(keepends=True)
+
+        profiler = Profiler()
+        profiler.start_file()
+        Linter(fused=True, profiler=profiler).seek_for_errors(lines, "A.java")
+
+        with map_file(str(path)) as buffer:
+            Linter(profiler=profiler).seek_for_errors_in_buffer(buffer, "A.java")
+
+        profile = profiler.finish_file("A.java", len(lines), 100, 1.0)
+
+        assert set(profile.checks) == {"FusedLinter.seek_for_errors", "MmapScanner.seek_for_errors"}
+        assert {item["name"] for item in profiler.report()["sub_linters"]} == {"FusedLinter", "MmapScanner"}
@@ -0,0 +1,101 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from java_linter.error_store import ErrorStore
+from java_linter.linter import Linter
+from java_linter.messages import MessageCode
+from java_linter.reporters import JsonLinesReporter, Reporter, SarifReporter, TextReporter, open_output
+from java_linter.shared import ErrorEntry
+
+
+def _errors() -> list[ErrorEntry]:
+    with open("test_files/BadMyJMenu.java", "r") as f:
+        lines = f.readlines()
+
+    return Linter().seek_for_errors(lines, "BadMyJMenu.java")
+
+
+class TestReporters:
+
+    def test_text(self) -> None:
+        errors = _errors()
+        stream = io.StringIO()
+
+        reporter = TextReporter(stream)
+        reporter.start()
+        reporter.report_file("BadMyJMenu.java", errors)
+        reporter.report_file("Good.java", [])
+        reporter.finish()
+
+        lines = stream.getvalue().splitlines()
+
+        assert lines[0] == "Ошибки в файле: BadMyJMenu.java"
+        assert lines[1] == f"  Строка: {errors[0].line}, Столбец: {errors[0].column}, Проблема: {errors[0].message}"
+        assert lines[len(errors) + 1] == "-" * 20
+        assert lines[-1] == "Проблем не найдено в файле: Good.java"
+
+    def test_json_lines(self) -> None:
+        errors = _errors()
+        stream = io.StringIO()
+
+        reporter = JsonLinesReporter(stream)
+        reporter.start()
+        reporter.report_file("BadMyJMenu.java", ErrorStore.from_entries(errors))
+        reporter.report_file("Good.java", [])
+        reporter.finish()
+
+        assert [json.loads(line) for line in stream.getvalue().splitlines()] == [
+            {"file_name": error.file_name, "line": error.line, "column": error.column, "message": error.message}
+            for error in errors
+        ]
+
+    def test_sarif(self) -> None:
+        errors = _errors()
+        stream = io.StringIO()
+
+        reporter = SarifReporter(stream, "en")
+        reporter.start()
+        reporter.report_file("BadMyJMenu.java", errors[:3])
+        reporter.report_file("Good.java", [])
+        reporter.report_file("BadMyJMenu.java", errors[3:])
+        reporter.finish()
+
+        run = json.loads(stream.getvalue())["runs"][0]
+        rule_ids = {rule["id"] for rule in run["tool"]["driver"]["rules"]}
+        results = run["results"]
+
+        assert len(results) == len(errors)
+        assert rule_ids == {code.name for code in MessageCode}
+        assert all(result["ruleId"] in rule_ids for result in results)
+        assert results[0]["ruleId"] == MessageCode.CLASS_CAPITAL_REQUIRED.name
+        assert results[0]["message"]["text"] == "Class names must start with an uppercase letter"
+        assert results[0]["locations"][0]["physicalLocation"] == {
+            "artifactLocation": {"uri": "BadMyJMenu.java"},
+            "region": {"startLine": errors[0].line, "startColumn": errors[0].column},
+        }
+
+    def test_reporter_is_abstract(self) -> None:
+        with pytest.raises(TypeError):
+            Reporter(io.StringIO())  # type: ignore[abstract]
+
+    def test_sarif_without_results(self) -> None:
+        stream = io.StringIO()
+
+        reporter = SarifReporter(stream)
+        reporter.start()
+        reporter.finish()
+
+        assert json.loads(stream.getvalue())["runs"][0]["results"] == []
+
+    def test_open_output_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "report.jsonl"
+
+        with open_output(str(path)) as output:
+            reporter = JsonLinesReporter(output)
+            reporter.report_file("BadMyJMenu.java", _errors())
+            reporter.finish()
+
+        assert len(path.read_text(encoding="utf-8").splitlines()) == len(_errors())
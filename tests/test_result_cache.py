@@ -0,0 +1,156 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from java_linter.dialects import Dialect, EmptyLineCountDialect, NamingDialect, NamingRule, SpaceDialect
+from java_linter.messages import MessageCode
+from java_linter.result_cache import ResultCache, dialect_hash
+from java_linter.shared import ErrorEntry
+
+
+class TestResultCache:
+
+    @pytest.fixture
+    def dialect(self) -> Dialect:
+        return Dialect(
+            naming=NamingDialect(
+                classes=NamingRule.CAMEL_CASE_CAPITAL,
+                methods=NamingRule.CAMEL_CASE_LOWER,
+                variables=NamingRule.CAMEL_CASE_LOWER,
+            ),
+            spaces=SpaceDialect(
+                around_operators=True,
+                no_around_brackets=True,
+                after_comma=True,
+                no_before_comma=True,
+                no_around_dot=True,
+                no_before_dot_comma=True,
+                may_be_more_that_one_space=False,
+            ),
+            empty_lines=EmptyLineCountDialect(max_empty=3, after_method=1, after_class=2),
+        )
+
+    @pytest.fixture
+    def java_file(self, tmp_path: Path) -> str:
+        path = tmp_path / "A.java"
+        path.write_text("int a,b;\n")
+
+        # Файл старше окна, в котором mtime не считается надежным
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+        return str(path)
+
+    def _errors(self, filename: str) -> list[ErrorEntry]:
+        return [ErrorEntry(file_name=filename, line=1, column=6, code=MessageCode.SPACE_AFTER_COMMA)]
+
+    def test_hit_after_put(self, dialect: Dialect, java_file: str, tmp_path: Path) -> None:
+        cache = ResultCache(dialect, cache_dir=str(tmp_path / "cache"))
+
+        assert cache.get(java_file) is None
+
+        cache.put(java_file, ["int a,b;\n"], self._errors(java_file))
+
+        assert ResultCache(dialect, cache_dir=str(tmp_path / "cache")).get(java_file) == self._errors(java_file)
+
+    def test_slow_line_results_are_not_cached(self, dialect: Dialect, java_file: str, tmp_path: Path) -> None:
+        cache = ResultCache(dialect, {"line_time_limit": 0}, str(tmp_path / "cache"))
+        slow = ErrorEntry(file_name=java_file, line=1, column=1, code=MessageCode.SLOW_LINE, params=(5, 0))
+        cache.put(java_file, ["int a,b;\n"], self._errors(java_file) + [slow])
+
+        assert cache.get(java_file) is None
+
+    def test_changed_content_is_miss(self, dialect: Dialect, java_file: str, tmp_path: Path) -> None:
+        cache = ResultCache(dialect, cache_dir=str(tmp_path / "cache"))
+        cache.put(java_file, ["int a,b;\n"], self._errors(java_file))
+
+        Path(java_file).write_text("int a, b;\n")
+
+        assert cache.get(java_file) is None
+
+    def test_touched_file_is_hit(self, dialect: Dialect, java_file: str, tmp_path: Path) -> None:
+        cache = ResultCache(dialect, cache_dir=str(tmp_path / "cache"))
+        cache.put(java_file, ["int a,b;\n"], self._errors(java_file))
+
+        os.utime(java_file, ns=(5_000_000_000, 5_000_000_000))
+
+        assert cache.get(java_file) == self._errors(java_file)
+
+    def test_other_dialect_is_miss(self, dialect: Dialect, java_file: str, tmp_path: Path) -> None:
+        ResultCache(dialect, cache_dir=str(tmp_path / "cache")).put(java_file, ["int a,b;\n"], [])
+
+        other = dialect._replace(empty_lines=EmptyLineCountDialect(max_empty=1, after_method=1, after_class=2))
+
+        assert ResultCache(other, cache_dir=str(tmp_path / "cache")).get(java_file) is None
+        assert ResultCache(dialect, {"tokenized": True}, str(tmp_path / "cache")).get(java_file) is None
+        assert dialect_hash(dialect) == dialect_hash(dialect._replace())
+
+    def test_dialects_keep_separate_records(self, dialect: Dialect, java_file: str, tmp_path: Path) -> None:
+        text = ResultCache(dialect, cache_dir=str(tmp_path / "cache"))
+        mapped = ResultCache(dialect, {"mmap": True}, str(tmp_path / "cache"))
+        text.put(java_file, ["int a,b;\n"], self._errors(java_file))
+        mapped.put(java_file, ["int a,b;\n"], [])
+
+        assert text.get(java_file) == self._errors(java_file)
+        assert mapped.get(java_file) == []
+        assert len(list((tmp_path / "cache").rglob("*.json"))) == 2
+
+    def test_corrupted_record_is_miss(self, dialect: Dialect, java_file: str, tmp_path: Path) -> None:
+        cache = ResultCache(dialect, cache_dir=str(tmp_path / "cache"))
+        cache.put(java_file, ["int a,b;\n"], [])
+
+        for record in (tmp_path / "cache").rglob("*.json"):
+            record.write_text("{")
+
+        assert cache.get(java_file) is None
+
+    def test_evict_removes_least_recently_used(self, dialect: Dialect, tmp_path: Path) -> None:
+        cache = ResultCache(dialect, cache_dir=str(tmp_path / "cache"))
+        files = []
+
+        for i in range(3):
+            path = tmp_path / f"F{i}.java"
+            path.write_text("int a;\n")
+            os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+            cache.put(str(path), ["int a;\n"], [])
+            files.append(str(path))
+
+            record = cache._entry_path(str(path))
+            os.utime(record, ns=(i * 1_000_000_000, i * 1_000_000_000))
+
+        record_size = os.path.getsize(cache._entry_path(files[0]))
+        ResultCache(dialect, cache_dir=str(tmp_path / "cache"), max_bytes=record_size * 2).evict()
+
+        assert cache.get(files[0]) is None
+        assert len(list((tmp_path / "cache").rglob("*.json"))) == 2
+
+    def test_evict_scans_cache_only_after_growth(
+        self, dialect: Dialect, java_file: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        cache = ResultCache(dialect, cache_dir=str(tmp_path / "cache"))
+        cache.put(java_file, ["int a,b;\n"], [])
+        cache.evict()
+
+        scanned = []
+        scan = cache._scan
+
+        def counting_scan(directory: str) -> list[os.DirEntry[str]]:
+            scanned.append(directory)
+            return scan(directory)
+
+        monkeypatch.setattr(cache, "_scan", counting_scan)
+
+        cache.put(java_file, ["int a,b;\n"], [])
+        cache.evict()
+        ResultCache(dialect, cache_dir=str(tmp_path / "cache")).evict()
+
+        assert scanned == []
+
+        record_size = os.path.getsize(cache._entry_path(java_file))
+        small_cache = ResultCache(dialect, cache_dir=str(tmp_path / "cache"), max_bytes=record_size - 1)
+        monkeypatch.setattr(small_cache, "_scan", counting_scan)
+        small_cache.put(java_file, ["int a,b;\n"], [])
+        small_cache.evict()
+
+        assert scanned
+        assert small_cache.get(java_file) is None
@@ -0,0 +1,42 @@
+import random
+import time
+
+from benchmarks.bench_patterns import ADVERSARIAL_LINES, LEGACY_PATTERNS, find_mismatches, match_key, random_line
+from java_linter.shared import JavaPatterns
+
+
+class TestJavaPatterns:
+
+    def test_same_matches_as_legacy_patterns(self) -> None:
+        rnd = random.Random(0)
+
+        assert find_mismatches([random_line(rnd) for _ in range(20000)]) == []
+
+    def test_var_pattern_groups(self) -> None:
+        line = "    private static Map<String, List<Integer>> map = new HashMap<>();\n"
+        match = JavaPatterns.VAR_PATTERN.search(line)
+
+        assert match is not None
+        assert match.group(1) == "Map<String, List<Integer>>"
+        assert match.group(2) == "map"
+        assert match.start(2) == line.index("map =")
+        assert match_key(match) == match_key(LEGACY_PATTERNS["VAR_PATTERN"].search(line))
+
+    def test_var_pattern_with_arrays_and_newlines(self) -> None:
+        for line in ("int[] values[] = {};\n", "List<int[]> a;\n", "Foo<a>\n<b> c;\n", "int x(\n"):
+            assert match_key(JavaPatterns.VAR_PATTERN.match(line)) == match_key(
+                LEGACY_PATTERNS["VAR_PATTERN"].match(line)
+            )
+
+    def test_adversarial_lines_are_fast(self) -> None:
+        patterns = (JavaPatterns.CLASS_PATTERN, JavaPatterns.METHOD_PATTERN, JavaPatterns.VAR_PATTERN)
+
+        for family, make_line in ADVERSARIAL_LINES.items():
+            line = make_line(20000)
+            start = time.perf_counter()
+
+            for pattern in patterns:
+                pattern.search(line)
+
+            # Прежним выражениям на таких строках не хватило бы и часа
+            assert time.perf_counter() - start < 1, family
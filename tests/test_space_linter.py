@@ -1,6 +1,7 @@
 import pytest
 
 from java_linter.dialects import Dialect, EmptyLineCountDialect, NamingDialect, NamingRule, SpaceDialect
+from java_linter.messages import MessageCode
 from java_linter.shared import ErrorEntry
 from java_linter.space_linter import SpaceLinter
 
@@ -37,24 +38,24 @@ class TestSpaceLinter:
             (
                 "int a,b,c",
                 [
-                    ErrorEntry(file_name="test.java", line=1, column=6, message="После запятой должен быть пробел"),
-                    ErrorEntry(file_name="test.java", line=1, column=8, message="После запятой должен быть пробел"),
+                    ErrorEntry(file_name="test.java", line=1, column=6, code=MessageCode.SPACE_AFTER_COMMA),
+                    ErrorEntry(file_name="test.java", line=1, column=8, code=MessageCode.SPACE_AFTER_COMMA),
                 ],
             ),
             (
                 "String s1,s2",
-                [ErrorEntry(file_name="test.java", line=1, column=10, message="После запятой должен быть пробел")],
+                [ErrorEntry(file_name="test.java", line=1, column=10, code=MessageCode.SPACE_AFTER_COMMA)],
             ),
             (
                 "Map<String,Integer> map",
-                [ErrorEntry(file_name="test.java", line=1, column=11, message="После запятой должен быть пробел")],
+                [ErrorEntry(file_name="test.java", line=1, column=11, code=MessageCode.SPACE_AFTER_COMMA)],
             ),
             ("int x, y, z", []),  # Корректный код - без ошибок
             (
                 "call(a,b,c)",
                 [
-                    ErrorEntry(file_name="test.java", line=1, column=7, message="После запятой должен быть пробел"),
-                    ErrorEntry(file_name="test.java", line=1, column=9, message="После запятой должен быть пробел"),
+                    ErrorEntry(file_name="test.java", line=1, column=7, code=MessageCode.SPACE_AFTER_COMMA),
+                    ErrorEntry(file_name="test.java", line=1, column=9, code=MessageCode.SPACE_AFTER_COMMA),
                 ],
             ),
         ],
@@ -70,24 +71,17 @@ class TestSpaceLinter:
     @pytest.mark.parametrize(
         "line,expected_errors",
         [
-            (
-                "int a ,b",
-                [ErrorEntry(file_name="test.java", line=1, column=6, message="Не должно быть пробелов перед запятой")],
-            ),
+            ("int a ,b", [ErrorEntry(file_name="test.java", line=1, column=6, code=MessageCode.SPACE_BEFORE_COMMA)]),
             (
                 "String s , t",
-                [ErrorEntry(file_name="test.java", line=1, column=9, message="Не должно быть пробелов перед запятой")],
+                [ErrorEntry(file_name="test.java", line=1, column=9, code=MessageCode.SPACE_BEFORE_COMMA)],
             ),
             ("int x,y", []),
             (
                 "List< String , Integer , Type>",
                 [
-                    ErrorEntry(
-                        file_name="test.java", line=1, column=13, message="Не должно быть пробелов перед запятой"
-                    ),
-                    ErrorEntry(
-                        file_name="test.java", line=1, column=23, message="Не должно быть пробелов перед запятой"
-                    ),
+                    ErrorEntry(file_name="test.java", line=1, column=13, code=MessageCode.SPACE_BEFORE_COMMA),
+                    ErrorEntry(file_name="test.java", line=1, column=23, code=MessageCode.SPACE_BEFORE_COMMA),
                 ],
             ),
         ],
@@ -105,25 +99,19 @@ class TestSpaceLinter:
     @pytest.mark.parametrize(
         "line,expected_errors",
         [
-            (
-                "obj .method()",
-                [ErrorEntry(file_name="test.java", line=1, column=4, message="Не должно быть пробелов перед точкой")],
-            ),
-            (
-                "obj. method()",
-                [ErrorEntry(file_name="test.java", line=1, column=4, message="После точки не должен быть пробел")],
-            ),
+            ("obj .method()", [ErrorEntry(file_name="test.java", line=1, column=4, code=MessageCode.SPACE_BEFORE_DOT)]),
+            ("obj. method()", [ErrorEntry(file_name="test.java", line=1, column=4, code=MessageCode.SPACE_AFTER_DOT)]),
             (
                 "obj . method()",
                 [
-                    ErrorEntry(file_name="test.java", line=1, column=4, message="Не должно быть пробелов перед точкой"),
-                    ErrorEntry(file_name="test.java", line=1, column=5, message="После точки не должен быть пробел"),
+                    ErrorEntry(file_name="test.java", line=1, column=4, code=MessageCode.SPACE_BEFORE_DOT),
+                    ErrorEntry(file_name="test.java", line=1, column=5, code=MessageCode.SPACE_AFTER_DOT),
                 ],
             ),
             ("obj.method()", []),
             (
                 "some.obj .field",
-                [ErrorEntry(file_name="test.java", line=1, column=9, message="Не должно быть пробелов перед точкой")],
+                [ErrorEntry(file_name="test.java", line=1, column=9, code=MessageCode.SPACE_BEFORE_DOT)],
             ),
         ],
     )
@@ -140,27 +128,10 @@ class TestSpaceLinter:
     @pytest.mark.parametrize(
         "line,expected_errors",
         [
-            (
-                "int x ;",
-                [
-                    ErrorEntry(
-                        file_name="test.java",
-                        line=1,
-                        column=6,
-                        message="Не должно быть пробелов перед точкой с запятой",
-                    )
-                ],
-            ),
+            ("int x ;", [ErrorEntry(file_name="test.java", line=1, column=6, code=MessageCode.SPACE_BEFORE_DOT_COMMA)]),
             (
                 "lol (;; ) ;",
-                [
-                    ErrorEntry(
-                        file_name="test.java",
-                        line=1,
-                        column=10,
-                        message="Не должно быть пробелов перед точкой с запятой",
-                    )
-                ],
+                [ErrorEntry(file_name="test.java", line=1, column=10, code=MessageCode.SPACE_BEFORE_DOT_COMMA)],
             ),
             ("int x;", []),
         ],
@@ -180,86 +151,35 @@ class TestSpaceLinter:
         [
             (
                 "method (arg)",
-                [
-                    ErrorEntry(
-                        file_name="test.java",
-                        line=1,
-                        column=7,
-                        message="Перед открывающейся скобкой не должно быть пробела",
-                    )
-                ],
+                [ErrorEntry(file_name="test.java", line=1, column=7, code=MessageCode.SPACE_BEFORE_OPEN_BRACKET)],
             ),
             (
                 "method( arg )",
                 [
-                    ErrorEntry(
-                        file_name="test.java",
-                        line=1,
-                        column=8,
-                        message="После открывающейся скобкой не должно быть пробела",
-                    ),
-                    ErrorEntry(
-                        file_name="test.java",
-                        line=1,
-                        column=12,
-                        message="Перед закрывающейся скобкой не должно быть пробела",
-                    ),
+                    ErrorEntry(file_name="test.java", line=1, column=8, code=MessageCode.SPACE_AFTER_OPEN_BRACKET),
+                    ErrorEntry(file_name="test.java", line=1, column=12, code=MessageCode.SPACE_BEFORE_CLOSE_BRACKET),
                 ],
             ),
             (
                 "if ( condition ) {",
                 [
-                    ErrorEntry(
-                        file_name="test.java",
-                        line=1,
-                        column=5,
-                        message="После открывающейся скобкой не должно быть пробела",
-                    ),
-                    ErrorEntry(
-                        file_name="test.java",
-                        line=1,
-                        column=15,
-                        message="Перед закрывающейся скобкой не должно быть пробела",
-                    ),
+                    ErrorEntry(file_name="test.java", line=1, column=5, code=MessageCode.SPACE_AFTER_OPEN_BRACKET),
+                    ErrorEntry(file_name="test.java", line=1, column=15, code=MessageCode.SPACE_BEFORE_CLOSE_BRACKET),
                 ],
             ),
             (
                 "(qwe )",
-                [
-                    ErrorEntry(
-                        file_name="test.java",
-                        line=1,
-                        column=5,
-                        message="Перед закрывающейся скобкой не должно быть пробела",
-                    )
-                ],
+                [ErrorEntry(file_name="test.java", line=1, column=5, code=MessageCode.SPACE_BEFORE_CLOSE_BRACKET)],
             ),
             (
                 "( asd)",
-                [
-                    ErrorEntry(
-                        file_name="test.java",
-                        line=1,
-                        column=2,
-                        message="После открывающейся скобкой не должно быть пробела",
-                    )
-                ],
+                [ErrorEntry(file_name="test.java", line=1, column=2, code=MessageCode.SPACE_AFTER_OPEN_BRACKET)],
             ),
             (
                 "( zxc )",
                 [
-                    ErrorEntry(
-                        file_name="test.java",
-                        line=1,
-                        column=2,
-                        message="После открывающейся скобкой не должно быть пробела",
-                    ),
-                    ErrorEntry(
-                        file_name="test.java",
-                        line=1,
-                        column=6,
-                        message="Перед закрывающейся скобкой не должно быть пробела",
-                    ),
+                    ErrorEntry(file_name="test.java", line=1, column=2, code=MessageCode.SPACE_AFTER_OPEN_BRACKET),
+                    ErrorEntry(file_name="test.java", line=1, column=6, code=MessageCode.SPACE_BEFORE_CLOSE_BRACKET),
                 ],
             ),
             ("for (i = 0; i < 10; i++)", []),
@@ -279,38 +199,10 @@ class TestSpaceLinter:
     @pytest.mark.parametrize(
         "line,expected_errors",
         [
-            (
-                "x=5",
-                [
-                    ErrorEntry(
-                        file_name="test.java", line=1, column=2, message="Операторы должны быть окружены пробелами"
-                    )
-                ],
-            ),
-            (
-                "y ==2",
-                [
-                    ErrorEntry(
-                        file_name="test.java", line=1, column=3, message="Операторы должны быть окружены пробелами"
-                    )
-                ],
-            ),
-            (
-                "z* 3",
-                [
-                    ErrorEntry(
-                        file_name="test.java", line=1, column=2, message="Операторы должны быть окружены пробелами"
-                    )
-                ],
-            ),
-            (
-                "a +b",
-                [
-                    ErrorEntry(
-                        file_name="test.java", line=1, column=3, message="Операторы должны быть окружены пробелами"
-                    )
-                ],
-            ),
+            ("x=5", [ErrorEntry(file_name="test.java", line=1, column=2, code=MessageCode.SPACE_AROUND_OPERATOR)]),
+            ("y ==2", [ErrorEntry(file_name="test.java", line=1, column=3, code=MessageCode.SPACE_AROUND_OPERATOR)]),
+            ("z* 3", [ErrorEntry(file_name="test.java", line=1, column=2, code=MessageCode.SPACE_AROUND_OPERATOR)]),
+            ("a +b", [ErrorEntry(file_name="test.java", line=1, column=3, code=MessageCode.SPACE_AROUND_OPERATOR)]),
             ("x + y", []),
             ("python = cool", []),
         ],
@@ -328,60 +220,21 @@ class TestSpaceLinter:
     @pytest.mark.parametrize(
         "line,expected_errors",
         [
-            (
-                "int  x = 5",
-                [
-                    ErrorEntry(
-                        file_name="test.java",
-                        line=1,
-                        column=3,
-                        message="Не должно быть более одного пробела подряд внутри строки",
-                    )
-                ],
-            ),
+            ("int  x = 5", [ErrorEntry(file_name="test.java", line=1, column=3, code=MessageCode.MORE_THAN_ONE_SPACE)]),
             (
                 'String  s = "test"',
-                [
-                    ErrorEntry(
-                        file_name="test.java",
-                        line=1,
-                        column=6,
-                        message="Не должно быть более одного пробела подряд внутри строки",
-                    )
-                ],
+                [ErrorEntry(file_name="test.java", line=1, column=6, code=MessageCode.MORE_THAN_ONE_SPACE)],
             ),
             (
                 "public   class Main",
-                [
-                    ErrorEntry(
-                        file_name="test.java",
-                        line=1,
-                        column=6,
-                        message="Не должно быть более одного пробела подряд внутри строки",
-                    )
-                ],
+                [ErrorEntry(file_name="test.java", line=1, column=6, code=MessageCode.MORE_THAN_ONE_SPACE)],
             ),
             (
                 "  for (int  i = 0; i <  3; i  ++)",
                 [
-                    ErrorEntry(
-                        file_name="test.java",
-                        line=1,
-                        column=10,
-                        message="Не должно быть более одного пробела подряд внутри строки",
-                    ),
-                    ErrorEntry(
-                        file_name="test.java",
-                        line=1,
-                        column=22,
-                        message="Не должно быть более одного пробела подряд внутри строки",
-                    ),
-                    ErrorEntry(
-                        file_name="test.java",
-                        line=1,
-                        column=28,
-                        message="Не должно быть более одного пробела подряд внутри строки",
-                    ),
+                    ErrorEntry(file_name="test.java", line=1, column=10, code=MessageCode.MORE_THAN_ONE_SPACE),
+                    ErrorEntry(file_name="test.java", line=1, column=22, code=MessageCode.MORE_THAN_ONE_SPACE),
+                    ErrorEntry(file_name="test.java", line=1, column=28, code=MessageCode.MORE_THAN_ONE_SPACE),
                 ],
             ),
             ("int j = i                     // all good", []),
@@ -402,18 +255,13 @@ class TestSpaceLinter:
         errors = linter.seek_for_errors(lines, "test.java")
 
         expected_errors = [
-            ErrorEntry(file_name="test.java", line=1, column=6, message="После запятой должен быть пробел"),
-            ErrorEntry(file_name="test.java", line=2, column=6, message="Не должно быть пробелов перед запятой"),
-            ErrorEntry(file_name="test.java", line=2, column=7, message="После запятой должен быть пробел"),
-            ErrorEntry(file_name="test.java", line=3, column=4, message="Не должно быть пробелов перед точкой"),
-            ErrorEntry(file_name="test.java", line=3, column=5, message="После точки не должен быть пробел"),
-            ErrorEntry(file_name="test.java", line=4, column=2, message="Операторы должны быть окружены пробелами"),
-            ErrorEntry(
-                file_name="test.java",
-                line=5,
-                column=3,
-                message="Не должно быть более одного пробела подряд внутри строки",
-            ),
+            ErrorEntry(file_name="test.java", line=1, column=6, code=MessageCode.SPACE_AFTER_COMMA),
+            ErrorEntry(file_name="test.java", line=2, column=6, code=MessageCode.SPACE_BEFORE_COMMA),
+            ErrorEntry(file_name="test.java", line=2, column=7, code=MessageCode.SPACE_AFTER_COMMA),
+            ErrorEntry(file_name="test.java", line=3, column=4, code=MessageCode.SPACE_BEFORE_DOT),
+            ErrorEntry(file_name="test.java", line=3, column=5, code=MessageCode.SPACE_AFTER_DOT),
+            ErrorEntry(file_name="test.java", line=4, column=2, code=MessageCode.SPACE_AROUND_OPERATOR),
+            ErrorEntry(file_name="test.java", line=5, column=3, code=MessageCode.MORE_THAN_ONE_SPACE),
         ]
 
         assert len(errors) == len(expected_errors)
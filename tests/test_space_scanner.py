@@ -0,0 +1,101 @@
+import pytest
+
+from java_linter.dialects import Dialect, EmptyLineCountDialect, NamingDialect, NamingRule, SpaceDialect
+from java_linter.messages import MessageCode
+from java_linter.shared import ErrorEntry
+from java_linter.space_linter import SpaceLinter
+from java_linter.space_scanner import CombinedSpaceScanner
+
+
+class TestCombinedSpaceScanner:
+
+    @pytest.fixture
+    def dialect(self) -> Dialect:
+        return Dialect(
+            naming=NamingDialect(
+                classes=NamingRule.CAMEL_CASE_CAPITAL,
+                methods=NamingRule.CAMEL_CASE_LOWER,
+                variables=NamingRule.CAMEL_CASE_LOWER,
+            ),
+            spaces=SpaceDialect(
+                around_operators=True,
+                no_around_brackets=True,
+                after_comma=True,
+                no_before_comma=True,
+                no_around_dot=True,
+                no_before_dot_comma=True,
+                may_be_more_that_one_space=False,
+            ),
+            empty_lines=EmptyLineCountDialect(max_empty=2, after_method=2, after_class=3),
+        )
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "int a,b,c",
+            "int a ,b , c",
+            ",,,x",
+            "foo (a, b)",
+            "if (x) {",
+            "call( x )",
+            "a  )b",
+            "x = y  ,z",
+            "obj . method ( ) ;",
+            "a{{",
+            "a ) )",
+            "x=5+y",
+            "int  z = 10;",
+            "int j = i                     // all good",
+            "return a->b;",
+            "    value == other",
+            "",
+        ],
+    )
+    def test_same_errors_as_space_linter(self, dialect: Dialect, line: str) -> None:
+        expected = SpaceLinter(dialect).seek_for_errors([line], "test.java")
+        errors = CombinedSpaceScanner(dialect.spaces).seek_for_errors([line], "test.java")
+
+        assert errors == expected
+
+    @pytest.mark.parametrize(
+        "file_name",
+        [
+            "test_files/BadMyJMenu.java",
+            "test_files/GoodMyJMenu.java",
+            "test_files/BadMainApplicationFrame.java",
+            "test_files/GoodMainApplicationFrame.java",
+        ],
+    )
+    def test_same_errors_on_files(self, dialect: Dialect, file_name: str) -> None:
+
+        with open(file_name, "r") as f:
+            lines = f.readlines()
+
+        expected = SpaceLinter(dialect).seek_for_errors(lines, file_name)
+        errors = SpaceLinter(dialect, combined=True).seek_for_errors(lines, file_name)
+
+        assert errors == expected
+
+    def test_only_enabled_rules(self, dialect: Dialect) -> None:
+        spaces = dialect.spaces._replace(after_comma=False, no_around_brackets=False, around_operators=False)
+        lines = ["int a,b ,c;", "foo (x)", "x=5"]
+
+        errors = CombinedSpaceScanner(spaces).seek_for_errors(lines, "test.java")
+
+        assert errors == [ErrorEntry(file_name="test.java", line=1, column=8, code=MessageCode.SPACE_BEFORE_COMMA)]
+
+    def test_disabled_checks(self) -> None:
+        spaces = SpaceDialect(
+            around_operators=False,
+            no_around_brackets=False,
+            after_comma=False,
+            no_before_comma=False,
+            no_around_dot=False,
+            no_before_dot_comma=False,
+            may_be_more_that_one_space=True,
+        )
+        lines = ["int a,b", "x ,y", "object . method (     )", "x=5"]
+
+        errors = CombinedSpaceScanner(spaces).seek_for_errors(lines, "test.java")
+
+        assert len(errors) == 0
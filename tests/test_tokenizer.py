@@ -0,0 +1,82 @@
+import pytest
+
+from java_linter.linter import Linter
+from java_linter.messages import MessageCode
+from java_linter.shared import ErrorEntry
+from java_linter.tokenizer import Token, TokenKind, mask_code_lines, tokenize
+
+
+class TestTokenizer:
+
+    def test_tokens(self) -> None:
+        tokens = tokenize(["class A { // a,b\n", '  String s = "x, y";\n']).tokens
+
+        assert tokens == [
+            Token(kind=TokenKind.KEYWORD, text="class", line=1, column=1),
+            Token(kind=TokenKind.IDENTIFIER, text="A", line=1, column=7),
+            Token(kind=TokenKind.PUNCTUATION, text="{", line=1, column=9),
+            Token(kind=TokenKind.COMMENT, text="// a,b", line=1, column=11),
+            Token(kind=TokenKind.IDENTIFIER, text="String", line=2, column=3),
+            Token(kind=TokenKind.IDENTIFIER, text="s", line=2, column=10),
+            Token(kind=TokenKind.OPERATOR, text="=", line=2, column=12),
+            Token(kind=TokenKind.STRING, text='"x, y"', line=2, column=14),
+            Token(kind=TokenKind.PUNCTUATION, text=";", line=2, column=20),
+        ]
+
+    @pytest.mark.parametrize(
+        "line,texts",
+        [
+            ("x = 1.5e-3 + 0x1F;", ["x", "=", "1.5e-3", "+", "0x1F", ";"]),
+            ("a >>>= b->c;", ["a", ">>>=", "b", "->", "c", ";"]),
+            ("char c = '\\'';", ["char", "c", "=", "'\\''", ";"]),
+            ("foo(a...b)::bar", ["foo", "(", "a", "...", "b", ")", "::", "bar"]),
+        ],
+    )
+    def test_token_texts(self, line: str, texts: list[str]) -> None:
+        assert [token.text for token in tokenize([line]).tokens] == texts
+
+    def test_multiline_comment_position(self) -> None:
+        tokens = tokenize(["int a;\n", "  /* one,\n", "   two */ int b;\n"]).tokens
+
+        comment = [token for token in tokens if token.kind == TokenKind.COMMENT]
+        assert comment == [Token(kind=TokenKind.COMMENT, text="/* one,\n   two */", line=2, column=3)]
+        assert tokens[-3] == Token(kind=TokenKind.KEYWORD, text="int", line=3, column=11)
+
+    def test_code_lines_keep_columns(self) -> None:
+        lines = ["class A { // a,b\n", "  String s = \"x, y\"; char c = ',';\n", "  /* multi\n", "   * line */ x;", ""]
+
+        code_lines = tokenize(lines).code_lines
+
+        assert code_lines == [
+            "class A { /#####\n",
+            "  String s = \"####\"; char c = '#';\n",
+            "  /#######\n",
+            "############ x;",
+            "",
+        ]
+
+    @pytest.mark.parametrize(
+        "lines",
+        [
+            ["class A { // a,b\n", "  String s = \"x, y\"; char c = ',';\n", "  /* multi\n", "   * line */ x;", ""],
+            ["a /= b; //=\n", "x = '\\'' + \"\\\"\" /*/ */ / 2;\n"],
+            ['String t = """\n', '  text "quoted" // not a comment\n', '  """; int a;\n'],
+            ["/* never closed\n", "int a,b;\n"],
+        ],
+    )
+    def test_mask_code_lines_matches_tokenize(self, lines: list[str]) -> None:
+        assert mask_code_lines(lines) == tokenize(lines).code_lines
+
+    @pytest.mark.parametrize("path", ["test_files/BadMainApplicationFrame.java", "test_files/GoodMyJMenu.java"])
+    def test_mask_code_lines_matches_tokenize_on_files(self, path: str) -> None:
+        with open(path, "r") as f:
+            lines = f.readlines()
+
+        assert mask_code_lines(lines) == tokenize(lines).code_lines
+
+    def test_linter_ignores_literals_and_comments(self) -> None:
+        lines = ['String text = "a,b";', "int x=1; //a,b", "/* class bad_name { */"]
+
+        errors = Linter(tokenized=True).seek_for_errors(lines, "test.java")
+
+        assert errors == [ErrorEntry(file_name="test.java", line=2, column=6, code=MessageCode.SPACE_AROUND_OPERATOR)]
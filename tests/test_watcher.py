@@ -0,0 +1,108 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from java_linter.messages import MessageCode
+from java_linter.shared import ErrorEntry
+from java_linter.watcher import InotifyWatcher, PollingWatcher, Watcher, diff_errors, iter_batches
+
+
+class _ScriptedWatcher(PollingWatcher):
+    """Отдает заранее заданные пачки изменений; пустое множество - пауза, за которую ничего не изменилось"""
+
+    def __init__(self, polls: list[set[str]]):
+        self._polls = polls
+        self.timeouts: list[float | None] = []
+
+    def poll(self, timeout: float | None) -> set[str]:
+        self.timeouts.append(timeout)
+        return self._polls.pop(0)
+
+
+def _error(line: int, code: MessageCode = MessageCode.SPACE_AFTER_COMMA) -> ErrorEntry:
+    return ErrorEntry(file_name="A.java", line=line, column=1, code=code)
+
+
+class TestWatcher:
+
+    @pytest.fixture
+    def tree(self, tmp_path: Path) -> Path:
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "A.java").write_text("int a;\n")
+        (tmp_path / "build").mkdir()
+        (tmp_path / "build" / "Gen.java").write_text("int a;\n")
+        return tmp_path
+
+    def _check_changes(self, watcher: Watcher, tree: Path) -> None:
+        a = str(tree / "src" / "A.java")
+        assert watcher.files == [a]
+
+        (tree / "src" / "A.java").write_text("int a, b;\n")
+        assert watcher.poll(5) == {a}
+
+        (tree / "build" / "Gen.java").write_text("int b;\n")
+        (tree / "src" / "notes.txt").write_text("")
+        assert watcher.poll(0.2) == set()
+
+        (tree / "src" / "sub").mkdir()
+        (tree / "src" / "sub" / "B.java").write_text("int b;\n")
+        b = str(tree / "src" / "sub" / "B.java")
+        changed = watcher.poll(5)
+        changed |= watcher.poll(0.2)
+        assert changed == {b}
+
+        os.remove(a)
+        assert watcher.poll(5) == {a}
+        assert watcher.files == [b]
+
+    def test_polling_watcher(self, tree: Path) -> None:
+        watcher = PollingWatcher([str(tree)], interval=0.02)
+        self._check_changes(watcher, tree)
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify есть только в Linux")
+    def test_inotify_watcher(self, tree: Path) -> None:
+        watcher = InotifyWatcher([str(tree)])
+
+        try:
+            self._check_changes(watcher, tree)
+        finally:
+            watcher.close()
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify есть только в Linux")
+    def test_inotify_watcher_explicit_file(self, tree: Path) -> None:
+        path = str(tree / "src" / "A.java")
+        watcher = InotifyWatcher([path])
+
+        try:
+            (tree / "src" / "A.java").write_text("int a, b;\n")
+            assert watcher.poll(5) == {path}
+        finally:
+            watcher.close()
+
+    def test_iter_batches_debounces(self) -> None:
+        watcher = _ScriptedWatcher([{"A.java"}, {"A.java", "B.java"}, set(), {"C.java"}, set()])
+        batches = iter_batches(watcher, debounce=0.1)
+
+        assert next(batches) == {"A.java", "B.java"}
+        assert next(batches) == {"C.java"}
+        assert watcher.timeouts == [None, 0.1, 0.1, None, 0.1]
+
+    def test_diff_errors(self) -> None:
+        old = [_error(1), _error(2), _error(2)]
+        new = [_error(2), _error(3)]
+
+        assert diff_errors(old, new) == ([_error(3)], [_error(1), _error(2)])
+
+    def test_diff_errors_follows_shifted_lines(self) -> None:
+        old_lines = ["int a,b;\n", "int c,d;\n"]
+        new_lines = ["// новая строка\n", "int a,b;\n", "int c, d;\n"]
+
+        assert diff_errors([_error(1), _error(2)], [_error(2)], old_lines, new_lines) == ([], [_error(2)])
+
+    def test_diff_errors_tells_identical_lines_apart(self) -> None:
+        lines = ["\n", "int a;\n", "\n", "\n"]
+
+        assert diff_errors([_error(1)], [_error(3)], lines, lines) == ([_error(3)], [_error(1)])
+        assert diff_errors([_error(3)], [_error(4)], lines, ["int b;\n"] + lines) == ([], [])